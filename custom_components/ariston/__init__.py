@@ -1,12 +1,19 @@
 """Support for Ariston."""
 import logging
 import re
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 from typing import Optional
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util import slugify, dt as dt_util
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.storage import Store
+import homeassistant.helpers.config_validation as cv
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     CONF_NAME,
@@ -23,15 +30,30 @@ try:
 except Exception:
     _RECORDER_STATS_AVAILABLE = False
 
-from .ariston import AristonHandler
+from .api_client import AsyncAristonApiClient
+from .ariston import AsyncAristonHandler
 from .const import param_zoned
+from .coordinator import AristonCoordinator
+from .stats import (
+    AristonSlotImporter,
+    AristonStatisticsBackfill,
+    BACKFILL_STORAGE_KEY,
+    BACKFILL_STORAGE_VERSION,
+    IMPORTER_STORAGE_KEY,
+    IMPORTER_STORAGE_VERSION,
+    async_repair_statistics,
+    slot_hour_states,
+)
 
 from .binary_sensor import binary_sensors_default
 from .const import (
     DOMAIN,
     DATA_ARISTON,
     DEVICES,
+    ACCOUNTS,
     SERVICE_SET_DATA,
+    SERVICE_BACKFILL_STATISTICS,
+    SERVICE_REPAIR_STATISTICS,
     CONF_LOG,
     CONF_GW,
     CONF_PERIOD_SET,
@@ -74,8 +96,27 @@ DEFAULT_MAX_RETRIES = 5
 DEFAULT_PERIOD_GET = 30
 DEFAULT_PERIOD_SET = 30
 
+# Login state (session cookies, plant ID and features) reused by restarts
+SESSION_STORAGE_VERSION = 1
+SESSION_STORAGE_KEY = "ariston.session.{}"
+
 _LOGGER = logging.getLogger(__name__)
 
+BACKFILL_STATISTICS_SCHEMA = vol.Schema({
+    vol.Optional(CONF_NAME): cv.string,
+    vol.Optional("restart", default=False): cv.boolean,
+})
+
+# Statistics written by the recorder are identified by entity ID, external statistics by 'domain:name'
+EXTERNAL_STATISTIC_ID = r"^(?!.+__)(?!_)[\da-z_]+(?<!_):(?!_)[\da-z_]+(?<!_)$"
+
+# Slots are identified by local start time
+REPAIR_STATISTICS_SCHEMA = vol.Schema({
+    vol.Required("statistic_id"): vol.Any(cv.entity_id, vol.All(cv.string, vol.Match(EXTERNAL_STATISTIC_ID))),
+    vol.Required("slots"): {cv.datetime: vol.All(vol.Coerce(float), vol.Range(min=0))},
+    vol.Optional("split", default=True): cv.boolean,
+})
+
 _HP_STATS_PARAMS = (
     PARAM_HP_CH_PRODUCED_TODAY,
     PARAM_HP_DHW_PRODUCED_TODAY,
@@ -155,7 +196,21 @@ def _slot_start_from_index_or_label(slot_index: int, slot_label: str, now: Optio
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up Ariston from a config entry."""
     hass.data.setdefault(DATA_ARISTON, {DEVICES: {}})
-    
+    username = entry.data[CONF_USERNAME]
+    api_client = _acquire_account_client(hass, username)
+    try:
+        return await _async_setup_entry(hass, entry, api_client)
+    except BaseException:
+        # Failed setup does not keep the device nor its reference to the account client
+        device = hass.data[DATA_ARISTON][DEVICES].pop(entry.data.get(CONF_NAME, DEFAULT_NAME), None)
+        if device is not None:
+            await device.api.ariston_api.async_stop()
+        await _async_release_account_client(hass, username)
+        raise
+
+
+async def _async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, api_client: AsyncAristonApiClient):
+    """Set up Ariston from a config entry with API client of the account."""
     name = entry.data.get(CONF_NAME, DEFAULT_NAME)
     username = entry.data[CONF_USERNAME]
     password = entry.data[CONF_PASSWORD]
@@ -177,6 +232,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     
     _LOGGER.info("Setting up Ariston entry: name=%s, gw=%s", name, gw)
 
+    session_store = Store(hass, SESSION_STORAGE_VERSION, SESSION_STORAGE_KEY.format(entry.entry_id))
+    login_state = await session_store.async_load()
+
+    def save_login_state(state):
+        """Save login state reported by API (possibly called outside of event loop)."""
+        hass.loop.call_soon_threadsafe(session_store.async_delay_save, lambda: state, 1)
+
     api = AristonChecker(
         hass=hass,
         device=entry.data,
@@ -193,90 +255,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         period_get=period_get,
         retries=max_retries,
         num_ch_zones=num_ch_zones,
+        login_state=login_state,
+        login_state_saver=save_login_state,
+        api_client=api_client,
     )
     
     # Start api execution
     api.ariston_api.start()
     _LOGGER.info("Ariston API started for %s", name)
 
+    # Store device, it is stopped if the rest of setup fails
+    hass.data[DATA_ARISTON][DEVICES][name] = AristonDevice(api, entry.data)
+    _LOGGER.info("Stored Ariston device: %s", name)
+
     if _RECORDER_STATS_AVAILABLE:
         hp_slot_mode = options.get(CONF_HP_SLOT_MODE, HP_SLOT_MODE_SPLIT)
         _LOGGER.info("HP slot mode: %s", hp_slot_mode)
-        imported_slots_by_stat_id = {}
-        running_sum_by_stat_id = {}
+        importer = AristonSlotImporter(
+            hass,
+            Store(hass, IMPORTER_STORAGE_VERSION, IMPORTER_STORAGE_KEY.format(entry.entry_id)),
+            split=hp_slot_mode == HP_SLOT_MODE_SPLIT,
+        )
+        await importer.async_load()
         seeded_mean_stat_ids = set()
 
         def _statistic_id_from_param(sensor_param: str) -> str:
             sensor_name = sensors_default[sensor_param][0]
             return f"sensor.{slugify(f'{name} {sensor_name}')}"
 
-        async def _init_stat_state(statistic_id: str) -> float:
-            """Seed running sum and already-imported starts from the recorder DB.
-
-            Queried directly from the recorder DB so the state survives HA restarts.
-            Returns the cumulative baseline from before today's midnight so today's
-            elapsed slots can be rebuilt deterministically after restart.
-
-            We intentionally do NOT pre-mark today's DB rows as imported because
-            recorder may have written provisional hourly rows for an open 2-hour
-            slot (for example 10:00 before 10-12 is closed). If we pre-mark those
-            starts, the importer cannot overwrite them when the real slot value
-            arrives, leaving stale state/sum rows.
-
-            Falls back to 0.0 when no prior data exists (first-ever run).
-
-            Why 50 entries: SPLIT mode writes up to 24 hourly records per day.
-            Querying only 24 would return only today's records after a busy day,
-            leaving prev_entries empty and resetting the baseline to 0.0 — which
-            then overwrites the DB with wrong (lower) cumulative sums and corrupts
-            the statistics table.
-            """
-            today_midnight_utc = dt_util.as_utc(
-                dt_util.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            )
-            today_midnight_ts = today_midnight_utc.timestamp()
-            try:
-                last_stats = await _get_recorder_instance(hass).async_add_executor_job(
-                    get_last_statistics, hass, 50, statistic_id, False, {"sum", "start"}
-                )
-            except Exception as ex:  # noqa: BLE001
-                _LOGGER.warning("Could not query DB state for %s: %s", statistic_id, ex)
-                return 0.0
-
-            entries = last_stats.get(statistic_id, [])
-            if not entries:
-                return 0.0
-
-            # 'start' may be a datetime or a float epoch depending on HA version.
-            def _entry_ts(entry):
-                s = entry.get("start")
-                if s is None:
-                    return float("inf")
-                return s.timestamp() if hasattr(s, "timestamp") else float(s)
-
-            # Seed baseline from the latest entry BEFORE local midnight so today's
-            # rows are always recomputed from a stable pre-day anchor.
-            valid_entries = [e for e in entries if _entry_ts(e) != float("inf") and e.get("sum") is not None]
-            if not valid_entries:
-                return 0.0
-
-            previous_day_entries = [e for e in valid_entries if _entry_ts(e) < today_midnight_ts]
-            baseline_sum = 0.0
-            if previous_day_entries:
-                previous_day_entries.sort(key=_entry_ts, reverse=True)
-                baseline_sum = float(previous_day_entries[0].get("sum") or 0.0)
-
-            latest_sum = float(max(valid_entries, key=_entry_ts).get("sum") or 0.0)
-            today_rows = sum(1 for e in valid_entries if _entry_ts(e) >= today_midnight_ts)
-            _LOGGER.debug(
-                "DB baseline for %s: baseline_pre_midnight=%.6f, latest_sum_any_day=%.6f, existing_today_rows=%d",
-                statistic_id,
-                baseline_sum,
-                latest_sum,
-                today_rows,
-            )
-            return baseline_sum
-
         async def _async_import_hp_slot_statistics(changed_data: dict):
             if "recorder" not in hass.config.components:
                 return
@@ -289,7 +295,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             for sensor_param in _HP_STATS_PARAMS:
                 sensor_data = sensor_values.get(sensor_param, {})
                 attributes = sensor_data.get("attributes") or {}
-                if not isinstance(attributes, dict):
+                if not isinstance(attributes, Mapping):
                     continue
 
                 now = dt_util.now()
@@ -321,64 +327,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
                 statistic_id = _statistic_id_from_param(
                     _HP_STATS_TARGET_PARAM.get(sensor_param, sensor_param)
                 )
-                imported_starts = imported_slots_by_stat_id.setdefault(statistic_id, set())
-
-                if statistic_id not in running_sum_by_stat_id:
-                    running_sum_by_stat_id[statistic_id] = await _init_stat_state(statistic_id)
-
-                stats_payload = []
-                for slot_start, slot_value in slot_points:
-                    slot_key = slot_start.isoformat()
-
-                    if hp_slot_mode == HP_SLOT_MODE_SPLIT:
-                        # Divide the 2-hour bucket evenly across two 1-hour records.
-                        half_value = round(slot_value / 2, 6)
-                        for offset_hours in (0, 1):
-                            hour_start = slot_start + timedelta(hours=offset_hours)
-                            hour_key = hour_start.isoformat()
-                            if hour_key in imported_starts:
-                                continue
-                            running_sum_by_stat_id[statistic_id] = round(
-                                running_sum_by_stat_id[statistic_id] + half_value,
-                                6,
-                            )
-                            imported_starts.add(hour_key)
-                            stats_payload.append(
-                                StatisticData(
-                                    start=hour_start,
-                                    state=half_value,
-                                    sum=running_sum_by_stat_id[statistic_id],
-                                )
-                            )
-                    else:
-                        # Verbatim: one record at the slot start with the full value.
-                        if slot_key in imported_starts:
-                            continue
-                        running_sum_by_stat_id[statistic_id] = round(
-                            running_sum_by_stat_id[statistic_id] + slot_value,
-                            6,
-                        )
-                        imported_starts.add(slot_key)
-                        stats_payload.append(
-                            StatisticData(
-                                start=slot_start,
-                                state=slot_value,
-                                sum=running_sum_by_stat_id[statistic_id],
-                            )
-                        )
+                await importer.async_import(statistic_id, slot_points, now)
 
-                if not stats_payload:
-                    continue
+        backfill = AristonStatisticsBackfill(
+            hass,
+            Store(hass, BACKFILL_STORAGE_VERSION, BACKFILL_STORAGE_KEY.format(entry.entry_id)),
+            on_statistic_done=importer.reset,
+        )
 
-                metadata = StatisticMetaData(
-                    has_mean=False,
-                    has_sum=True,
-                    name=None,
-                    source="recorder",
-                    statistic_id=statistic_id,
-                    unit_of_measurement="kWh",
-                )
-                async_import_statistics(hass, metadata, stats_payload)
+        async def _async_backfill_statistics(restart: bool = False):
+            """Backfill lifetime statistics from daily and monthly history of last metering read."""
+            if "recorder" not in hass.config.components:
+                return
+            histories = {
+                _statistic_id_from_param(_HP_STATS_TARGET_PARAM[sensor_param]):
+                    api.ariston_api.hp_energy_history(sensor_param)
+                for sensor_param in _HP_STATS_PARAMS
+            }
+            if not any(histories.values()):
+                _LOGGER.warning("Heat pump energy history of %s is not read yet, nothing to backfill", name)
+                return
+            await backfill.async_run(histories, restart)
+
+        api.async_backfill_statistics = _async_backfill_statistics
+        api.reset_statistic_state = importer.reset
 
         def _safe_float(value):
             try:
@@ -483,10 +455,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         update_list(sensors)
         update_list(selectors)
     
-    # Store device
-    hass.data[DATA_ARISTON][DEVICES][name] = AristonDevice(api, entry.data)
-    _LOGGER.info("Stored Ariston device: %s", name)
-    
     # Forward entry setup to platforms
     _LOGGER.info("Forwarding entry to platforms: %s", ", ".join(p.value for p in PLATFORMS))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -543,12 +511,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
             _LOGGER.debug("Ariston device found, data to check and send")
 
-            await hass.async_add_executor_job(api.ariston_api.set_http_data, **parameter_list)
+            # Values are checked and stored on the event loop of the handler
+            api.ariston_api.set_http_data(**parameter_list)
             return
         
         raise Exception("Corresponding entity_id for Ariston not found")
     
     hass.services.async_register(DOMAIN, SERVICE_SET_DATA, set_ariston_data)
+
+    async def backfill_ariston_statistics(call: ServiceCall):
+        """Handle the service call to backfill statistics, backfill runs in the background."""
+        device_name = call.data.get(CONF_NAME)
+        for api_name, device in hass.data[DATA_ARISTON][DEVICES].items():
+            if device_name and device_name != api_name:
+                continue
+            if device.api.async_backfill_statistics is None:
+                _LOGGER.warning("Statistics of %s can not be backfilled without recorder", api_name)
+                continue
+            hass.async_create_task(device.api.async_backfill_statistics(call.data["restart"]))
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_BACKFILL_STATISTICS, backfill_ariston_statistics, schema=BACKFILL_STATISTICS_SCHEMA)
+
+    async def repair_ariston_statistics(call: ServiceCall):
+        """Handle the service call to correct slots of a statistic in the recorder database."""
+        if not _RECORDER_STATS_AVAILABLE or "recorder" not in hass.config.components:
+            raise HomeAssistantError("Statistics can not be repaired without recorder")
+        statistic_id = call.data["statistic_id"]
+        slots = {}
+        for start_time, energy in call.data["slots"].items():
+            if start_time.tzinfo is None:
+                start_time = start_time.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+            slots[start_time] = energy
+        if not slots:
+            return
+        await async_repair_statistics(hass, statistic_id, slot_hour_states(slots, call.data["split"]))
+        for device in hass.data[DATA_ARISTON][DEVICES].values():
+            if device.api.reset_statistic_state is not None:
+                device.api.reset_statistic_state(statistic_id)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REPAIR_STATISTICS, repair_ariston_statistics, schema=REPAIR_STATISTICS_SCHEMA)
     
     # Register update listener for options
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -563,8 +566,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     # Stop the API
     if name in hass.data[DATA_ARISTON][DEVICES]:
         device = hass.data[DATA_ARISTON][DEVICES][name]
-        device.api.ariston_api.stop()
+        await device.api.ariston_api.async_stop()
         hass.data[DATA_ARISTON][DEVICES].pop(name)
+        await _async_release_account_client(hass, entry.data[CONF_USERNAME])
     
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -572,6 +576,39 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     return unload_ok
 
 
+def _acquire_account_client(hass: HomeAssistant, username: str) -> AsyncAristonApiClient:
+    """Return API client shared by config entries of the account, it logs in once for all gateways."""
+    accounts = hass.data[DATA_ARISTON].setdefault(ACCOUNTS, {})
+    if username not in accounts:
+        accounts[username] = {
+            "client": AsyncAristonApiClient(
+                AsyncAristonHandler._LOGGER, session=async_create_clientsession(hass)),
+            "entries": 0,
+        }
+    accounts[username]["entries"] += 1
+    return accounts[username]["client"]
+
+
+async def _async_release_account_client(hass: HomeAssistant, username: str):
+    """Release API client of the account, the last config entry closes it."""
+    accounts = hass.data[DATA_ARISTON].get(ACCOUNTS, {})
+    if username not in accounts:
+        return
+    accounts[username]["entries"] -= 1
+    if accounts[username]["entries"] <= 0:
+        client = accounts.pop(username)["client"]
+        if client.login_generation:
+            await client.logout()
+        await client.close()
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Remove saved login state, importer state and backfill cursor of removed config entry."""
+    await Store(hass, SESSION_STORAGE_VERSION, SESSION_STORAGE_KEY.format(entry.entry_id)).async_remove()
+    await Store(hass, IMPORTER_STORAGE_VERSION, IMPORTER_STORAGE_KEY.format(entry.entry_id)).async_remove()
+    await Store(hass, BACKFILL_STORAGE_VERSION, BACKFILL_STORAGE_KEY.format(entry.entry_id)).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Reload config entry."""
     await async_unload_entry(hass, entry)
@@ -597,7 +634,10 @@ class AristonChecker:
         period_set,
         period_get,
         retries,
-        num_ch_zones=1
+        num_ch_zones=1,
+        login_state=None,
+        login_state_saver=None,
+        api_client=None,
     ):
         """Initialize."""
 
@@ -622,7 +662,7 @@ class AristonChecker:
         if PARAM_VERSION in list_of_sensors:
             list_of_sensors.remove(PARAM_VERSION)
 
-        self.ariston_api = AristonHandler(
+        self.ariston_api = AsyncAristonHandler(
             username=username,
             password=password,
             sensors=list_of_sensors,
@@ -632,7 +672,14 @@ class AristonChecker:
             period_get_request=period_get,
             period_set_request=period_set,
             max_zones=num_ch_zones,
+            login_state=login_state,
+            login_state_saver=login_state_saver,
+            api_client=api_client,
         )
+        self.coordinator = AristonCoordinator(hass, self.ariston_api)
+        # Set by setup when recorder statistics are available
+        self.async_backfill_statistics = None
+        self.reset_statistic_state = None
 
 
 class AristonDevice:
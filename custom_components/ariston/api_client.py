@@ -1,16 +1,217 @@
 """Ariston API client for HTTP communication."""
+import asyncio
+import bisect
+import collections
+import json
+import random
 import threading
+import time
+from http.cookies import SimpleCookie
+
+import aiohttp
 import requests
+from yarl import URL
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data):
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class AristonAuthError(Exception):
+    """Credentials were rejected or the session expired."""
+
+
+class AristonThrottledError(Exception):
+    """Server asks to slow down (HTTP 429 or 503)."""
+
+
+class AristonTransportError(Exception):
+    """No reply was received (connection problem or timeout)."""
+
+
+def reply_error(status_code, message):
+    """Return exception matching the reply code."""
+    if status_code in (401, 403):
+        return AristonAuthError(message)
+    if status_code in (429, 503):
+        return AristonThrottledError(message)
+    return Exception(message)
+
+
+def is_connect_timeout(ex):
+    """Return True if the request timed out before connection was established (no latency of the endpoint)."""
+    if isinstance(ex, requests.exceptions.ConnectTimeout):
+        return True
+    connection_timeout_error = getattr(aiohttp, "ConnectionTimeoutError", None)
+    if connection_timeout_error is not None:
+        return isinstance(ex, connection_timeout_error)
+    # Older aiohttp reports connect timeouts by message only
+    return isinstance(ex, aiohttp.ServerTimeoutError) and str(ex).startswith("Connection timeout")
+
+
+def encode_request(data):
+    """Encode request body to JSON bytes to be sent as is (using orjson if installed)."""
+    return _json_dumps(data)
+
+
+def body_arguments(json_data):
+    """Return session arguments sending the body, encoded bodies are sent as is."""
+    if isinstance(json_data, bytes):
+        return {"data": json_data, "headers": _JSON_HEADERS}
+    return {"json": json_data}
+
+
+def decode_response(resp):
+    """Decode JSON body of the response (raw bytes are decoded directly, using orjson if installed)."""
+    return _json_loads(resp.content)
+
+
+class LatencyHistogram:
+    """Rolling histogram of latencies of one endpoint."""
+
+    # Upper bounds of buckets in seconds, last bucket holds slower replies
+    BUCKETS = (0.1, 0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60)
+    WINDOW = 200
+
+    def __init__(self):
+        """Initialize empty histogram."""
+        self._samples = collections.deque()
+        self._counts = [0] * (len(self.BUCKETS) + 1)
+
+    def add(self, seconds):
+        """Add latency of a reply, the oldest one is dropped when the window is full."""
+        if len(self._samples) == self.WINDOW:
+            self._counts[self._samples.popleft()] -= 1
+        bucket = bisect.bisect_left(self.BUCKETS, seconds)
+        self._samples.append(bucket)
+        self._counts[bucket] += 1
+
+    def __len__(self):
+        return len(self._samples)
+
+    def percentile(self, percent):
+        """Return upper bound of the bucket holding the percentile, None without samples."""
+        if not self._samples:
+            return None
+        rank = len(self._samples) * percent / 100
+        total = 0
+        for bucket, count in enumerate(self._counts):
+            total += count
+            if total >= rank and count:
+                return self.BUCKETS[min(bucket, len(self.BUCKETS) - 1)]
+        return self.BUCKETS[-1]
+
+    def as_dict(self):
+        """Return counts per bucket upper bound and percentiles."""
+        buckets = dict(zip(self.BUCKETS, self._counts))
+        buckets[float("inf")] = self._counts[-1]
+        return {
+            "count": len(self._samples),
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": buckets,
+        }
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of one endpoint.
+
+    Closed circuit lets requests through, it opens after consecutive failures (or at once when throttled)
+    for exponentially growing backoff with jitter. Once backoff elapses the circuit is half-open,
+    a successful trial request closes it, a failed one opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold, backoff, backoff_max):
+        """Initialize closed circuit."""
+        self._failure_threshold = failure_threshold
+        self._backoff = backoff
+        self._backoff_max = backoff_max
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened = 0
+        self.open_until = 0.0
+        self.last_error = None
+
+    def allow(self, now):
+        """Return True if request can be sent, open circuit becomes half-open after backoff."""
+        if self.state == self.OPEN and now >= self.open_until:
+            self.state = self.HALF_OPEN
+        return self.state != self.OPEN
+
+    def retry_in(self, now):
+        """Return seconds until request can be sent."""
+        if self.state != self.OPEN:
+            return 0
+        return max(0, self.open_until - now)
+
+    def record_success(self):
+        """Close the circuit."""
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened = 0
+        self.last_error = None
+
+    def record_failure(self, now, kind, throttled=False):
+        """Count failure of given kind, returns True if circuit was opened."""
+        self.failures += 1
+        self.last_error = kind
+        if self.state != self.HALF_OPEN and self.failures < self._failure_threshold and not throttled:
+            return False
+        backoff = min(self._backoff_max, self._backoff * 2 ** self.opened)
+        self.opened += 1
+        # Half of the backoff is random so endpoints and instances do not retry together
+        self.open_until = now + backoff / 2 + random.uniform(0, backoff / 2)
+        self.state = self.OPEN
+        return True
+
+    def as_dict(self, now):
+        """Return state of the circuit."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "retry_in": round(self.retry_in(now), 1),
+        }
 
 
 class AristonApiClient:
-    """Handles all HTTP API communication with Ariston servers."""
+    """
+    Handles all HTTP API communication with Ariston servers.
+
+    One client can serve all gateways of the account, it keeps one login and limits concurrent requests.
+    """
 
     # API configuration
     _ARISTON_URL = "https://www.ariston-net.remotethermo.com"
+    # Requests without valid session are redirected to the login page
+    _LOGIN_PATH = "/R2/Account/Login"
     _TIMEOUT_MIN = 5
     _TIMEOUT_AV = 15
     _TIMEOUT_MAX = 25
+    # Timeouts of endpoints with enough samples are latency percentile multiplied by factor within bounds,
+    # timeouts of call sites are used until then
+    _TIMEOUT_CONNECT = 5
+    _TIMEOUT_PERCENTILE = 99
+    _TIMEOUT_FACTOR = 3
+    _TIMEOUT_LOWER = 5
+    _TIMEOUT_UPPER = 40
+    _TIMEOUT_MIN_SAMPLES = 20
+    # Maximum number of requests sent at the same time by all users of the client
+    _REQUESTS_CONCURRENCY = 4
 
     def __init__(self, logger):
         """Initialize API client with session and logger."""
@@ -18,35 +219,169 @@ class AristonApiClient:
         self._LOGGER = logger
         self._plant_id_lock = threading.Lock()
         self._data_lock = threading.Lock()
+        self._latency_lock = threading.Lock()
+        self._latencies = {}
+        self._relogin_lock = threading.Lock()
+        self._credentials = None
+        self._login_generation = 0
+        self._account_lock = threading.Lock()
+        self._gateways = None
+        self._requests_semaphore = threading.BoundedSemaphore(self._REQUESTS_CONCURRENCY)
+
+    def _timeouts(self, endpoint, timeout):
+        """Return connect and read timeouts of the endpoint, read timeout adapts to observed latencies."""
+        with self._latency_lock:
+            histogram = self._latencies.get(endpoint)
+            if histogram is None or len(histogram) < self._TIMEOUT_MIN_SAMPLES:
+                return self._TIMEOUT_CONNECT, timeout
+            read_timeout = histogram.percentile(self._TIMEOUT_PERCENTILE) * self._TIMEOUT_FACTOR
+        return self._TIMEOUT_CONNECT, min(max(read_timeout, self._TIMEOUT_LOWER), self._TIMEOUT_UPPER)
+
+    def _record_latency(self, endpoint, seconds):
+        """Add latency of the endpoint, requests timed out while reading count with their timeout."""
+        with self._latency_lock:
+            if endpoint not in self._latencies:
+                self._latencies[endpoint] = LatencyHistogram()
+            self._latencies[endpoint].add(seconds)
+
+    @property
+    def latency_stats(self):
+        """Return latency histogram and current timeouts per endpoint."""
+        stats = {}
+        with self._latency_lock:
+            endpoints = list(self._latencies)
+            for endpoint in endpoints:
+                stats[endpoint] = self._latencies[endpoint].as_dict()
+        for endpoint in endpoints:
+            stats[endpoint]["connect_timeout"], stats[endpoint]["read_timeout"] = \
+                self._timeouts(endpoint, self._TIMEOUT_AV)
+        return stats
+
+    def _check_login_redirect(self, history, url, error_msg):
+        """Raise authentication error if the request was redirected to the login page."""
+        if history and URL(str(url)).path == self._LOGIN_PATH:
+            self._LOGGER.warning(f'{error_msg} redirected to login page')
+            raise AristonAuthError(f'{error_msg} redirected to login page')
+
+    def export_cookies(self):
+        """Return cookies of the session."""
+        return [
+            {"name": cookie.name, "value": cookie.value, "domain": cookie.domain, "path": cookie.path}
+            for cookie in self._session.cookies
+        ]
 
-    def request_post(self, url, json_data, timeout=_TIMEOUT_MIN, error_msg=''):
-        """Make a POST request."""
+    def import_cookies(self, cookies):
+        """Add cookies of a saved login to the session, returns login generation of restored session."""
+        for cookie in cookies:
+            self._session.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"])
+        # Other users of the client see the session as logged in and keep its cookies
+        self._login_generation += 1
+        return self._login_generation
+
+    def set_credentials(self, username, password):
+        """Set credentials used to renew expired session."""
+        self._credentials = (username, password)
+
+    def _logged_in(self, username, password):
+        """Remember successful login, requests rejected by older sessions login again."""
+        self._credentials = (username, password)
+        self._login_generation += 1
+
+    @property
+    def login_generation(self):
+        """Return number of logins and restored logins of the session."""
+        return self._login_generation
+
+    def account_login(self, username, password, generation):
+        """
+        Login unless the session was logged in after the given login generation by other user of the client.
+        Returns current login generation and gateways of the account.
+        """
+        with self._account_lock:
+            if self._login_generation == generation:
+                self.login(username, password)
+                self._gateways = None
+            if self._gateways is None:
+                self._gateways = self.get_gateways()
+            return self._login_generation, self._gateways
+
+    def _relogin(self, generation, error_msg):
+        """Login again once for all requests rejected by the same session, returns False without credentials."""
+        if self._credentials is None:
+            return False
+        with self._relogin_lock:
+            if self._login_generation == generation:
+                self._LOGGER.info(f'{error_msg} rejected by expired session, login again')
+                self.login(*self._credentials)
+        return True
+
+    def request_post(self, url, json_data, timeout=_TIMEOUT_MIN, error_msg='', reauth=True):
+        """Make a POST request, request rejected by expired session is repeated once after login."""
+        generation = self._login_generation
         try:
-            resp = self._session.post(
-                url,
-                timeout=timeout,
-                json=json_data,
-                verify=True)
+            return self._send_post(url, json_data, timeout, error_msg)
+        except AristonAuthError:
+            if not reauth or not self._relogin(generation, error_msg):
+                raise
+        return self._send_post(url, json_data, timeout, error_msg)
+
+    def request_get(self, url, timeout=_TIMEOUT_MIN, error_msg='', ignore_errors=False):
+        """Make a GET request, request rejected by expired session is repeated once after login."""
+        generation = self._login_generation
+        try:
+            return self._send_get(url, timeout, error_msg, ignore_errors)
+        except AristonAuthError:
+            if not self._relogin(generation, error_msg):
+                raise
+        return self._send_get(url, timeout, error_msg, ignore_errors)
+
+    def _send_post(self, url, json_data, timeout, error_msg):
+        """Send a POST request."""
+        timeouts = self._timeouts(error_msg, timeout)
+        try:
+            with self._requests_semaphore:
+                # Latency does not include waiting for other requests
+                start = time.monotonic()
+                resp = self._session.post(
+                    url,
+                    timeout=timeouts,
+                    verify=True,
+                    **body_arguments(json_data))
         except requests.exceptions.RequestException as ex:
+            if isinstance(ex, requests.exceptions.Timeout) and not is_connect_timeout(ex):
+                self._record_latency(error_msg, time.monotonic() - start)
             self._LOGGER.warning(f'{error_msg} exception: {ex}')
-            raise Exception(f'{error_msg} exception: {ex}')
+            raise AristonTransportError(f'{error_msg} exception: {ex}')
+        self._record_latency(error_msg, time.monotonic() - start)
+        self._check_login_redirect(resp.history, resp.url, error_msg)
         if not resp.ok:
             self._LOGGER.warning(f'{error_msg} reply code: {resp.status_code}')
             self._LOGGER.warning(f'{resp.text}')
-            raise Exception(f'{error_msg} reply code: {resp.status_code}')
+            raise reply_error(resp.status_code, f'{error_msg} reply code: {resp.status_code}')
         return resp
 
-    def request_get(self, url, timeout=_TIMEOUT_MIN, error_msg='', ignore_errors=False):
-        """Make a GET request."""
+    def _send_get(self, url, timeout, error_msg, ignore_errors):
+        """Send a GET request."""
+        timeouts = self._timeouts(error_msg, timeout)
         try:
-            resp = self._session.get(
-                url,
-                timeout=timeout,
-                verify=True)
+            with self._requests_semaphore:
+                # Latency does not include waiting for other requests
+                start = time.monotonic()
+                resp = self._session.get(
+                    url,
+                    timeout=timeouts,
+                    verify=True)
         except requests.exceptions.RequestException as ex:
+            if isinstance(ex, requests.exceptions.Timeout) and not is_connect_timeout(ex):
+                self._record_latency(error_msg, time.monotonic() - start)
             self._LOGGER.warning(f'{error_msg} exception: {ex}')
             if not ignore_errors:
-                raise Exception(f'{error_msg} exception: {ex}')
+                raise AristonTransportError(f'{error_msg} exception: {ex}')
+            return None
+        self._record_latency(error_msg, time.monotonic() - start)
+        if not ignore_errors:
+            self._check_login_redirect(resp.history, resp.url, error_msg)
         if not resp.ok:
             log_text = True
             if resp.status_code == 500:
@@ -56,23 +391,30 @@ class AristonApiClient:
             if log_text:
                 self._LOGGER.warning(f'{resp.text}')
             if not ignore_errors:
-                raise Exception(f'{error_msg} reply code: {resp.status_code}')
+                raise reply_error(resp.status_code, f'{error_msg} reply code: {resp.status_code}')
         return resp
 
-    def login(self, username, password):
-        """Login to Ariston API."""
+    def _login_request(self, username, password):
+        """Send login request."""
         login_data = {
             "email": username,
             "password": password,
             "rememberMe": False,
             "language": "English_Us"
         }
-        self.request_post(
+        return self.request_post(
             url=f'{self._ARISTON_URL}/R2/Account/Login',
             json_data=login_data,
-            error_msg='Login'
+            error_msg='Login',
+            reauth=False,
         )
 
+    def login(self, username, password):
+        """Login to Ariston API."""
+        resp = self._login_request(username, password)
+        self._logged_in(username, password)
+        return resp
+
     def get_gateways(self):
         """Fetch list of available gateways."""
         resp = self.request_get(
@@ -135,11 +477,11 @@ class AristonApiClient:
         )
         return resp
 
-    def get_heat_pump_energy_data(self, plant_id, features):
+    def get_heat_pump_energy_data(self, plant_id, request_data):
         """Fetch heat pump energy production data."""
         resp = self.request_post(
             url=f'{self._ARISTON_URL}/R2/PlantMetering/GetData/{plant_id}',
-            json_data={"features": features, "hasCooling": False},
+            json_data=request_data,
             timeout=self._TIMEOUT_AV,
             error_msg="Heat pump energy data read"
         )
@@ -212,3 +554,194 @@ class AristonApiClient:
     def close(self):
         """Close the session."""
         self._session.close()
+
+
+class AristonResponse:
+    """Response of the asynchronous client with the body already read."""
+
+    def __init__(self, status_code, content):
+        """Initialize response with status code and raw body."""
+        self.status_code = status_code
+        self.content = content
+
+    @property
+    def text(self):
+        """Return body as text."""
+        return self.content.decode("utf-8", errors="replace")
+
+    @property
+    def ok(self):
+        """Return True if status code is not an error."""
+        return self.status_code < 400
+
+    def json(self):
+        """Return decoded JSON body."""
+        return decode_response(self)
+
+
+class AsyncAristonApiClient(AristonApiClient):
+    """
+    Handles all HTTP API communication with Ariston servers on the event loop.
+
+    Endpoint methods are inherited, request methods are coroutines,
+    so every endpoint method returns an awaitable.
+    """
+
+    _CONNECTIONS_LIMIT = 4
+
+    def __init__(self, logger, session: aiohttp.ClientSession = None):
+        """Initialize API client with aiohttp session and logger."""
+        super().__init__(logger)
+        # Session and locks held across awaits belong to the event loop
+        self._session = session
+        self._relogin_lock = asyncio.Lock()
+        self._account_lock = asyncio.Lock()
+        self._requests_semaphore = asyncio.Semaphore(self._REQUESTS_CONCURRENCY)
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._CONNECTIONS_LIMIT))
+        return self._session
+
+    def export_cookies(self):
+        """Return cookies of the session."""
+        return [
+            {"name": cookie.key, "value": cookie.value, "domain": cookie["domain"], "path": cookie["path"]}
+            for cookie in self._get_session().cookie_jar
+        ]
+
+    def import_cookies(self, cookies):
+        """Add cookies of a saved login to the session, returns login generation of restored session."""
+        for cookie in cookies:
+            morsels = SimpleCookie()
+            morsels[cookie["name"]] = cookie["value"]
+            if cookie["domain"]:
+                morsels[cookie["name"]]["domain"] = cookie["domain"]
+            morsels[cookie["name"]]["path"] = cookie["path"] or "/"
+            self._get_session().cookie_jar.update_cookies(morsels, response_url=URL(self._ARISTON_URL))
+        # Other users of the client see the session as logged in and keep its cookies
+        self._login_generation += 1
+        return self._login_generation
+
+    async def _request(self, method, url, timeout, error_msg, ignore_errors=False, json_data=None):
+        connect_timeout, read_timeout = self._timeouts(error_msg, timeout)
+        try:
+            async with self._requests_semaphore:
+                # Latency does not include waiting for other requests
+                start = time.monotonic()
+                async with self._get_session().request(
+                        method,
+                        url,
+                        **body_arguments(json_data),
+                        timeout=aiohttp.ClientTimeout(
+                            total=connect_timeout + read_timeout,
+                            sock_connect=connect_timeout,
+                            sock_read=read_timeout)) as raw_resp:
+                    resp = AristonResponse(raw_resp.status, await raw_resp.read())
+                    if not ignore_errors:
+                        self._check_login_redirect(raw_resp.history, raw_resp.url, error_msg)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            if isinstance(ex, asyncio.TimeoutError) and not is_connect_timeout(ex):
+                self._record_latency(error_msg, time.monotonic() - start)
+            self._LOGGER.warning(f'{error_msg} exception: {ex!r}')
+            if not ignore_errors:
+                raise AristonTransportError(f'{error_msg} exception: {ex!r}')
+            return None
+        self._record_latency(error_msg, time.monotonic() - start)
+        return resp
+
+    async def account_login(self, username, password, generation):
+        """
+        Login unless the session was logged in after the given login generation by other user of the client.
+        Returns current login generation and gateways of the account.
+        """
+        async with self._account_lock:
+            if self._login_generation == generation:
+                await self.login(username, password)
+                self._gateways = None
+            if self._gateways is None:
+                self._gateways = await self.get_gateways()
+            return self._login_generation, self._gateways
+
+    async def _relogin(self, generation, error_msg):
+        """Login again once for all requests rejected by the same session, returns False without credentials."""
+        if self._credentials is None:
+            return False
+        async with self._relogin_lock:
+            if self._login_generation == generation:
+                self._LOGGER.info(f'{error_msg} rejected by expired session, login again')
+                await self.login(*self._credentials)
+        return True
+
+    async def request_post(self, url, json_data, timeout=AristonApiClient._TIMEOUT_MIN, error_msg='', reauth=True):
+        """Make a POST request, request rejected by expired session is repeated once after login."""
+        generation = self._login_generation
+        try:
+            return await self._send_post(url, json_data, timeout, error_msg)
+        except AristonAuthError:
+            if not reauth or not await self._relogin(generation, error_msg):
+                raise
+        return await self._send_post(url, json_data, timeout, error_msg)
+
+    async def request_get(self, url, timeout=AristonApiClient._TIMEOUT_MIN, error_msg='', ignore_errors=False):
+        """Make a GET request, request rejected by expired session is repeated once after login."""
+        generation = self._login_generation
+        try:
+            return await self._send_get(url, timeout, error_msg, ignore_errors)
+        except AristonAuthError:
+            if not await self._relogin(generation, error_msg):
+                raise
+        return await self._send_get(url, timeout, error_msg, ignore_errors)
+
+    async def _send_post(self, url, json_data, timeout, error_msg):
+        """Send a POST request."""
+        resp = await self._request('POST', url, timeout, error_msg, json_data=json_data)
+        if not resp.ok:
+            self._LOGGER.warning(f'{error_msg} reply code: {resp.status_code}')
+            self._LOGGER.warning(f'{resp.text}')
+            raise reply_error(resp.status_code, f'{error_msg} reply code: {resp.status_code}')
+        return resp
+
+    async def _send_get(self, url, timeout, error_msg, ignore_errors):
+        """Send a GET request."""
+        resp = await self._request('GET', url, timeout, error_msg, ignore_errors=ignore_errors)
+        if resp is not None and not resp.ok:
+            log_text = True
+            if resp.status_code == 500:
+                # Unsupported additional parameters are visible in the HTML reply
+                log_text = False
+            self._LOGGER.warning(f'{error_msg} reply code: {resp.status_code}')
+            if log_text:
+                self._LOGGER.warning(f'{resp.text}')
+            if not ignore_errors:
+                raise reply_error(resp.status_code, f'{error_msg} reply code: {resp.status_code}')
+        return resp
+
+    async def login(self, username, password):
+        """Login to Ariston API."""
+        resp = await self._login_request(username, password)
+        self._logged_in(username, password)
+        return resp
+
+    async def get_gateways(self):
+        """Fetch list of available gateways."""
+        resp = await self.request_get(
+            url=f'{self._ARISTON_URL}/api/v2/remote/plants/lite',
+            error_msg='Gateways'
+        )
+        return [item['gwId'] for item in resp.json()]
+
+    async def get_plant_features(self, plant_id):
+        """Fetch features for a specific plant/gateway."""
+        resp = await self.request_get(
+            url=f'{self._ARISTON_URL}/api/v2/remote/plants/{plant_id}/features?eagerMode=True',
+            error_msg='Features'
+        )
+        return resp.json()
+
+    async def close(self):
+        """Close the session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -1,14 +1,29 @@
 """Suppoort for Ariston."""
+import asyncio
+import collections
 import copy
 import datetime
+import heapq
 import logging
-import re
+import random
 import threading
 import json
 import os
-from typing import Union
-
-from .api_client import AristonApiClient
+import sys
+import time
+from types import MappingProxyType
+from typing import Mapping, Union
+
+from .api_client import (
+    AristonApiClient,
+    AristonAuthError,
+    AristonThrottledError,
+    AristonTransportError,
+    AsyncAristonApiClient,
+    CircuitBreaker,
+    decode_response,
+    encode_request,
+)
 
 
 class AristonHandler:
@@ -25,6 +40,21 @@ class AristonHandler:
 
     'period_request' - period to send requests (minimum is 30 seconds)
 
+    'request_intervals' - optional dictionary of request type (main, additional_params, errors, ch_schedule,
+    dhw_schedule) and period in seconds to read it (minimum is 30 seconds), main uses 'period_request';
+
+    'hp_energy_delay' - seconds after closing of 2-hour energy slot to read heat pump energy;
+
+    'set_debounce' - seconds to wait for further values to set before sending them, only the last value of
+    each parameter is sent;
+
+    'set_confirm_delay' - seconds after values are accepted by the server to read them back, the delay doubles
+    while read values do not match, None reads them with regular requests;
+
+    'login_state' - login state saved by 'login_state_saver' to be reused instead of login while not expired;
+
+    'login_state_saver' - function called with login state (session cookies, plant ID and features) after login;
+
     'polling' - defines multiplication factor for waiting periods to get or set the data;
 
     'logging_level' - defines level of logging - allowed values [CRITICAL, ERROR, WARNING, INFO, DEBUG, NOTSET=(default)]
@@ -38,9 +68,21 @@ class AristonHandler:
     _MAX_RETRIES = 5
     _GET_SENSORS_PERIOD_SECONDS = 30
     _SET_SENSORS_PERIOD_SECONDS = 30
-    _MAX_ERRORS = 5
-    _WAIT_PERIOD_MULTIPLYER = 5
+    # Time without new values to set before the values are sent
+    _SET_DEBOUNCE_SECONDS = 1
+    # Written values are read back after the delay, doubled on each mismatch, before they are set again
+    _SET_CONFIRM_DELAY_SECONDS = 3
+    _SET_CONFIRM_READS = 4
+    # Consecutive failures opening circuit of a request, failures of main request make API unavailable
+    _CIRCUIT_FAILURES = 5
+    # Backoff of open circuit, doubled each time the circuit opens again
+    _CIRCUIT_BACKOFF_SECONDS = 60
+    _CIRCUIT_BACKOFF_MAX_SECONDS = 900
     _TIME_SPLIT = 0.1
+    # Dispatcher thread of subscriber notifications ends after being idle for this period
+    _NOTIFY_IDLE_SECONDS = 60
+    # Saved login state is reused within this period, the session is validated by the first request
+    _LOGIN_STATE_TTL_SECONDS = 24 * 3600
 
     # Log levels
     _LEVEL_CRITICAL = "CRITICAL"
@@ -111,6 +153,24 @@ class AristonHandler:
     _PARAM_HP_TOTAL_PRODUCED_TODAY = 'hp_total_produced_today'
     _PARAM_HP_TOTAL_CONSUMED_TODAY = 'hp_total_consumed_today'
     _PARAM_HP_TOTAL_COP = 'hp_total_cop'
+    _PARAM_HP_TOTAL_PRODUCED_THIS_WEEK = 'hp_total_produced_this_week'
+    _PARAM_HP_TOTAL_CONSUMED_THIS_WEEK = 'hp_total_consumed_this_week'
+    _PARAM_HP_TOTAL_COP_THIS_WEEK = 'hp_total_cop_this_week'
+    _PARAM_HP_TOTAL_PRODUCED_LAST_WEEK = 'hp_total_produced_last_week'
+    _PARAM_HP_TOTAL_CONSUMED_LAST_WEEK = 'hp_total_consumed_last_week'
+    _PARAM_HP_TOTAL_COP_LAST_WEEK = 'hp_total_cop_last_week'
+    _PARAM_HP_TOTAL_PRODUCED_THIS_MONTH = 'hp_total_produced_this_month'
+    _PARAM_HP_TOTAL_CONSUMED_THIS_MONTH = 'hp_total_consumed_this_month'
+    _PARAM_HP_TOTAL_COP_THIS_MONTH = 'hp_total_cop_this_month'
+    _PARAM_HP_TOTAL_PRODUCED_LAST_MONTH = 'hp_total_produced_last_month'
+    _PARAM_HP_TOTAL_CONSUMED_LAST_MONTH = 'hp_total_consumed_last_month'
+    _PARAM_HP_TOTAL_COP_LAST_MONTH = 'hp_total_cop_last_month'
+    _PARAM_HP_TOTAL_PRODUCED_THIS_YEAR = 'hp_total_produced_this_year'
+    _PARAM_HP_TOTAL_CONSUMED_THIS_YEAR = 'hp_total_consumed_this_year'
+    _PARAM_HP_TOTAL_COP_THIS_YEAR = 'hp_total_cop_this_year'
+    _PARAM_HP_TOTAL_PRODUCED_LAST_YEAR = 'hp_total_produced_last_year'
+    _PARAM_HP_TOTAL_CONSUMED_LAST_YEAR = 'hp_total_consumed_last_year'
+    _PARAM_HP_TOTAL_COP_LAST_YEAR = 'hp_total_cop_last_year'
     _PARAM_HEATING_FLOW_TEMP = "ch_heating_flow_temp"
     _PARAM_HEATING_FLOW_OFFSET = "ch_heating_flow_offset"
 
@@ -215,6 +275,16 @@ class AristonHandler:
         _PARAM_HEATING_FLOW_TEMP: _ARISTON_PAR_HEATING_FLOW_TEMP,
         _PARAM_HEATING_FLOW_OFFSET: _ARISTON_PAR_HEATING_FLOW_OFFSET,
     }
+    # Main data needed by other sensors to set their values or to fix their limits
+    _MAP_MAIN_SENSOR_DEPENDENCIES = {
+        _PARAM_CH_SET_TEMPERATURE: (_PARAM_CH_COMFORT_TEMPERATURE, _PARAM_CH_ECONOMY_TEMPERATURE, _PARAM_CH_MODE),
+        _PARAM_CH_COMFORT_TEMPERATURE: (_PARAM_CH_ECONOMY_TEMPERATURE,),
+        _PARAM_CH_ECONOMY_TEMPERATURE: (_PARAM_CH_COMFORT_TEMPERATURE,),
+        _PARAM_DHW_COMFORT_TEMPERATURE: (_PARAM_DHW_ECONOMY_TEMPERATURE,),
+        _PARAM_DHW_ECONOMY_TEMPERATURE: (_PARAM_DHW_COMFORT_TEMPERATURE,),
+    }
+    # Main data always read, they define availability of CH and DHW
+    _LIST_MAIN_SENSORS_REQUIRED = [_PARAM_CH_SET_TEMPERATURE, _PARAM_DHW_SET_TEMPERATURE]
     # Parameters in Web menu, mapping to parameter names
     _MAP_ARISTON_WEB_MENU_PARAMS = {
         _PARAM_INTERNET_TIME: _ARISTON_INTERNET_TIME,
@@ -247,7 +317,7 @@ class AristonHandler:
     _LIST_DHW_PROGRAM_PARAMS = [
         _PARAM_DHW_PROGRAM
     ]
-    # Heat pump produced/consumed energy data - today's values
+    # Heat pump produced/consumed energy data - today's and longer periods' values
     _LIST_HP_ENERGY = [
         _PARAM_HP_CH_PRODUCED_TODAY,
         _PARAM_HP_DHW_PRODUCED_TODAY,
@@ -262,7 +332,56 @@ class AristonHandler:
         _PARAM_HP_TOTAL_PRODUCED_TODAY,
         _PARAM_HP_TOTAL_CONSUMED_TODAY,
         _PARAM_HP_TOTAL_COP,
+        _PARAM_HP_TOTAL_PRODUCED_THIS_WEEK,
+        _PARAM_HP_TOTAL_CONSUMED_THIS_WEEK,
+        _PARAM_HP_TOTAL_COP_THIS_WEEK,
+        _PARAM_HP_TOTAL_PRODUCED_LAST_WEEK,
+        _PARAM_HP_TOTAL_CONSUMED_LAST_WEEK,
+        _PARAM_HP_TOTAL_COP_LAST_WEEK,
+        _PARAM_HP_TOTAL_PRODUCED_THIS_MONTH,
+        _PARAM_HP_TOTAL_CONSUMED_THIS_MONTH,
+        _PARAM_HP_TOTAL_COP_THIS_MONTH,
+        _PARAM_HP_TOTAL_PRODUCED_LAST_MONTH,
+        _PARAM_HP_TOTAL_CONSUMED_LAST_MONTH,
+        _PARAM_HP_TOTAL_COP_LAST_MONTH,
+        _PARAM_HP_TOTAL_PRODUCED_THIS_YEAR,
+        _PARAM_HP_TOTAL_CONSUMED_THIS_YEAR,
+        _PARAM_HP_TOTAL_COP_THIS_YEAR,
+        _PARAM_HP_TOTAL_PRODUCED_LAST_YEAR,
+        _PARAM_HP_TOTAL_CONSUMED_LAST_YEAR,
+        _PARAM_HP_TOTAL_COP_LAST_YEAR,
     ]
+    # Metering tab and series of today's energy sensors
+    _MAP_HP_ENERGY_TODAY = {
+        _PARAM_HP_CH_PRODUCED_TODAY: ('ProducedEnergy', 'Heating'),
+        _PARAM_HP_DHW_PRODUCED_TODAY: ('ProducedEnergy', 'Dhw'),
+        _PARAM_HP_CH_CONSUMED_TODAY: ('ConsumedElectricity', 'Heating'),
+        _PARAM_HP_DHW_CONSUMED_TODAY: ('ConsumedElectricity', 'Dhw'),
+    }
+    # Produced and consumed energy sensors of circuit COP sensors
+    _MAP_HP_COP = {
+        _PARAM_HP_CH_COP: (_PARAM_HP_CH_PRODUCED_TODAY, _PARAM_HP_CH_CONSUMED_TODAY),
+        _PARAM_HP_DHW_COP: (_PARAM_HP_DHW_PRODUCED_TODAY, _PARAM_HP_DHW_CONSUMED_TODAY),
+    }
+    # CH and DHW energy sensors of total energy sensors
+    _MAP_HP_ENERGY_TOTAL = {
+        _PARAM_HP_TOTAL_PRODUCED_TODAY: (_PARAM_HP_CH_PRODUCED_TODAY, _PARAM_HP_DHW_PRODUCED_TODAY),
+        _PARAM_HP_TOTAL_CONSUMED_TODAY: (_PARAM_HP_CH_CONSUMED_TODAY, _PARAM_HP_DHW_CONSUMED_TODAY),
+    }
+    # Metering periods with daily and monthly energy history
+    _HP_ENERGY_CURRENT_MONTH = 'CurrentMonth'
+    _HP_ENERGY_LAST_MONTH = 'LastMonth'
+    _HP_ENERGY_CURRENT_YEAR = 'CurrentYear'
+    _HP_ENERGY_LAST_YEAR = 'LastYear'
+    # Metering periods other than current day and their total produced, consumed and COP sensors
+    _MAP_HP_ENERGY_PERIOD_SENSORS = {
+        'CurrentWeek': (_PARAM_HP_TOTAL_PRODUCED_THIS_WEEK, _PARAM_HP_TOTAL_CONSUMED_THIS_WEEK, _PARAM_HP_TOTAL_COP_THIS_WEEK),
+        'LastWeek': (_PARAM_HP_TOTAL_PRODUCED_LAST_WEEK, _PARAM_HP_TOTAL_CONSUMED_LAST_WEEK, _PARAM_HP_TOTAL_COP_LAST_WEEK),
+        _HP_ENERGY_CURRENT_MONTH: (_PARAM_HP_TOTAL_PRODUCED_THIS_MONTH, _PARAM_HP_TOTAL_CONSUMED_THIS_MONTH, _PARAM_HP_TOTAL_COP_THIS_MONTH),
+        _HP_ENERGY_LAST_MONTH: (_PARAM_HP_TOTAL_PRODUCED_LAST_MONTH, _PARAM_HP_TOTAL_CONSUMED_LAST_MONTH, _PARAM_HP_TOTAL_COP_LAST_MONTH),
+        _HP_ENERGY_CURRENT_YEAR: (_PARAM_HP_TOTAL_PRODUCED_THIS_YEAR, _PARAM_HP_TOTAL_CONSUMED_THIS_YEAR, _PARAM_HP_TOTAL_COP_THIS_YEAR),
+        _HP_ENERGY_LAST_YEAR: (_PARAM_HP_TOTAL_PRODUCED_LAST_YEAR, _PARAM_HP_TOTAL_CONSUMED_LAST_YEAR, _PARAM_HP_TOTAL_COP_LAST_YEAR),
+    }
 
     # reverse mapping of Android api to sensor names
     _MAP_ARISTON_API_TO_PARAM = {value: key for key, value in _MAP_ARISTON_ZONE_0_PARAMS.items()}
@@ -305,10 +424,35 @@ class AristonHandler:
     def append_param(sensor, multizone_map, final_list):
         if sensor in multizone_map:
             for zone in range(1, 7):
-                final_list.append(f'{sensor}_zone{zone}')
+                final_list.append(sys.intern(f'{sensor}_zone{zone}'))
         else:
             final_list.append(sensor)
 
+    # Zoned sensor names indexed by zone 0-9 (interned, so the same strings are used everywhere)
+    # and sensor and zone of each zoned name with zone 1-9
+    _MAP_ZONE_SENSOR_NAMES = {}
+    _MAP_ZONE_SENSOR_SPLIT = {}
+    for sensor in _MAP_ARISTON_MULTIZONE_PARAMS:
+        _MAP_ZONE_SENSOR_NAMES[sensor] = []
+        for zone in range(10):
+            _MAP_ZONE_SENSOR_NAMES[sensor].append(sys.intern(f'{sensor}_zone{zone}'))
+            if zone:
+                _MAP_ZONE_SENSOR_SPLIT[_MAP_ZONE_SENSOR_NAMES[sensor][zone]] = (sensor, zone)
+        _MAP_ZONE_SENSOR_NAMES[sensor] = tuple(_MAP_ZONE_SENSOR_NAMES[sensor])
+    _MAP_ZONE_SENSOR_NAMES = MappingProxyType(_MAP_ZONE_SENSOR_NAMES)
+    _MAP_ZONE_SENSOR_SPLIT = MappingProxyType(_MAP_ZONE_SENSOR_SPLIT)
+
+    # Parameters set together by one API call
+    _SET_GROUP_CH_TEMPERATURES = [
+        _PARAM_CH_SET_TEMPERATURE,
+        _PARAM_CH_COMFORT_TEMPERATURE,
+        _PARAM_CH_ECONOMY_TEMPERATURE,
+    ]
+    _SET_GROUP_DHW_TEMPERATURES = [
+        _PARAM_DHW_COMFORT_TEMPERATURE,
+        _PARAM_DHW_ECONOMY_TEMPERATURE,
+    ]
+
     _SENSOR_SET_LIST = []
     for sensor in _SENSOR_SET_LIST_TEMP:
         append_param(sensor, _MAP_ARISTON_MULTIZONE_PARAMS, _SENSOR_SET_LIST)
@@ -340,19 +484,33 @@ class AristonHandler:
         for sensor in sensor_list:
             _MAP_SENSOR_TO_REQUEST[sensor] = request
 
-    # Priority lists of requests (first list is High prio and second is Low prio)
-    _REQUESTS_SEQUENCE = [
-        [
-            _REQUEST_MAIN,
-            _REQUEST_ADDITIONAL,
-            _REQUEST_ERRORS
-        ],
-        [
-            _REQUEST_CH_SCHEDULE,
-            _REQUEST_DHW_SCHEDULE,
-            _REQUEST_HP_ENERGY
-        ]
-    ]
+    # Heat pump energy is reported in 2-hour slots, it is read shortly after a slot closes and retried
+    # a few times until the closed slot is reported
+    _HP_ENERGY_SLOT_HOURS = 2
+    _HP_ENERGY_DELAY_SECONDS = 300
+    _HP_ENERGY_RETRY_SECONDS = 120
+    _HP_ENERGY_MAX_ATTEMPTS = 5
+    _HP_ENERGY_CURRENT_DAY = 'CurrentDay'
+    # Metering periods read from heat pump energy data
+    _HP_ENERGY_PERIODS = frozenset([_HP_ENERGY_CURRENT_DAY, *_MAP_HP_ENERGY_PERIOD_SENSORS])
+    # Metering series read from heat pump energy data
+    _HP_ENERGY_SERIES = set()
+    for period in _HP_ENERGY_PERIODS:
+        for tab, series in _MAP_HP_ENERGY_TODAY.values():
+            _HP_ENERGY_SERIES.add((tab, period, series))
+
+    # Scheduling of requests: period in seconds, priority when several requests are due (lower is sent first)
+    # and maximum random delay in seconds added to the period to spread requests
+    _REQUESTS_SCHEDULE = {
+        _REQUEST_MAIN: (_GET_SENSORS_PERIOD_SECONDS, 0, 0),
+        _REQUEST_ADDITIONAL: (300, 1, 15),
+        _REQUEST_ERRORS: (300, 2, 15),
+        _REQUEST_HP_ENERGY: (_HP_ENERGY_SLOT_HOURS * 3600, 3, 60),
+        _REQUEST_CH_SCHEDULE: (3600, 4, 120),
+        _REQUEST_DHW_SCHEDULE: (3600, 4, 120),
+    }
+    # Minimum time between two consecutive requests
+    _REQUESTS_SPACING_SECONDS = 5
 
     # Keys used in structures
     _VALUE = 'value'
@@ -366,6 +524,12 @@ class AristonHandler:
     _ATTRIBUTES = "attributes"
     _ATTEMPT = "attempt"
 
+    # Kinds of request errors
+    _ERROR_AUTH = "auth"
+    _ERROR_THROTTLING = "throttling"
+    _ERROR_TRANSPORT = "transport"
+    _ERROR_OTHER = "other"
+
     # Values data for data mapping from received data to readable format
     _WEEKDAYS = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
     _ON = "ON"
@@ -382,18 +546,15 @@ class AristonHandler:
         return self._MAP_SENSOR_TO_REQUEST[sensor]
 
     def _zone_sensor_name(self, sensor, zone):
-        if sensor in self._MAP_ARISTON_MULTIZONE_PARAMS:
-            return f'{sensor}_zone{zone}'
-        else:
+        zone_names = self._MAP_ZONE_SENSOR_NAMES.get(sensor)
+        if zone_names is None:
             return sensor
+        if 0 <= zone < len(zone_names):
+            return zone_names[zone]
+        return f'{sensor}_zone{zone}'
 
     def _zone_sensor_split(self, sensor):
-        match = re.search('_zone[1-9]$', sensor)
-        if match:
-            origial = re.sub('_zone[1-9]$', '', sensor)
-            if origial in self._MAP_ARISTON_MULTIZONE_PARAMS:
-                return origial, int(sensor[-1])
-        return sensor, 0
+        return self._MAP_ZONE_SENSOR_SPLIT.get(sensor, (sensor, 0))
 
     def _reset_sensor(self, sensor):
         self._ariston_sensors[sensor] = dict()
@@ -417,6 +578,12 @@ class AristonHandler:
                  set_max_retries: int = _MAX_RETRIES,
                  gw: str = "",
                  max_zones: int = 6,
+                 request_intervals: dict = None,
+                 hp_energy_delay: int = _HP_ENERGY_DELAY_SECONDS,
+                 set_debounce: float = _SET_DEBOUNCE_SECONDS,
+                 set_confirm_delay: float = _SET_CONFIRM_DELAY_SECONDS,
+                 login_state: dict = None,
+                 login_state_saver=None,
                  ) -> None:
         """
         Initialize API.
@@ -424,6 +591,9 @@ class AristonHandler:
         if sensors is None:
             sensors = list()
 
+        if request_intervals is None:
+            request_intervals = dict()
+
         if not isinstance(sensors, list):
             raise Exception("Invalid sensors type")
 
@@ -439,6 +609,18 @@ class AristonHandler:
         if not isinstance(set_max_retries, int) or set_max_retries < 1:
             raise Exception(f"At least 1 retry to set data is expected")
 
+        if not isinstance(set_debounce, (int, float)) or set_debounce < 0:
+            raise Exception(f"Debounce time to set data must be a positive number")
+
+        if set_confirm_delay is not None and (not isinstance(set_confirm_delay, (int, float)) or set_confirm_delay <= 0):
+            raise Exception(f"Delay to confirm set data must be a positive number")
+
+        for request, period in request_intervals.items():
+            if request not in self._REQUESTS_SCHEDULE or request == self._REQUEST_HP_ENERGY:
+                raise Exception(f"Unsupported request {request}")
+            if not isinstance(period, (int, float)) or period < self._GET_SENSORS_PERIOD_SECONDS:
+                raise Exception(f"Period to get {request} must be a number higher than {self._GET_SENSORS_PERIOD_SECONDS}")
+
         """
         Logging settings
         """
@@ -455,6 +637,12 @@ class AristonHandler:
 
         self._max_zones = max_zones
 
+        if not isinstance(hp_energy_delay, (int, float)) or hp_energy_delay < 0 or \
+                hp_energy_delay >= self._HP_ENERGY_SLOT_HOURS * 3600:
+            raise Exception(f"Heat pump energy delay must be a number of seconds within {self._HP_ENERGY_SLOT_HOURS} hours")
+
+        self._hp_energy_delay = hp_energy_delay
+
         # Cache manifest version for the integration (loaded lazily)
         self._manifest_version = None
         self._manifest_path = os.path.join(os.path.dirname(__file__), "manifest.json")
@@ -471,40 +659,58 @@ class AristonHandler:
         self._get_period_time = period_get_request
         self._set_period_time = period_set_request
         self._max_set_retries = set_max_retries
+        self._set_debounce = set_debounce
+        self._set_confirm_delay = set_confirm_delay
+        self._login_state = login_state
+        self._login_state_saver = login_state_saver
+        # Login generation of the client seen by last login
+        self._account_generation = 0
 
         # clear read sensor values
         self._ariston_sensors = dict()
-        self._subscribed_sensors_old_value = dict()
         for sensor in self._SENSOR_LIST:
             if sensor in self._MAP_ARISTON_MULTIZONE_PARAMS:
                 for zone in range(1, self._max_zones + 1):
                     ch_sensor = self._zone_sensor_name(sensor, zone=zone)
                     self._reset_sensor(ch_sensor)
-                    self._subscribed_sensors_old_value[ch_sensor] = None
             else:
                 self._reset_sensor(sensor)
-                self._subscribed_sensors_old_value[sensor] = None
+
+        # read-only snapshot of sensors shared with all readers, replaced as a whole on each update
+        self._sensor_snapshot = (0, MappingProxyType({}))
+        self._publish_sensor_values()
         
         # clear configuration data
         self._set_param = {}
+        # Values accepted by the server but not read back yet
+        self._written_values = {}
+        # Requests with values accepted in current setting and requests waiting for confirmation read with attempt
+        self._confirm_requests = set()
+        self._confirm_attempts = {}
         self._features = {}
         self._main_data = {}
         self._additional_data = {}
+        # Items of the responses indexed by (parameter, zone) and by parameter
+        self._main_index = {}
+        self._additional_index = {}
         self._error_data = {}
         self._ch_schedule_data = {}
         self._dhw_schedule_data = {}
         self._hp_energy_data = {}
+        self._hp_energy_date = None
         self._zones = []
 
         self._last_dhw_storage_temp = None
         self._reset_set_requests()
 
         # initiate all other data
-        self._errors = 0
+        self._circuits = self._create_circuits()
         self._data_lock = threading.Lock()
         self._lock = threading.Lock()
         self._plant_id_lock = threading.Lock()
-        self._api_client = AristonApiClient(self._LOGGER)
+        self._api_client = self._create_api_client()
+        # Client logins again when session expires
+        self._api_client.set_credentials(username, password)
         self._login = False
         self._plant_id = ""
         self._started = False
@@ -512,64 +718,110 @@ class AristonHandler:
         self._ch_available = False
         self._dhw_available = False
         self._changing_data = False
-        self._timer_periodic_read = threading.Timer(0, self._queue_get_data)
-        self._timer_queue_delay = threading.Timer(0, self._control_availability_state, [self._REQUEST_MAIN])
+        self._data_stale = False
+        self._read_thread = None
+        self._stop_event = threading.Event()
         self._timer_set_delay = threading.Timer(0, self._preparing_setting_http_data)
+        self._confirm_timers = {}
 
         self._other_parameters = []
         for sensor in self._LIST_ARISTON_WEB_PARAMS:
             if sensor in sensors:
                 self._other_parameters.append(self._MAP_ARISTON_WEB_MENU_PARAMS[sensor])
-        
-        # List of requests. First list is high priority requests and second list is low priority requests.
-        # It affects frequency of the requests
-        self._requests_lists = copy.deepcopy(self._REQUESTS_SEQUENCE)
 
+        # Metering periods with configured sensors and heat pump energy series read for them,
+        # today's series are always read for totals, COP and slot alignment
+        self._hp_energy_periods = [
+            period for period, params in self._MAP_HP_ENERGY_PERIOD_SENSORS.items()
+            if not sensors or any(param in sensors for param in params)]
+        self._hp_energy_keys = frozenset(
+            key for key in self._HP_ENERGY_SERIES
+            if key[1] == self._HP_ENERGY_CURRENT_DAY or key[1] in self._hp_energy_periods)
+
+        # Main data items to be read, all of them if sensors are not specified
+        main_sensors = self._main_sensors(sensors)
+        self._main_zone_0_params = [param for sensor, param in self._MAP_ARISTON_ZONE_0_PARAMS.items()
+                                    if sensor in main_sensors]
+        self._main_multizone_params = [param for sensor, param in self._MAP_ARISTON_MULTIZONE_PARAMS.items()
+                                       if sensor in main_sensors]
+        # Items of main request built for zones
+        self._main_items = ((), [])
+        # Encoded bodies of requests, built again after login
+        self._request_bodies = {}
+        
+        # Period, priority and jitter of each request. Period of main request is period to get data.
+        self._requests_schedule = dict()
         # If sensors are specified, prune requests that have no selected sensors
         self._LOGGER.debug(f"Configured sensors: {sensors}")
-        for request, sensor_list in self._MAP_REQUEST.items():
+        for request, (period, priority, jitter) in self._REQUESTS_SCHEDULE.items():
             if request != self._REQUEST_MAIN:
                 # Main requests cannot be removed
+                sensor_list = self._MAP_REQUEST[request]
                 has_any = any(item in sensors for item in sensor_list)
                 if not has_any:
                     self._LOGGER.debug(
                         f"Removing request '{request}' — no matching sensors in {sensor_list}")
-                    if request in self._requests_lists[0]:
-                        self._requests_lists[0].remove(request)
-                    if request in self._requests_lists[1]:
-                        self._requests_lists[1].remove(request)
-
-        # At least 1 main request is present
-        self._last_request = self._requests_lists[0][-1]
-        if self._requests_lists[1]:
-            # there are requests in low prio
-            self._last_request_low_prio = self._requests_lists[1][-1]
-        else:
-            # no requests in low prio
-            self._last_request_low_prio = None
+                    continue
+            else:
+                period = self._get_period_time
+            period = request_intervals.get(request, period)
+            self._requests_schedule[request] = (period, priority, jitter)
+
+        # Min-heap of (due time, priority, request) with due times of requests.
+        # Entries not matching self._requests_due are outdated and skipped.
+        self._requests_due = dict()
+        self._requests_heap = []
+        # Heat pump energy slot alignment: slot of current read attempts, slot for which closed data was read
+        # and values of the open slot to detect closing of the slot
+        self._hp_energy_attempts = 0
+        self._hp_energy_attempts_slot = None
+        self._hp_energy_read_slot = None
+        self._hp_energy_open_slot_values = None
+        self._last_request = self._REQUEST_MAIN
+        now = time.monotonic()
+        for index, request in enumerate(sorted(self._requests_schedule, key=lambda item: self._requests_schedule[item][1])):
+            # Spread initial requests after the main request
+            self._schedule_request(request, now + index * self._REQUESTS_SPACING_SECONDS)
 
         self._LOGGER.debug(
-            f"Requests configured. High-priority: {self._requests_lists[0]} | Low-priority: {self._requests_lists[1]}")
+            f"Requests configured (period, priority, jitter): {self._requests_schedule}")
         self._subscribed = list()
         self._subscribed_args = list()
         self._subscribed_kwargs = list()
-        self._subscribed_thread = None
 
         self._subscribed2 = list()
         self._subscribed2_args = list()
         self._subscribed2_kwargs = list()
-        self._subscribed2_thread = None
+
+        # Queue of notifications for subscribers in order of changes, one entry per subscriber
+        # as later changes are merged into the queued entry, so it is bounded by number of subscribers
+        self._notify_condition = threading.Condition()
+        self._notify_queue = collections.OrderedDict()
+        self._notify_scheduled = False
+        self._notify_stats = {
+            "queue_depth": 0,
+            "max_queue_depth": 0,
+            "queued": 0,
+            "coalesced": 0,
+            "delivered": 0,
+        }
 
         self._LOGGER.info("API initiated")
 
 
+    def _create_api_client(self):
+        """Create client for HTTP communication"""
+        return AristonApiClient(self._LOGGER)
+
+
     def subscribe_sensors(self, func, *args, **kwargs):
         """
         Subscribe to change of sensors value in:
             - sensor_values
 
-        Function will be called when sensors' values are being changed.
-        Actual changed values are being returned as a dictionary in a first argument.
+        Function will be called when sensors' values or their metadata are being changed.
+        Changed sensors are being returned as a dictionary in a first argument, each with
+        'value' and changed keys only (e.g. 'units', 'options', 'attributes').
         """
         self._subscribed.append(func)
         self._subscribed_args.append(args)
@@ -592,24 +844,55 @@ class AristonHandler:
         self._subscribed2_kwargs.append(kwargs)
 
 
-    def _subscribers_sensors_inform(self):
+    def _publish_sensor_values(self, sensors=None):
         """
-        Inform subscribers about changed sensors
-        first argument is a dictionary of changed sensors
+        Publish read-only snapshot of sensors and return changes since the previous snapshot.
+        Only records of changed sensors are copied, other records are shared with the previous snapshot.
+        'sensors' limits the check to the written sensors, None checks all sensors.
         """
-
+        old_snapshot = self._sensor_snapshot[1]
+        snapshot = None
         changed_data = dict()
+        if sensors is None:
+            sensors = self._ariston_sensors
+        for sensor in sensors:
+            data = self._ariston_sensors.get(sensor)
+            if data is None:
+                continue
+            old_record = old_snapshot.get(sensor)
+            if old_record is None:
+                delta = dict(data)
+            else:
+                delta = {key: value for key, value in data.items() if value != old_record.get(key)}
+                if not delta:
+                    continue
+            record = dict(data)
+            record[self._ATTRIBUTES] = MappingProxyType(dict(data[self._ATTRIBUTES]))
+            if self._ATTRIBUTES in delta:
+                delta[self._ATTRIBUTES] = record[self._ATTRIBUTES]
+            delta[self._VALUE] = record[self._VALUE]
+            changed_data[sensor] = delta
+            if snapshot is None:
+                snapshot = dict(old_snapshot)
+            snapshot[sensor] = MappingProxyType(record)
+        if snapshot is not None:
+            # Single assignment keeps generation and values consistent for readers in other threads
+            self._sensor_snapshot = (self._sensor_snapshot[0] + 1, MappingProxyType(snapshot))
+        return changed_data
+
+
+    def _subscribers_sensors_inform(self, sensors=None):
+        """
+        Inform subscribers about changed sensors
+        first argument is a dictionary of changed sensors with value and changed metadata
+        'sensors' are sensors written by the update, None checks all sensors
+        """
 
-        for sensor in self._ariston_sensors:
-            if self._ariston_sensors[sensor][self._VALUE] != self._subscribed_sensors_old_value[sensor]:
-                self._subscribed_sensors_old_value[sensor] = self._ariston_sensors[sensor][self._VALUE]
-                changed_data[sensor] = copy.deepcopy(self._ariston_sensors[sensor])
+        changed_data = self._publish_sensor_values(sensors)
 
         if changed_data:
-            for iteration in range(len(self._subscribed)):
-                self._subscribed_thread = threading.Timer(
-                    self._TIME_SPLIT, self._subscribed[iteration], args=(changed_data, *self._subscribed_args[iteration]), kwargs=self._subscribed_kwargs[iteration])
-                self._subscribed_thread.start()
+            self._notify_subscribers(
+                "sensors", self._subscribed, self._subscribed_args, self._subscribed_kwargs, changed_data)
 
 
     def _subscribers_statuses_inform(self):
@@ -618,10 +901,14 @@ class AristonHandler:
         old_ch_available = self._ch_available
         old_dhw_available = self._dhw_available
         old_changing = self._changing_data
+        old_stale = self._data_stale
 
         changed_data = dict()
 
-        self._available = self._errors <= self._MAX_ERRORS and self._login and self._plant_id != "" and self._main_data != {}
+        # Last known data are kept while main request fails, they are stale until read again
+        main_failures = self._circuits[self._REQUEST_MAIN].failures
+        self._available = main_failures < self._CIRCUIT_FAILURES and self._plant_id != "" and self._main_data != {}
+        self._data_stale = self._available and main_failures > 0
 
         if self._available and self._main_data != {} and \
             self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, 1)][self._VALUE] != None:
@@ -652,15 +939,80 @@ class AristonHandler:
         if old_changing != self._changing_data:
             changed_data['setting_data'] = self._changing_data
 
+        if old_stale != self._data_stale:
+            changed_data['data_stale'] = self._data_stale
+
         if changed_data:
-            for iteration in range(len(self._subscribed2)):
-                self._subscribed2_thread = threading.Timer(
-                    self._TIME_SPLIT, self._subscribed2[iteration], args=(changed_data, *self._subscribed2_args[iteration]), kwargs=self._subscribed2_kwargs[iteration])
-                self._subscribed2_thread.start()
+            self._notify_subscribers(
+                "statuses", self._subscribed2, self._subscribed2_args, self._subscribed2_kwargs, changed_data)
+
+
+    def _notify_subscribers(self, kind, subscribed, subscribed_args, subscribed_kwargs, changed_data):
+        """Queue notification of subscribers, changes are merged into notification still waiting in the queue"""
+        with self._notify_condition:
+            for index, func in enumerate(subscribed):
+                key = (kind, index)
+                self._notify_stats["queued"] += 1
+                queued = self._notify_queue.get(key)
+                if queued is None:
+                    self._notify_queue[key] = (func, changed_data, subscribed_args[index], subscribed_kwargs[index])
+                else:
+                    # Entry keeps its position in the queue
+                    self._notify_stats["coalesced"] += 1
+                    merged = dict(queued[1])
+                    for name, change in changed_data.items():
+                        if kind == "sensors" and name in merged:
+                            merged[name] = {**merged[name], **change}
+                        else:
+                            merged[name] = change
+                    self._notify_queue[key] = (func, merged, queued[2], queued[3])
+            depth = len(self._notify_queue)
+            self._notify_stats["queue_depth"] = depth
+            self._notify_stats["max_queue_depth"] = max(self._notify_stats["max_queue_depth"], depth)
+            if depth and not self._notify_scheduled:
+                self._notify_scheduled = True
+                self._schedule_notifications()
+            self._notify_condition.notify()
+
+
+    def _schedule_notifications(self):
+        """Start dispatcher thread delivering queued notifications (called with the queue locked)"""
+        threading.Thread(target=self._dispatch_notifications, name="ariston_notifications", daemon=True).start()
+
+
+    def _dispatch_notifications(self):
+        """Deliver queued notifications until the queue stays empty for the idle period"""
+        while True:
+            with self._notify_condition:
+                if not self._notify_queue:
+                    self._notify_condition.wait(self._NOTIFY_IDLE_SECONDS)
+                if not self._notify_queue:
+                    self._notify_scheduled = False
+                    return
+                notifications = self._take_notifications()
+            self._deliver_notifications(notifications)
+
+
+    def _take_notifications(self):
+        """Remove all notifications from the queue (called with the queue locked)"""
+        notifications = list(self._notify_queue.values())
+        self._notify_queue.clear()
+        self._notify_stats["queue_depth"] = 0
+        return notifications
+
+
+    def _deliver_notifications(self, notifications):
+        """Call subscribers"""
+        for func, changed_data, args, kwargs in notifications:
+            try:
+                func(changed_data, *args, **kwargs)
+            except Exception as ex:
+                self._LOGGER.warning(f"Subscriber {func} failed: {ex}")
+            with self._notify_condition:
+                self._notify_stats["delivered"] += 1
 
 
-    def _json_validator(self, data, request_type):
-        json_data = data.json()
+    def _json_validator(self, json_data, request_type):
         try:
             if isinstance(json_data, dict):
                 if json_data == {}:
@@ -734,17 +1086,63 @@ class AristonHandler:
 
 
     @property
-    def sensor_values(self) -> dict:
+    def sensor_values(self) -> Mapping:
         """
-        Return dictionary of sensors and their values.
+        Return read-only mapping of sensors and their values.
 
         'value' key is used to fetch value of the specific sensor/parameter.
         Some sensors/parameters might return dictionaries.
 
         'units' key is used to fetch units of measurement for specific sensor/parameter.
 
+        Mapping is a snapshot which is never modified, new snapshot is published after data update.
+        Use 'sensor_values_generation' to check if snapshot has changed since the last read.
         """
-        return copy.deepcopy(self._ariston_sensors)
+        return self._sensor_snapshot[1]
+
+
+    @property
+    def sensor_values_generation(self) -> int:
+        """Return generation number of the 'sensor_values' snapshot, increased on each published update."""
+        return self._sensor_snapshot[0]
+
+
+    @property
+    def sensor_snapshot(self) -> tuple:
+        """Return generation number and 'sensor_values' snapshot as a consistent pair."""
+        return self._sensor_snapshot
+
+
+    @property
+    def hp_energy_date(self) -> datetime.date:
+        """Return local date of the last heat pump energy read, None before the first read."""
+        return self._hp_energy_date
+
+
+    @property
+    def notification_stats(self) -> dict:
+        """
+        Return statistics of subscriber notifications:
+            - 'queue_depth' is number of notifications waiting in the queue;
+            - 'max_queue_depth' is highest number of waiting notifications;
+            - 'queued' is number of queued notifications;
+            - 'coalesced' is number of notifications merged into waiting ones;
+            - 'delivered' is number of subscriber calls.
+        """
+        with self._notify_condition:
+            return dict(self._notify_stats)
+
+
+    @property
+    def latency_stats(self) -> dict:
+        """
+        Return latencies of requests per endpoint:
+            - 'count' is number of replies in the rolling window;
+            - 'p50', 'p90', 'p99' are percentiles in seconds (upper bounds of histogram buckets);
+            - 'buckets' is number of replies per bucket upper bound in seconds;
+            - 'connect_timeout' and 'read_timeout' are timeouts in seconds used for the endpoint.
+        """
+        return self._api_client.latency_stats
 
 
     @property
@@ -753,6 +1151,73 @@ class AristonHandler:
         return self._changing_data
 
 
+    @property
+    def data_stale(self) -> bool:
+        """Return if last read of main data failed and last known values are shown."""
+        return self._data_stale
+
+
+    @property
+    def circuit_stats(self) -> dict:
+        """
+        Return circuit of each request:
+            - 'state' is closed (requests sent), open (requests paused) or half_open (trial request sent);
+            - 'failures' is number of consecutive failures;
+            - 'last_error' is kind of last error (auth, throttling, transport, other);
+            - 'retry_in' is number of seconds until paused requests are sent again.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {request: circuit.as_dict(now) for request, circuit in self._circuits.items()}
+
+
+    def hp_energy_history(self, sensor, today=None) -> list:
+        """
+        Return closed energy buckets of today's heat pump energy sensor from last metering read
+        as (first day, day after last day, kWh), oldest first.
+
+        Days of previous and current month are used, months of last and current year before them.
+        """
+        tab, series = self._MAP_HP_ENERGY_TODAY[sensor]
+        if today is None:
+            today = datetime.date.today()
+        this_month = today.replace(day=1)
+        last_month = (this_month - datetime.timedelta(days=1)).replace(day=1)
+
+        def add_months(first_day, months):
+            month = first_day.month - 1 + months
+            return datetime.date(first_day.year + month // 12, month % 12 + 1, 1)
+
+        histogram_data = self._hp_energy_data.get('data', {}).get('asKwhRaw', {}).get('histogramData', [])
+        hp_energy_series = self._index_hp_energy(histogram_data, {
+            (tab, period, series) for period in (
+                self._HP_ENERGY_LAST_YEAR, self._HP_ENERGY_CURRENT_YEAR,
+                self._HP_ENERGY_LAST_MONTH, self._HP_ENERGY_CURRENT_MONTH)})
+
+        history = []
+        for period, first_month in (
+            (self._HP_ENERGY_LAST_YEAR, datetime.date(today.year - 1, 1, 1)),
+            (self._HP_ENERGY_CURRENT_YEAR, datetime.date(today.year, 1, 1)),
+        ):
+            slots, _ = hp_energy_series.get((tab, period, series), ((), {}))
+            for month, energy in enumerate(slots):
+                start = add_months(first_month, month)
+                if start >= last_month:
+                    break
+                history.append((start, add_months(start, 1), energy))
+        for period, first_day in (
+            (self._HP_ENERGY_LAST_MONTH, last_month),
+            (self._HP_ENERGY_CURRENT_MONTH, this_month),
+        ):
+            slots, _ = hp_energy_series.get((tab, period, series), ((), {}))
+            for day, energy in enumerate(slots):
+                start = first_day + datetime.timedelta(days=day)
+                if start >= today or start.month != first_day.month:
+                    break
+                history.append((start, start + datetime.timedelta(days=1), energy))
+        return history
+
+
     @property
     def supported_sensors_get(self) -> set:
         """
@@ -802,44 +1267,100 @@ class AristonHandler:
     def _login_session(self):
         """Login to fetch Ariston Plant ID and confirm login"""
         if not self._login and self._started:
-            # First login
-            self._api_client.login(self._user, self._password)
+            if self._restore_login_state():
+                return
+
+            # First login, session of the account might be logged in already by other handler
+            self._account_generation, gateways = self._api_client.account_login(
+                self._user, self._password, self._account_generation)
 
             # Fetch plant IDs
-            gateways = self._api_client.get_gateways()
-            if self._default_gw:
-                if self._default_gw not in gateways:
-                    self._LOGGER.error(f'Specified gateway {self._default_gw} not found in {gateways}')
-                    raise Exception(f'Specified gateway {self._default_gw} not found in {gateways}')
-                else:
-                    plant_id = self._default_gw
-            else:
-                if len(gateways) == 0:
-                    self._LOGGER.error(f'At least one gateway is expected to be found')
-                    raise Exception(f'At least one gateway is expected to be found')
-                # Use first plant plant id
-                plant_id = gateways[0]
+            plant_id = self._select_plant_id(gateways)
 
             features = self._api_client.get_plant_features(plant_id)
-            if plant_id:
-                with self._plant_id_lock:
-                    self._features = copy.deepcopy(features)
-                    if self._features["zones"]:
-                        zones = [item["num"] for item in self._features["zones"] if item["num"] <= self._max_zones]
-                        if not zones:
-                            zones = list(range(1, self._max_zones + 1))
-                        self._zones = zones
-                    if not self._zones:
-                        self._zones = list(range(1, self._max_zones + 1))
-                    self._plant_id = plant_id
-                    self._gw_name = plant_id + '_'
-                    self._login = True
-                    self._LOGGER.info(f'Plant ID is {self._plant_id}')
+            self._store_login_data(plant_id, features)
+            self._save_login_state()
         return
 
 
+    def _restore_login_state(self):
+        """Reuse saved login state if it is not expired, returns True if restored"""
+        login_state, self._login_state = self._login_state, None
+        if not login_state or self._api_client.login_generation:
+            # Session shared with other handlers is logged in already
+            return False
+        try:
+            valid = login_state["user"] == self._user and \
+                time.time() - login_state["saved"] < self._LOGIN_STATE_TTL_SECONDS and \
+                (not self._default_gw or login_state["plant_id"] == self._default_gw)
+            if valid:
+                self._account_generation = self._api_client.import_cookies(login_state["cookies"])
+                self._store_login_data(login_state["plant_id"], login_state["features"])
+        except (KeyError, TypeError) as ex:
+            self._LOGGER.warning(f"Saved login state is not valid: {ex}")
+            return False
+        if valid:
+            self._LOGGER.info("Saved login state restored")
+        return valid
+
+
+    def _save_login_state(self):
+        """Pass login state to be saved"""
+        if self._login_state_saver is None:
+            return
+        try:
+            self._login_state_saver({
+                "user": self._user,
+                "saved": time.time(),
+                "plant_id": self._plant_id,
+                "features": self._features,
+                "cookies": self._api_client.export_cookies(),
+            })
+        except Exception as ex:
+            self._LOGGER.warning(f"Problem to save login state: {ex}")
+
+
+    def _select_plant_id(self, gateways):
+        """Select plant ID among available gateways"""
+        if self._default_gw:
+            if self._default_gw not in gateways:
+                self._LOGGER.error(f'Specified gateway {self._default_gw} not found in {gateways}')
+                raise Exception(f'Specified gateway {self._default_gw} not found in {gateways}')
+            else:
+                plant_id = self._default_gw
+        else:
+            if len(gateways) == 0:
+                self._LOGGER.error(f'At least one gateway is expected to be found')
+                raise Exception(f'At least one gateway is expected to be found')
+            # Use first plant plant id
+            plant_id = gateways[0]
+        return plant_id
+
+
+    def _store_login_data(self, plant_id, features):
+        """Store plant features and zones and confirm login"""
+        if plant_id:
+            with self._plant_id_lock:
+                self._features = features
+                if self._features["zones"]:
+                    zones = [item["num"] for item in self._features["zones"] if item["num"] <= self._max_zones]
+                    if not zones:
+                        zones = list(range(1, self._max_zones + 1))
+                    self._zones = zones
+                if not self._zones:
+                    self._zones = list(range(1, self._max_zones + 1))
+                self._plant_id = plant_id
+                self._gw_name = plant_id + '_'
+                self._request_bodies = {}
+                self._login = True
+                self._LOGGER.info(f'Plant ID is {self._plant_id}')
+
+
     def _get_visible_sensor_value(self, sensor):
         value = self._get_sensor_value(sensor)
+        if sensor in self._written_values and (sensor not in self._set_param or value == self._written_values[sensor]):
+            # Read value replaces the written one
+            del self._written_values[sensor]
         if sensor in self._set_param:
             if value == self._set_param[sensor][self._VALUE]:
                 # Value is assumed to be set
@@ -853,31 +1374,61 @@ class AristonHandler:
         return value
 
 
+    def _confirmed_sensor_value(self, sensor):
+        """Latest value confirmed by the server, either written or read"""
+        if sensor in self._written_values:
+            return self._written_values[sensor]
+        return self._get_sensor_value(sensor)
+
+
+    def _index_main_data(self):
+        """Index items of main data by (parameter, zone), first item is used for duplicates"""
+        index = {}
+        for item in self._main_data["items"]:
+            try:
+                key = (self._MAP_ARISTON_API_TO_PARAM[item["id"]], item["zone"])
+            except Exception as ex:
+                self._LOGGER.warn(f'Issue reading {self._REQUEST_MAIN} {item.get("id")}, {ex}')
+                continue
+            index.setdefault(key, item)
+        self._main_index = index
+
+
+    def _index_additional_data(self):
+        """Index items of additional data by parameter, first item is used for duplicates"""
+        index = {}
+        for item in self._additional_data["data"]:
+            try:
+                key = self._MAP_ARISTON_WEB_TO_PARAM[item["id"]]
+            except Exception as ex:
+                self._LOGGER.warn(f'Issue reading {self._REQUEST_ADDITIONAL} {item.get("id")}, {ex}')
+                continue
+            index.setdefault(key, item)
+        self._additional_index = index
+
+
     def _get_sensor_value(self, sensor):
         value = None
         request_type = self._get_request_for_parameter(sensor)
         if request_type == self._REQUEST_MAIN:
-            original_sensor, zone = self._zone_sensor_split(sensor)
-            for item in self._main_data["items"]:
-                if original_sensor == self._MAP_ARISTON_API_TO_PARAM[item["id"]] and zone == item["zone"]:
-                    value = item["value"]
-                    if "options" in item:
-                        use_index = item["options"].index(int(item["value"]))
-                        if "optTexts" in item:
-                            value = item["optTexts"][use_index]
-                        elif item["options"] == self._OFF_ON_NUMERAL:
-                            value = self._OFF_ON_TEXT[use_index]
-                    break
+            item = self._main_index.get(self._zone_sensor_split(sensor))
+            if item is not None:
+                value = item["value"]
+                if "options" in item:
+                    use_index = item["options"].index(int(item["value"]))
+                    if "optTexts" in item:
+                        value = item["optTexts"][use_index]
+                    elif item["options"] == self._OFF_ON_NUMERAL:
+                        value = self._OFF_ON_TEXT[use_index]
         elif request_type == self._REQUEST_ADDITIONAL:
-            for item in self._additional_data["data"]:
-                if sensor == self._MAP_ARISTON_WEB_TO_PARAM[item["id"]]:
-                    value = item["value"]
-                    if "dropDownOptions" in item and item["dropDownOptions"]:
-                        for option in item["dropDownOptions"]:
-                            if option["value"] == item["value"]:
-                                value = option["text"]
-                                break
-                    break
+            item = self._additional_index.get(sensor)
+            if item is not None:
+                value = item["value"]
+                if "dropDownOptions" in item and item["dropDownOptions"]:
+                    for option in item["dropDownOptions"]:
+                        if option["value"] == item["value"]:
+                            value = option["text"]
+                            break
         return value
 
 
@@ -896,17 +1447,26 @@ class AristonHandler:
         return attributes
     def _store_data(self, resp, request_type=""):
         """Store received dictionary"""
-        if not self._json_validator(resp, request_type):
+        try:
+            # Response is decoded once and stored as is, nothing else refers to the decoded data
+            data = decode_response(resp)
+        except ValueError as ex:
+            self._LOGGER.warning(f"JSON could not be decoded for the request {request_type}: {ex}")
+            raise Exception(f"JSON could not be decoded for the request {request_type}")
+
+        if not self._json_validator(data, request_type):
             self._LOGGER.warning(f"JSON did not pass validation for the request {request_type}")
             raise Exception(f"JSON did not pass validation for the request {request_type}")
 
+        # Sensors written by the response, only they are checked for changes
+        written_sensors = set()
+
         if request_type == self._REQUEST_MAIN:
 
-            self._main_data = copy.deepcopy(resp.json())
-            for item in self._main_data["items"]:
+            self._main_data = data
+            self._index_main_data()
+            for (original_sensor, zone), item in self._main_index.items():
                 try:
-                    original_sensor = self._MAP_ARISTON_API_TO_PARAM[item["id"]]
-                    zone = item["zone"]
                     sensor = self._zone_sensor_name(original_sensor, zone=zone)
                     # Skip zones beyond configured limit
                     if zone > self._max_zones:
@@ -914,7 +1474,7 @@ class AristonHandler:
                     # Create sensor if it doesn't exist yet (dynamically detected zones)
                     if sensor not in self._ariston_sensors:
                         self._reset_sensor(sensor)
-                        self._subscribed_sensors_old_value[sensor] = None
+                    written_sensors.add(sensor)
                     try:
                         self._ariston_sensors[sensor][self._VALUE] = self._get_visible_sensor_value(sensor)
                         if "min" in item:
@@ -926,9 +1486,9 @@ class AristonHandler:
                         if "unit" in item and item["unit"]:
                             self._ariston_sensors[sensor][self._UNITS] = item["unit"]
                         if "options" in item:
-                            self._ariston_sensors[sensor][self._OPTIONS] = copy.deepcopy(item["options"])
+                            self._ariston_sensors[sensor][self._OPTIONS] = list(item["options"])
                             if "optTexts" in item:
-                                self._ariston_sensors[sensor][self._OPTIONS_TXT] = copy.deepcopy(item["optTexts"])
+                                self._ariston_sensors[sensor][self._OPTIONS_TXT] = list(item["optTexts"])
                             elif item["options"] == self._OFF_ON_NUMERAL:
                                 self._ariston_sensors[sensor][self._OPTIONS_TXT] = self._OFF_ON_TEXT
                     except Exception as ex:
@@ -942,6 +1502,7 @@ class AristonHandler:
 
             # Fix min and Max for CH set temperature
             for zone in self._zones:
+                written_sensors.add(self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone))
                 self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone)][self._MIN] = \
                     self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)][self._MIN]
                 self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone)][self._MAX] = \
@@ -951,8 +1512,9 @@ class AristonHandler:
 
         elif request_type == self._REQUEST_ERRORS:
 
-            self._error_data = copy.deepcopy(resp.json())
+            self._error_data = data
             sensor = self._PARAM_ERRORS_COUNT
+            written_sensors.add(sensor)
             try:
                 # TEST DATA BELOW FOR PARSING PURPOSES
                 # self._error_data = [{"gw":"F0AD4E0590BD","timestamp":"2022-07-14T10:55:04","fault":45,"mult":0,"code":"501","pri":1053500,"errDex":"No flame detected","res":False,"blk":True}]
@@ -967,8 +1529,9 @@ class AristonHandler:
 
         elif request_type == self._REQUEST_CH_SCHEDULE:
 
-            self._ch_schedule_data = copy.deepcopy(resp.json())
+            self._ch_schedule_data = data
             sensor = self._PARAM_CH_PROGRAM
+            written_sensors.add(sensor)
             try:
                 self._ariston_sensors[sensor][self._VALUE] = "Available"
                 self._ariston_sensors[sensor][self._ATTRIBUTES] = self._schedule_attributes(self._ch_schedule_data["ChZn1"]["plans"])
@@ -978,8 +1541,9 @@ class AristonHandler:
 
         elif request_type == self._REQUEST_DHW_SCHEDULE:
 
-            self._dhw_schedule_data = copy.deepcopy(resp.json())
+            self._dhw_schedule_data = data
             sensor = self._PARAM_DHW_PROGRAM
+            written_sensors.add(sensor)
             try:
                 self._ariston_sensors[sensor][self._VALUE] = "Available"
                 self._ariston_sensors[sensor][self._ATTRIBUTES] = self._schedule_attributes(self._dhw_schedule_data["Dhw"]["plans"])
@@ -989,11 +1553,12 @@ class AristonHandler:
 
         elif request_type == self._REQUEST_ADDITIONAL:
             
-            self._additional_data = copy.deepcopy(resp.json())
-            for item in self._additional_data["data"]:
+            self._additional_data = data
+            self._index_additional_data()
+            for sensor, item in self._additional_index.items():
                 try:
-                    sensor = self._MAP_ARISTON_WEB_TO_PARAM[item["id"]]
                     self._ariston_sensors[sensor]
+                    written_sensors.add(sensor)
                     try:
                         self._ariston_sensors[sensor][self._VALUE] = self._get_visible_sensor_value(sensor)
                         if "min" in item:
@@ -1017,309 +1582,58 @@ class AristonHandler:
 
         elif request_type == self._REQUEST_HP_ENERGY:
 
-            self._hp_energy_data = copy.deepcopy(resp.json())
-            this_day = datetime.date.today().day
-            this_hour = datetime.datetime.now().hour
+            self._hp_energy_data = data
+            written_sensors.update(self._LIST_HP_ENERGY)
 
             try:
-                # Extract ProducedEnergy data from asKwhRaw.histogramData
                 histogram_data = self._hp_energy_data.get('data', {}).get(
                     'asKwhRaw', {}).get('histogramData', [])
-                elapsed_slot_count = datetime.datetime.now().hour // 2
-
-                # Find CurrentDay ProducedEnergy for Heating
-                raw_previous_val = self._ariston_sensors[self._PARAM_HP_CH_PRODUCED_TODAY].get(self._VALUE)
-                try:
-                    previous_val = float(raw_previous_val) if raw_previous_val is not None else 0.0
-                except (TypeError, ValueError):
-                    previous_val = 0.0
-
-                hp_ch_energy = 0
-                hp_ch_attrs = {}
-                found_data = False
-                for item in histogram_data:
-                    if (item.get('tab') == 'ProducedEnergy' and
-                        item.get('period') == 'CurrentDay' and
-                            item.get('series') == 'Heating'):
-                        data_points = item.get('items', [])
-                        if data_points:
-                            for slot_idx, data_point in enumerate(data_points):
-                                raw_point = data_point.get('y', 0)
-                                try:
-                                    point_val = float(raw_point)
-                                except (TypeError, ValueError):
-                                    continue
-                                if point_val < 0:
-                                    self._LOGGER.debug(
-                                        "Ignoring negative ProducedEnergy Heating slot %s=%s",
-                                        data_point.get('x', ''),
-                                        raw_point,
-                                    )
-                                    continue
-                                found_data = True
-                                hp_ch_attrs[data_point.get('x', '')] = point_val
-                                if slot_idx < elapsed_slot_count:
-                                    hp_ch_energy += point_val
-                        break
-
-                is_midnight_window = datetime.datetime.now().hour == 0
-
-                if found_data:
-                    # Always update attributes so the stats import subscriber sees new slots.
-                    # Only gate the VALUE update to avoid a suspicious total drop.
-                    self._ariston_sensors[self._PARAM_HP_CH_PRODUCED_TODAY][self._ATTRIBUTES] = hp_ch_attrs
-                    self._ariston_sensors[self._PARAM_HP_CH_PRODUCED_TODAY][self._UNITS] = self._UNIT_KWH
-                    if round(hp_ch_energy, 3) >= round(previous_val, 3) or is_midnight_window:
-                        self._ariston_sensors[self._PARAM_HP_CH_PRODUCED_TODAY][self._VALUE] = hp_ch_energy
-                        self._LOGGER.debug(
-                            f"HP ProducedEnergy Heating today: total={hp_ch_energy} kWh; slots={len(hp_ch_attrs)}")
-                    else:
-                        self._LOGGER.debug(f"Ignoring value drop: {hp_ch_energy} is less than {previous_val}")
-            except Exception as ex:
-                self._LOGGER.warning(
-                    f'Issue handling heat pump produced energy for CH, {ex}')
-                # NEVER call self._reset_sensor here; it forces the value to 0 and causes a spike
-
-            try:
-                # Find CurrentDay ProducedEnergy for DHW
-                raw_previous_val = self._ariston_sensors[self._PARAM_HP_DHW_PRODUCED_TODAY].get(self._VALUE)
-                try:
-                    previous_val = float(raw_previous_val) if raw_previous_val is not None else 0.0
-                except (TypeError, ValueError):
-                    previous_val = 0.0
-
-                hp_dhw_energy = 0
-                hp_dhw_attrs = {}
-                found_data = False
-                for item in histogram_data:
-                    if (item.get('tab') == 'ProducedEnergy' and
-                        item.get('period') == 'CurrentDay' and
-                            item.get('series') == 'Dhw'):
-                        data_points = item.get('items', [])
-                        if data_points:
-                            for slot_idx, data_point in enumerate(data_points):
-                                raw_point = data_point.get('y', 0)
-                                try:
-                                    point_val = float(raw_point)
-                                except (TypeError, ValueError):
-                                    continue
-                                if point_val < 0:
-                                    self._LOGGER.debug(
-                                        "Ignoring negative ProducedEnergy DHW slot %s=%s",
-                                        data_point.get('x', ''),
-                                        raw_point,
-                                    )
-                                    continue
-                                found_data = True
-                                hp_dhw_attrs[data_point.get('x', '')] = point_val
-                                if slot_idx < elapsed_slot_count:
-                                    hp_dhw_energy += point_val
-                        break
-
-                is_midnight_window = datetime.datetime.now().hour == 0
-
-                if found_data:
-                    # Always update attributes so the stats import subscriber sees new slots.
-                    # Only gate the VALUE update to avoid a suspicious total drop.
-                    self._ariston_sensors[self._PARAM_HP_DHW_PRODUCED_TODAY][self._ATTRIBUTES] = hp_dhw_attrs
-                    self._ariston_sensors[self._PARAM_HP_DHW_PRODUCED_TODAY][self._UNITS] = self._UNIT_KWH
-                    if round(hp_dhw_energy, 3) >= round(previous_val, 3) or is_midnight_window:
-                        self._ariston_sensors[self._PARAM_HP_DHW_PRODUCED_TODAY][self._VALUE] = hp_dhw_energy
-                        self._LOGGER.debug(
-                            f"HP ProducedEnergy DHW today: total={hp_dhw_energy} kWh; slots={len(hp_dhw_attrs)}")
-                    else:
-                        self._LOGGER.debug(f"Ignoring value drop: {hp_dhw_energy} is less than {previous_val}")
-            except Exception as ex:
-                self._LOGGER.warning(
-                    f'Issue handling heat pump produced energy for DHW, {ex}')
-                # NEVER call self._reset_sensor here; it forces the value to 0 and causes a spike
-
-            try:
-                # 1. Store the previous value to compare
-                raw_previous_val = self._ariston_sensors[self._PARAM_HP_CH_CONSUMED_TODAY].get(self._VALUE)
-                try:
-                    previous_val = float(raw_previous_val) if raw_previous_val is not None else 0.0
-                except (TypeError, ValueError):
-                    previous_val = 0.0
-    
-                hp_ch_cons = 0
-                hp_ch_cons_attrs = {}
-                found_data = False
-
-                for item in histogram_data:
-                    if (item.get('tab') == 'ConsumedElectricity' and
-                        item.get('period') == 'CurrentDay' and
-                            item.get('series') == 'Heating'):
-            
-                        data_points = item.get('items', [])
-                        if data_points:
-                            for slot_idx, data_point in enumerate(data_points):
-                                raw_point = data_point.get('y', 0)
-                                try:
-                                    point_val = float(raw_point)
-                                except (TypeError, ValueError):
-                                    continue
-                                if point_val < 0:
-                                    self._LOGGER.debug(
-                                        "Ignoring negative ConsumedElectricity Heating slot %s=%s",
-                                        data_point.get('x', ''),
-                                        raw_point,
-                                    )
-                                    continue
-                                found_data = True
-                                hp_ch_cons_attrs[data_point.get('x', '')] = point_val
-                                if slot_idx < elapsed_slot_count:
-                                    hp_ch_cons += point_val
-                        break
-
-                # 2. Logic Guard: Only update if we found data AND it's not a suspicious drop
-                # Exception: Allow a drop if it's the first hour of the day (genuine reset)
-                is_midnight_window = datetime.datetime.now().hour == 0
-
-                if found_data:
-                    # Always update attributes so the stats import subscriber sees new slots.
-                    # Only gate the VALUE update to avoid a suspicious total drop.
-                    self._ariston_sensors[self._PARAM_HP_CH_CONSUMED_TODAY][self._ATTRIBUTES] = hp_ch_cons_attrs
-                    self._ariston_sensors[self._PARAM_HP_CH_CONSUMED_TODAY][self._UNITS] = self._UNIT_KWH
-                    if round(hp_ch_cons, 3) >= round(previous_val, 3) or is_midnight_window:
-                        self._ariston_sensors[self._PARAM_HP_CH_CONSUMED_TODAY][self._VALUE] = hp_ch_cons
-                    else:
-                        self._LOGGER.debug(f"Ignoring value drop: {hp_ch_cons} is less than {previous_val}")
-    
+                hp_energy_series = self._index_hp_energy(histogram_data, self._hp_energy_keys)
+                self._check_hp_energy_slot(hp_energy_series)
             except Exception as ex:
-                self._LOGGER.warning(f'Issue handling heat pump consumed electricity, {ex}')
-                # NEVER call self._reset_sensor here; it forces the value to 0 and causes a spike
+                self._LOGGER.warning(f'Issue indexing heat pump energy data, {ex}')
+                hp_energy_series = {}
 
-            try:
-                # Find CurrentDay ConsumedElectricity for DHW
-                # 1. Store the previous value to compare
-                raw_previous_val = self._ariston_sensors[self._PARAM_HP_DHW_CONSUMED_TODAY].get(self._VALUE)
+            now = datetime.datetime.now()
+            for param, (tab, series) in self._MAP_HP_ENERGY_TODAY.items():
                 try:
-                    previous_val = float(raw_previous_val) if raw_previous_val is not None else 0.0
-                except (TypeError, ValueError):
-                    previous_val = 0.0
-                hp_dhw_cons = 0
-                hp_dhw_cons_attrs = {}
-                found_data = False
-
-                for item in histogram_data:
-                    if (item.get('tab') == 'ConsumedElectricity' and
-                        item.get('period') == 'CurrentDay' and
-                            item.get('series') == 'Dhw'):
-                        data_points = item.get('items', [])
-                        if data_points:
-                            for slot_idx, data_point in enumerate(data_points):
-                                raw_point = data_point.get('y', 0)
-                                try:
-                                    point_val = float(raw_point)
-                                except (TypeError, ValueError):
-                                    continue
-                                if point_val < 0:
-                                    self._LOGGER.debug(
-                                        "Ignoring negative ConsumedElectricity DHW slot %s=%s",
-                                        data_point.get('x', ''),
-                                        raw_point,
-                                    )
-                                    continue
-                                found_data = True
-                                hp_dhw_cons_attrs[data_point.get('x', '')] = point_val
-                                if slot_idx < elapsed_slot_count:
-                                    hp_dhw_cons += point_val
-                        break
-
-                # 2. Logic Guard: Only update if we found data AND it's not a suspicious drop
-                # Exception: Allow a drop if it's the first hour of the day (genuine reset)
-                is_midnight_window = datetime.datetime.now().hour == 0
-
-                if found_data:
-                    # Always update attributes so the stats import subscriber sees new slots.
-                    # Only gate the VALUE update to avoid a suspicious total drop.
-                    self._ariston_sensors[self._PARAM_HP_DHW_CONSUMED_TODAY][self._ATTRIBUTES] = hp_dhw_cons_attrs
-                    self._ariston_sensors[self._PARAM_HP_DHW_CONSUMED_TODAY][self._UNITS] = self._UNIT_KWH
-                    if round(hp_dhw_cons, 3) >= round(previous_val, 3) or is_midnight_window:
-                        self._ariston_sensors[self._PARAM_HP_DHW_CONSUMED_TODAY][self._VALUE] = hp_dhw_cons
-                    else:
-                        self._LOGGER.debug(f"Ignoring value drop: {hp_dhw_cons} is less than {previous_val}")
-            except Exception as ex:
-                self._LOGGER.warning(f'Issue handling heat pump consumed electricity for DHW, {ex}')
+                    self._store_hp_energy_today(
+                        param, hp_energy_series.get((tab, self._HP_ENERGY_CURRENT_DAY, series)), now)
+                except Exception as ex:
+                    self._LOGGER.warning(f'Issue handling heat pump {tab} for {series}, {ex}')
+                    # NEVER call self._reset_sensor here; it forces the value to 0 and causes a spike
 
             # Compute COP sensors (Coefficient of Performance = Produced / Consumed)
-            try:
-                ch_produced = self._ariston_sensors[self._PARAM_HP_CH_PRODUCED_TODAY][self._VALUE]
-                ch_consumed = self._ariston_sensors[self._PARAM_HP_CH_CONSUMED_TODAY][self._VALUE]
-                self._ariston_sensors[self._PARAM_HP_CH_COP][self._UNITS] = self._UNIT_COP
-                if ch_consumed and ch_consumed > 0 and ch_produced is not None:
-                    ch_cop = round(ch_produced / ch_consumed, 2)
-                    self._ariston_sensors[self._PARAM_HP_CH_COP][self._VALUE] = ch_cop
-                    self._LOGGER.debug(f"HP CH COP: {ch_cop}")
-                else:
-                    self._ariston_sensors[self._PARAM_HP_CH_COP][self._VALUE] = None
-            except Exception as ex:
-                self._LOGGER.warn(f'Issue computing HP CH COP, {ex}')
-                self._ariston_sensors[self._PARAM_HP_CH_COP][self._UNITS] = self._UNIT_COP
-                self._ariston_sensors[self._PARAM_HP_CH_COP][self._VALUE] = None
-
-            try:
-                dhw_produced = self._ariston_sensors[self._PARAM_HP_DHW_PRODUCED_TODAY][self._VALUE]
-                dhw_consumed = self._ariston_sensors[self._PARAM_HP_DHW_CONSUMED_TODAY][self._VALUE]
-                self._ariston_sensors[self._PARAM_HP_DHW_COP][self._UNITS] = self._UNIT_COP
-                if dhw_consumed and dhw_consumed > 0 and dhw_produced is not None:
-                    dhw_cop = round(dhw_produced / dhw_consumed, 2)
-                    self._ariston_sensors[self._PARAM_HP_DHW_COP][self._VALUE] = dhw_cop
-                    self._LOGGER.debug(f"HP DHW COP: {dhw_cop}")
-                else:
-                    self._ariston_sensors[self._PARAM_HP_DHW_COP][self._VALUE] = None
-            except Exception as ex:
-                self._LOGGER.warn(f'Issue computing HP DHW COP, {ex}')
-                self._ariston_sensors[self._PARAM_HP_DHW_COP][self._UNITS] = self._UNIT_COP
-                self._ariston_sensors[self._PARAM_HP_DHW_COP][self._VALUE] = None
+            for param, (produced_param, consumed_param) in self._MAP_HP_COP.items():
+                self._store_hp_cop(param, produced_param, consumed_param)
 
             # Compute total produced and consumed
-            try:
-                ch_produced = self._ariston_sensors[self._PARAM_HP_CH_PRODUCED_TODAY][self._VALUE]
-                dhw_produced = self._ariston_sensors[self._PARAM_HP_DHW_PRODUCED_TODAY][self._VALUE]
-                if ch_produced is not None and dhw_produced is not None:
-                    total_produced = ch_produced + dhw_produced
-                    self._ariston_sensors[self._PARAM_HP_TOTAL_PRODUCED_TODAY][self._VALUE] = total_produced
-                    self._ariston_sensors[self._PARAM_HP_TOTAL_PRODUCED_TODAY][self._UNITS] = self._UNIT_KWH
-                    self._LOGGER.debug(
-                        f"HP Total Produced: {total_produced} kWh")
-                else:
-                    self._reset_sensor(self._PARAM_HP_TOTAL_PRODUCED_TODAY)
-            except Exception as ex:
-                self._LOGGER.warn(f'Issue computing HP total produced, {ex}')
-                self._reset_sensor(self._PARAM_HP_TOTAL_PRODUCED_TODAY)
-
-            try:
-                ch_consumed = self._ariston_sensors[self._PARAM_HP_CH_CONSUMED_TODAY][self._VALUE]
-                dhw_consumed = self._ariston_sensors[self._PARAM_HP_DHW_CONSUMED_TODAY][self._VALUE]
-                if ch_consumed is not None and dhw_consumed is not None:
-                    total_consumed = ch_consumed + dhw_consumed
-                    self._ariston_sensors[self._PARAM_HP_TOTAL_CONSUMED_TODAY][self._VALUE] = total_consumed
-                    self._ariston_sensors[self._PARAM_HP_TOTAL_CONSUMED_TODAY][self._UNITS] = self._UNIT_KWH
-                    self._LOGGER.debug(
-                        f"HP Total Consumed: {total_consumed} kWh")
-                else:
-                    self._reset_sensor(self._PARAM_HP_TOTAL_CONSUMED_TODAY)
-            except Exception as ex:
-                self._LOGGER.warn(f'Issue computing HP total consumed, {ex}')
-                self._reset_sensor(self._PARAM_HP_TOTAL_CONSUMED_TODAY)
+            for param, (ch_param, dhw_param) in self._MAP_HP_ENERGY_TOTAL.items():
+                try:
+                    ch_energy = self._ariston_sensors[ch_param][self._VALUE]
+                    dhw_energy = self._ariston_sensors[dhw_param][self._VALUE]
+                    if ch_energy is not None and dhw_energy is not None:
+                        total_energy = ch_energy + dhw_energy
+                        self._ariston_sensors[param][self._VALUE] = total_energy
+                        self._ariston_sensors[param][self._UNITS] = self._UNIT_KWH
+                        self._LOGGER.debug(f"HP {param}: {total_energy} kWh")
+                    else:
+                        self._reset_sensor(param)
+                except Exception as ex:
+                    self._LOGGER.warn(f'Issue computing HP {param}, {ex}')
+                    self._reset_sensor(param)
 
             # Compute overall COP
-            try:
-                total_produced = self._ariston_sensors[self._PARAM_HP_TOTAL_PRODUCED_TODAY][self._VALUE]
-                total_consumed = self._ariston_sensors[self._PARAM_HP_TOTAL_CONSUMED_TODAY][self._VALUE]
-                self._ariston_sensors[self._PARAM_HP_TOTAL_COP][self._UNITS] = self._UNIT_COP
-                if total_consumed and total_consumed > 0 and total_produced is not None:
-                    total_cop = round(total_produced / total_consumed, 2)
-                    self._ariston_sensors[self._PARAM_HP_TOTAL_COP][self._VALUE] = total_cop
-                    self._LOGGER.debug(f"HP Total COP: {total_cop}")
-                else:
-                    self._ariston_sensors[self._PARAM_HP_TOTAL_COP][self._VALUE] = None
-            except Exception as ex:
-                self._LOGGER.warn(f'Issue computing HP total COP, {ex}')
-                self._ariston_sensors[self._PARAM_HP_TOTAL_COP][self._UNITS] = self._UNIT_COP
-                self._ariston_sensors[self._PARAM_HP_TOTAL_COP][self._VALUE] = None
+            self._store_hp_cop(
+                self._PARAM_HP_TOTAL_COP, self._PARAM_HP_TOTAL_PRODUCED_TODAY, self._PARAM_HP_TOTAL_CONSUMED_TODAY)
+
+            # Weeks, months and years come with the same response, their totals are of periods containing the read date
+            self._hp_energy_date = now.date()
+            for period in self._hp_energy_periods:
+                try:
+                    self._store_hp_energy_period(hp_energy_series, period, *self._MAP_HP_ENERGY_PERIOD_SENSORS[period])
+                except Exception as ex:
+                    self._LOGGER.warning(f'Issue handling heat pump energy for {period}, {ex}')
 
             # Lifetime entities are statistics-only anchors for importer-owned
             # backfilled long-term data; keep their runtime state stable.
@@ -1333,61 +1647,86 @@ class AristonHandler:
                     self._ariston_sensors[lifetime_param][self._VALUE] = 0
                 self._ariston_sensors[lifetime_param][self._UNITS] = self._UNIT_KWH
 
-        self._subscribers_sensors_inform()
-
-    def _get_http_data(self, request_type=""):
-        """Common fetching of http data"""
-        self._login_session()
-        if self._login and self._plant_id != "":
-
+        self._subscribers_sensors_inform(written_sensors)
+
+    def _main_sensors(self, sensors):
+        """Sensors of main request needed by specified sensors, all sensors of main request if none specified"""
+        all_sensors = {*self._MAP_ARISTON_ZONE_0_PARAMS, *self._MAP_ARISTON_MULTIZONE_PARAMS}
+        if not sensors:
+            return all_sensors
+        main_sensors = set(self._LIST_MAIN_SENSORS_REQUIRED)
+        main_sensors.update(sensor for sensor in sensors if sensor in all_sensors)
+        pending = list(main_sensors)
+        while pending:
+            for dependency in self._MAP_MAIN_SENSOR_DEPENDENCIES.get(pending.pop(), ()):
+                if dependency not in main_sensors:
+                    main_sensors.add(dependency)
+                    pending.append(dependency)
+        return main_sensors
+
+
+    def _main_request_items(self):
+        """Items of main request, built once for current zones"""
+        zones = tuple(self._zones)
+        if self._main_items[0] != zones:
+            items = [{"id": param, "zn": 0} for param in self._main_zone_0_params]
+            for zone in zones:
+                items.extend({"id": param, "zn": zone} for param in self._main_multizone_params)
+            self._main_items = (zones, items)
+        return self._main_items[1]
+
+
+    def _request_body(self, request_type):
+        """Encoded body of the request, built once for current features and zones"""
+        body = self._request_bodies.get(request_type)
+        if body is None:
             if request_type == self._REQUEST_MAIN:
                 request_data = {
                     "useCache": False,
-                    "items": [],
+                    "items": self._main_request_items(),
                     "features": self._features
                     }
-                for param in self._MAP_ARISTON_ZONE_0_PARAMS.values():
-                    request_data['items'].append({"id": param, "zn":0})
-                if self._zones:
-                    for zone in self._zones:
-                        for param in self._MAP_ARISTON_MULTIZONE_PARAMS.values():
-                            request_data['items'].append({"id": param, "zn":zone})
-                with self._data_lock:
-                    resp = self._api_client.get_main_data(
-                        self._plant_id, request_data)
-                    self._store_data(resp, request_type)
-
-            elif request_type == self._REQUEST_ERRORS:
-                with self._data_lock:
-                    resp = self._api_client.get_errors(self._plant_id)
-                    self._store_data(resp, request_type)
-
-            elif request_type == self._REQUEST_CH_SCHEDULE:
-                with self._data_lock:
-                    resp = self._api_client.get_ch_schedule(self._plant_id)
-                    self._store_data(resp, request_type)
-
-            elif request_type == self._REQUEST_DHW_SCHEDULE:
-                with self._data_lock:
-                    resp = self._api_client.get_dhw_schedule(self._plant_id)
-                    self._store_data(resp, request_type)
-
-            elif request_type == self._REQUEST_ADDITIONAL:
-                with self._data_lock:
-                    resp = self._api_client.get_additional_data(
-                        self._plant_id, self._other_parameters)
-                    self._store_data(resp, request_type)
-
-            elif request_type == self._REQUEST_HP_ENERGY:
-                with self._data_lock:
-                    self._LOGGER.debug(
-                        f"Fetching heat pump energy data for plant '{self._plant_id}' (features: {len(self._features)})")
-                    resp = self._api_client.get_heat_pump_energy_data(
-                        self._plant_id, self._features)
-                    self._LOGGER.debug(
-                        f"Fetched heat pump energy response status: {getattr(resp, 'status_code', 'unknown')}")
-                    self._store_data(resp, request_type)
+            else:
+                request_data = {"features": self._features, "hasCooling": False}
+            body = encode_request(request_data)
+            self._request_bodies[request_type] = body
+        return body
+
+
+    def _read_request_call(self, request_type):
+        """Return API client method and its arguments to read data of the request"""
+        if request_type == self._REQUEST_MAIN:
+            return self._api_client.get_main_data, (self._plant_id, self._request_body(request_type))
+
+        elif request_type == self._REQUEST_ERRORS:
+            return self._api_client.get_errors, (self._plant_id,)
+
+        elif request_type == self._REQUEST_CH_SCHEDULE:
+            return self._api_client.get_ch_schedule, (self._plant_id,)
+
+        elif request_type == self._REQUEST_DHW_SCHEDULE:
+            return self._api_client.get_dhw_schedule, (self._plant_id,)
+
+        elif request_type == self._REQUEST_ADDITIONAL:
+            return self._api_client.get_additional_data, (self._plant_id, self._other_parameters)
+
+        elif request_type == self._REQUEST_HP_ENERGY:
+            self._LOGGER.debug(
+                f"Fetching heat pump energy data for plant '{self._plant_id}' (features: {len(self._features)})")
+            return self._api_client.get_heat_pump_energy_data, (self._plant_id, self._request_body(request_type))
+
+        self._LOGGER.warning(f"Unsupported request {request_type}")
+        raise Exception(f"Unsupported request {request_type}")
+
 
+    def _get_http_data(self, request_type=""):
+        """Common fetching of http data"""
+        self._login_session()
+        if self._login and self._plant_id != "":
+            api_call, args = self._read_request_call(request_type)
+            with self._data_lock:
+                resp = api_call(*args)
+                self._store_data(resp, request_type)
         else:
             self._LOGGER.warning(f"Not properly logged in to read {request_type}")
             raise Exception(f"Not properly logged in to read {request_type}")
@@ -1395,81 +1734,313 @@ class AristonHandler:
         return True
 
 
-    def _queue_get_data(self):
-        """Queue all request items"""
-        with self._data_lock:
-            # schedule next get request
-            if self._errors >= self._MAX_ERRORS:
-                # give a little rest to the system if too many errors
-                retry_in = self._get_period_time * self._WAIT_PERIOD_MULTIPLYER
+    def _schedule_request(self, request, due_time):
+        """Set time when request is due"""
+        self._requests_due[request] = due_time
+        heapq.heappush(self._requests_heap, (due_time, self._requests_schedule[request][1], request))
+
+
+    def _reschedule_request(self, request, now):
+        """Schedule request one period after now"""
+        if request == self._REQUEST_HP_ENERGY:
+            self._reschedule_hp_energy(now)
+            return
+        period, _, jitter = self._requests_schedule[request]
+        self._schedule_request(request, now + period + random.uniform(0, jitter))
+
+
+    def _hp_energy_slot(self, now_time=None):
+        """Current heat pump energy slot as date and number of closed slots in the day"""
+        if now_time is None:
+            now_time = datetime.datetime.now()
+        return now_time.date(), now_time.hour // self._HP_ENERGY_SLOT_HOURS
+
+
+    def _hp_energy_slot_due_in(self):
+        """Seconds until heat pump energy shall be read for the next closed slot"""
+        now_time = datetime.datetime.now()
+        slot_start = now_time.replace(
+            hour=now_time.hour - now_time.hour % self._HP_ENERGY_SLOT_HOURS, minute=0, second=0, microsecond=0)
+        due_time = slot_start + datetime.timedelta(seconds=self._hp_energy_delay)
+        if due_time <= now_time or self._hp_energy_read_slot == self._hp_energy_slot(now_time):
+            due_time += datetime.timedelta(hours=self._HP_ENERGY_SLOT_HOURS)
+        return (due_time - now_time).total_seconds()
+
+
+    def _reschedule_hp_energy(self, now):
+        """Schedule retry of heat pump energy read, or next slot if attempts are exhausted"""
+        slot = self._hp_energy_slot()
+        if slot != self._hp_energy_attempts_slot:
+            self._hp_energy_attempts_slot = slot
+            self._hp_energy_attempts = 0
+        self._hp_energy_attempts += 1
+        if self._hp_energy_attempts < self._HP_ENERGY_MAX_ATTEMPTS:
+            # Retry in case closed slot is not reported yet or request fails
+            self._schedule_request(self._REQUEST_HP_ENERGY, now + self._HP_ENERGY_RETRY_SECONDS)
+        else:
+            self._LOGGER.debug("Closed heat pump energy slot not read, waiting for the next slot")
+            self._schedule_request(self._REQUEST_HP_ENERGY, now + self._hp_energy_slot_due_in())
+
+
+    def _index_hp_energy(self, histogram_data, keys):
+        """Slots of metering histograms of (tab, period, series) keys, each search stops at its series"""
+        hp_energy_series = {}
+        for key in keys:
+            tab, period, series = key
+            for item in histogram_data:
+                if (item.get('tab') == tab and
+                    item.get('period') == period and
+                        item.get('series') == series):
+                    hp_energy_series[key] = self._hp_energy_slots(key, item.get('items') or ())
+                    break
+        return hp_energy_series
+
+
+    def _hp_energy_slots(self, key, data_points):
+        """Slot values and attributes of a series, invalid and negative points are kept as 0 in slots"""
+        slots = []
+        attrs = {}
+        for data_point in data_points:
+            raw_point = data_point.get('y', 0)
+            try:
+                point_val = float(raw_point)
+            except (TypeError, ValueError):
+                slots.append(0.0)
+                continue
+            if point_val < 0:
+                self._LOGGER.debug("Ignoring negative %s %s slot %s=%s", key[0], key[2], data_point.get('x', ''), raw_point)
+                slots.append(0.0)
+                continue
+            slots.append(point_val)
+            attrs[data_point.get('x', '')] = point_val
+        return slots, attrs
+
+
+    def _store_hp_energy_today(self, param, series_data, now):
+        """Store today's energy of a series up to the last closed slot, suspicious drops are ignored"""
+        if not series_data or not series_data[1]:
+            return
+        slots, attrs = series_data
+        raw_previous_val = self._ariston_sensors[param].get(self._VALUE)
+        try:
+            previous_val = float(raw_previous_val) if raw_previous_val is not None else 0.0
+        except (TypeError, ValueError):
+            previous_val = 0.0
+        energy = sum(slots[:now.hour // self._HP_ENERGY_SLOT_HOURS])
+        # Always update attributes so the stats import subscriber sees new slots.
+        # Only gate the VALUE update to avoid a suspicious total drop,
+        # a drop is allowed in the first hour of the day (genuine reset).
+        self._ariston_sensors[param][self._ATTRIBUTES] = attrs
+        self._ariston_sensors[param][self._UNITS] = self._UNIT_KWH
+        if round(energy, 3) >= round(previous_val, 3) or now.hour == 0:
+            self._ariston_sensors[param][self._VALUE] = energy
+            self._LOGGER.debug(f"HP {param}: total={energy} kWh; slots={len(attrs)}")
+        else:
+            self._LOGGER.debug(f"Ignoring value drop: {energy} is less than {previous_val}")
+
+
+    def _store_hp_energy_period(self, hp_energy_series, period, produced_param, consumed_param, cop_param):
+        """Store total energy and COP of a metering period, energy sensors without data are kept"""
+        for param, circuit_params in (
+            (produced_param, self._MAP_HP_ENERGY_TOTAL[self._PARAM_HP_TOTAL_PRODUCED_TODAY]),
+            (consumed_param, self._MAP_HP_ENERGY_TOTAL[self._PARAM_HP_TOTAL_CONSUMED_TODAY]),
+        ):
+            energy = None
+            attrs = {}
+            for circuit_param in circuit_params:
+                tab, series = self._MAP_HP_ENERGY_TODAY[circuit_param]
+                series_data = hp_energy_series.get((tab, period, series))
+                if not series_data or not series_data[1]:
+                    continue
+                slots, series_attrs = series_data
+                energy = (energy or 0) + sum(slots)
+                for label, value in series_attrs.items():
+                    attrs[label] = round(attrs.get(label, 0) + value, 3)
+            if energy is None:
+                continue
+            self._ariston_sensors[param][self._VALUE] = energy
+            self._ariston_sensors[param][self._ATTRIBUTES] = attrs
+            self._ariston_sensors[param][self._UNITS] = self._UNIT_KWH
+            self._LOGGER.debug(f"HP {param}: total={energy} kWh; buckets={len(attrs)}")
+        self._store_hp_cop(cop_param, produced_param, consumed_param)
+
+
+    def _store_hp_cop(self, param, produced_param, consumed_param):
+        """Store COP from produced and consumed energy sensors"""
+        try:
+            produced = self._ariston_sensors[produced_param][self._VALUE]
+            consumed = self._ariston_sensors[consumed_param][self._VALUE]
+            self._ariston_sensors[param][self._UNITS] = self._UNIT_COP
+            if consumed and consumed > 0 and produced is not None:
+                cop = round(produced / consumed, 2)
+                self._ariston_sensors[param][self._VALUE] = cop
+                self._LOGGER.debug(f"HP {param}: {cop}")
             else:
-                # work as usual
+                self._ariston_sensors[param][self._VALUE] = None
+        except Exception as ex:
+            self._LOGGER.warn(f'Issue computing HP {param}, {ex}')
+            self._ariston_sensors[param][self._UNITS] = self._UNIT_COP
+            self._ariston_sensors[param][self._VALUE] = None
+
+
+    def _hp_energy_slot_values(self, hp_energy_series, slot_idx):
+        """Values of all CurrentDay series in the slot"""
+        return [
+            (tab, series, slots[slot_idx])
+            for (tab, period, series), (slots, _) in hp_energy_series.items()
+            if period == self._HP_ENERGY_CURRENT_DAY and slot_idx < len(slots)
+        ]
+
+
+    def _check_hp_energy_slot(self, hp_energy_series):
+        """Schedule next heat pump energy read at next slot if closed slot was reported"""
+        now_time = datetime.datetime.now()
+        slot = self._hp_energy_slot(now_time)
+        slot_date, closed_slots = slot
+        slot_start = now_time.replace(
+            hour=now_time.hour - now_time.hour % self._HP_ENERGY_SLOT_HOURS, minute=0, second=0, microsecond=0)
+        # Closed slot is reported once the delay after its end has passed
+        closed_slot_read = now_time >= slot_start + datetime.timedelta(seconds=self._hp_energy_delay)
+        previous = self._hp_energy_open_slot_values
+        if not closed_slot_read and closed_slots and previous is not None and \
+                previous[0] == (slot_date, closed_slots - 1):
+            # Changed values of the slot open during previous read report its closing earlier
+            closed_slot_read = self._hp_energy_slot_values(hp_energy_series, closed_slots - 1) != previous[1]
+        if not closed_slot_read:
+            self._LOGGER.debug(f"Heat pump energy slot {closed_slots} not closed yet, attempt {self._hp_energy_attempts}")
+            if self._REQUEST_HP_ENERGY in self._requests_schedule:
+                self._schedule_request(self._REQUEST_HP_ENERGY, time.monotonic() + min(
+                    self._HP_ENERGY_RETRY_SECONDS, self._hp_energy_slot_due_in()))
+            return
+        self._hp_energy_open_slot_values = (slot, self._hp_energy_slot_values(hp_energy_series, closed_slots))
+        self._hp_energy_read_slot = slot
+        if self._REQUEST_HP_ENERGY in self._requests_schedule:
+            self._schedule_request(self._REQUEST_HP_ENERGY, time.monotonic() + self._hp_energy_slot_due_in())
+
+
+    def _pop_due_request(self, now):
+        """Remove and return due request with highest priority, None if no request is due"""
+        due_requests = []
+        while self._requests_heap and self._requests_heap[0][0] <= now:
+            entry = heapq.heappop(self._requests_heap)
+            if self._requests_due.get(entry[2]) == entry[0]:
+                due_requests.append(entry)
+        if not due_requests:
+            return None
+        selected = min(due_requests, key=lambda entry: (entry[1], entry[0]))
+        for entry in due_requests:
+            if entry is not selected:
+                heapq.heappush(self._requests_heap, entry)
+        return selected[2]
+
+
+    def _next_due_in(self, now):
+        """Seconds until next request is due"""
+        while self._requests_heap and self._requests_due.get(self._requests_heap[0][2]) != self._requests_heap[0][0]:
+            heapq.heappop(self._requests_heap)
+        if not self._requests_heap:
+            return self._get_period_time
+        return max(self._REQUESTS_SPACING_SECONDS, self._requests_heap[0][0] - now)
+
+
+    def _next_request(self):
+        """Select next request to be sent and period until the following one"""
+        now = time.monotonic()
+        if not self.available:
+            # Initial or offline situation, use main request when its circuit lets it through
+            circuit = self._circuits[self._REQUEST_MAIN]
+            if circuit.allow(now):
+                request_to_send = self._REQUEST_MAIN
+                self._reschedule_request(request_to_send, now)
                 retry_in = self._get_period_time
-            self._timer_periodic_read.cancel()
-            if not self.available or self._errors > 0:
-                # Initial or error situation, use main request
-                if self.available and self._last_request == self._REQUEST_ADDITIONAL and self._last_request in self._requests_lists[0]:
-                    # Potential error with parameters where they are removed 1 by 1 request
-                    request_to_send = self._last_request
-                else:
-                    request_to_send = self._requests_lists[0][0]
             else:
-                if self._set_requests[self._REQUEST_MAIN]:
-                    # Changing parameters
-                    request_to_send = self._REQUEST_MAIN
-                elif self._set_requests[self._REQUEST_ADDITIONAL]:
+                request_to_send = None
+                retry_in = circuit.retry_in(now)
+        else:
+            request_to_send = None
+            for request in (self._REQUEST_MAIN, self._REQUEST_ADDITIONAL):
+                if self._set_requests[request] and request in self._requests_schedule and \
+                        self._circuits[request].allow(now):
                     # Changing parameters
-                    request_to_send = self._REQUEST_ADDITIONAL
-                elif self._last_request in self._requests_lists[0]:
-                    # High prio more frequent (e.g. current temperatures, flame, errors)
-                    last_index = self._requests_lists[0].index(self._last_request)
-                    if len(self._requests_lists[0]) <= last_index + 1:
-                        # Last request was the last item
-                        if self._requests_lists[1]:
-                            # There are requests
-                            last_index_low_prio = self._requests_lists[1].index(self._last_request_low_prio)
-                            if len(self._requests_lists[1]) <= last_index_low_prio + 1:
-                                # Last request in low prio item
-                                request_to_send = self._requests_lists[1][0]
-                            else:
-                                request_to_send = self._requests_lists[1][last_index_low_prio + 1]
-                            self._last_request_low_prio = request_to_send
-                        else:
-                            # No low prio requests
-                            request_to_send = self._requests_lists[0][0]
-                    else:
-                        request_to_send = self._requests_lists[0][last_index + 1]
-                else:
-                    # Low prio less frequent requests (e.g. energy use)
-                    request_to_send = self._requests_lists[0][0]
+                    request_to_send = request
+                    self._reschedule_request(request_to_send, now)
+                    break
+            if request_to_send is None:
+                request_to_send = self._pop_due_request(now)
+                while request_to_send and not self._circuits[request_to_send].allow(now):
+                    # Request waits until its circuit is half-open
+                    self._schedule_request(request_to_send, self._circuits[request_to_send].open_until)
+                    request_to_send = self._pop_due_request(now)
+                if request_to_send:
+                    self._reschedule_request(request_to_send, now)
+            retry_in = self._next_due_in(now)
+        if request_to_send:
             self._last_request = request_to_send
+        return request_to_send, retry_in
 
-            if self._started:
-                self._LOGGER.info(f'Shall send next request in {retry_in} seconds, current request is {request_to_send}')
-                self._timer_queue_delay = threading.Timer(self._TIME_SPLIT, self._control_availability_state, [request_to_send])
-                self._timer_queue_delay.start()
-                self._timer_periodic_read = threading.Timer(retry_in, self._queue_get_data)
-                self._timer_periodic_read.start()
-                
 
-    def _error_detected(self):
-        """Error detected"""
+    def _queue_get_data(self, stop_event):
+        """Send requests until stopped"""
+        if stop_event.wait(self._TIME_SPLIT):
+            return
+        while True:
+            sent_at = time.monotonic()
+            with self._data_lock:
+                request_to_send, retry_in = self._next_request()
+            self._LOGGER.info(f'Shall send next request in {retry_in} seconds, current request is {request_to_send}')
+            if request_to_send:
+                self._control_availability_state(request_to_send)
+            if stop_event.wait(max(0, retry_in - (time.monotonic() - sent_at))):
+                return
+
+
+    def _create_circuits(self):
+        """Create closed circuit for each request"""
+        return {
+            request: CircuitBreaker(
+                self._CIRCUIT_FAILURES, self._CIRCUIT_BACKOFF_SECONDS, self._CIRCUIT_BACKOFF_MAX_SECONDS)
+            for request in self._MAP_REQUEST
+        }
+
+
+    def _error_kind(self, ex):
+        """Kind of the request error"""
+        if isinstance(ex, AristonAuthError):
+            return self._ERROR_AUTH
+        if isinstance(ex, AristonThrottledError):
+            return self._ERROR_THROTTLING
+        if isinstance(ex, AristonTransportError):
+            return self._ERROR_TRANSPORT
+        return self._ERROR_OTHER
+
+
+    def _error_detected(self, request_type, ex):
+        """Error detected, last known data are kept"""
+        kind = self._error_kind(ex)
+        now = time.monotonic()
         with self._lock:
             was_online = self.available
-            self._errors += 1
+            circuit = self._circuits[request_type]
+            # Throttling server is left alone at once, other errors open the circuit when repeated
+            opened = circuit.record_failure(now, kind, throttled=kind == self._ERROR_THROTTLING)
+            if kind == self._ERROR_AUTH:
+                # Renewal of the session failed, login again with next request
+                with self._plant_id_lock:
+                    self._login = False
             self._subscribers_statuses_inform()
-            self._LOGGER.warning(f"Connection errors: {self._errors}")
+            self._LOGGER.warning(f"Connection errors of {request_type}: {circuit.failures}, last one is {kind} error")
             offline = not self.available
+        if opened:
+            self._LOGGER.warning(f"Requests {request_type} paused for {round(circuit.retry_in(now))} seconds")
         if offline and was_online:
-            self._clear_data()
-            self._LOGGER.error("Ariston is offline: Too many errors")
+            self._LOGGER.error("Ariston is offline: Too many errors, last known data are kept")
 
 
-    def _no_error_detected(self):
+    def _no_error_detected(self, request_type):
         """No errors detected"""
         with self._lock:
             was_offline = not self.available
-            self._errors = 0
+            self._circuits[request_type].record_success()
             self._subscribers_statuses_inform()
         if was_offline:
             self._LOGGER.info("No more errors")
@@ -1481,187 +2052,293 @@ class AristonHandler:
             result_ok = self._get_http_data(request_type)
             self._LOGGER.info(f"ariston action ok for {request_type}")
         except Exception as ex:
-            self._error_detected()
+            self._error_detected(request_type, ex)
             self._LOGGER.warning(f"ariston action nok for {request_type}: {ex}")
             return
         if result_ok:
-            self._no_error_detected()
+            self._no_error_detected(request_type)
         return
 
 
-    def _preparing_setting_http_data(self):
-        """Preparing and setting http data"""
-        self._login_session()
-        with self._data_lock:
-            if self._available and self._set_param:
+    def _plan_set_calls(self):
+        """
+        Plan API calls to set requested parameters, parameters of the same API endpoint are set by one call.
+        Returns list of tuples (parameters, API client method, args, kwargs) of independent calls,
+        parameters is dictionary of set parameters and their planned set requests.
+        """
+        calls = []
+        set_additional_params = []
+        additional_parameters = dict()
+        groups = dict()
 
-                set_additional_params = []
-                parameters = [key for key in self._set_param.keys()]
+        for parameter in list(self._set_param):
+            original_parameter, zone = self._zone_sensor_split(parameter)
+            self._LOGGER.info(f'Setting {parameter} new value {self._set_param[parameter][self._VALUE]} [{self._set_param[parameter][self._SET_VALUE]}]')
 
-                for parameter in parameters:
+            if original_parameter in self._LIST_ARISTON_WEB_PARAMS:
 
-                    try:
+                # Many parameters in one request
+                try:
+                    set_additional_params.append(
+                        {
+                            "id": self._MAP_ARISTON_WEB_MENU_PARAMS[parameter],
+                            "value": self._set_param[parameter][self._SET_VALUE],
+                            "prevValue": self._string_option_to_number(parameter, self._confirmed_sensor_value(parameter))
+                        }
+                    )
+                except Exception as ex:
+                    self._LOGGER.warning(f"Problem setting {parameter}: {ex}")
+                    del self._set_param[parameter]
+                    continue
+                additional_parameters[parameter] = self._set_param[parameter]
+                self._count_set_attempt(parameter)
+
+            else:
 
-                        original_parameter, zone = self._zone_sensor_split(parameter)
-                        set_value = self._set_param[parameter][self._SET_VALUE]
-                        self._LOGGER.info(f'Setting {parameter} new value {self._set_param[parameter][self._VALUE]} [{set_value}]')
-                        
-                        if original_parameter == self._PARAM_MODE:
+                # Parameters changed by the same endpoint
+                if original_parameter in self._SET_GROUP_CH_TEMPERATURES:
+                    group = self._PARAM_CH_SET_TEMPERATURE
+                elif original_parameter in self._SET_GROUP_DHW_TEMPERATURES:
+                    group = self._PARAM_DHW_COMFORT_TEMPERATURE
+                else:
+                    group = original_parameter
+                groups.setdefault((group, zone), []).append(parameter)
 
-                            old_value = self._string_option_to_number(parameter, self._get_sensor_value(parameter))
-                            self._api_client.set_plant_mode(
-                                self._plant_id, set_value, old_value)
-                            break
+        for (group, zone), parameters in groups.items():
+            try:
+                api_call, args, kwargs = self._plan_set_call(group, zone, parameters)
+            except Exception as ex:
+                self._LOGGER.warning(f"Problem setting {', '.join(parameters)}: {ex}")
+                for parameter in parameters:
+                    del self._set_param[parameter]
+                continue
+            planned = {parameter: self._set_param[parameter] for parameter in parameters}
+            # Temperatures sent together are written as well
+            if group == self._PARAM_CH_SET_TEMPERATURE:
+                planned.setdefault(self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone),
+                                   {self._VALUE: kwargs["new_payload"]["comf"]})
+                planned.setdefault(self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone),
+                                   {self._VALUE: kwargs["new_payload"]["econ"]})
+            elif group == self._PARAM_DHW_COMFORT_TEMPERATURE:
+                planned.setdefault(self._PARAM_DHW_COMFORT_TEMPERATURE, {self._VALUE: kwargs["new_payload"]["comf"]})
+                planned.setdefault(self._PARAM_DHW_ECONOMY_TEMPERATURE, {self._VALUE: kwargs["new_payload"]["econ"]})
+            calls.append((planned, api_call, args, kwargs))
+            for parameter in parameters:
+                self._count_set_attempt(parameter)
+
+        if set_additional_params:
+            calls.append((additional_parameters, self._api_client.submit_additional_params,
+                          (self._plant_id, set_additional_params), {}))
+
+        return calls
+
+
+    def _plan_set_call(self, group, zone, parameters):
+        """Return API client method and its arguments setting parameters of one endpoint"""
+        set_values = dict()
+        for parameter in parameters:
+            set_values[self._zone_sensor_split(parameter)[0]] = self._set_param[parameter][self._SET_VALUE]
+
+        if group == self._PARAM_MODE:
+
+            old_value = self._string_option_to_number(parameters[0], self._confirmed_sensor_value(parameters[0]))
+            return self._api_client.set_plant_mode, (self._plant_id, set_values[group], old_value), {}
+
+        elif group == self._PARAM_CH_MODE:
+
+            old_value = self._string_option_to_number(parameters[0], self._confirmed_sensor_value(parameters[0]))
+            return self._api_client.set_zone_mode, (self._plant_id, zone, set_values[group], old_value), {}
+
+        elif group == self._PARAM_DHW_MODE:
+
+            old_value = self._string_option_to_number(parameters[0], self._confirmed_sensor_value(parameters[0]))
+            return self._api_client.set_dhw_mode, (self._plant_id, set_values[group], old_value), {}
+
+        elif group == self._PARAM_CH_SET_TEMPERATURE:
+
+            comfort_sensor = self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)
+            economy_sensor = self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone)
+            comfort_old = self._confirmed_sensor_value(comfort_sensor)
+            comfort_new = self._ariston_sensors[comfort_sensor][self._VALUE]
+            economy_old = self._confirmed_sensor_value(economy_sensor)
+            economy_new = self._ariston_sensors[economy_sensor][self._VALUE]
+            if self._PARAM_CH_COMFORT_TEMPERATURE in set_values:
+                comfort_new = set_values[self._PARAM_CH_COMFORT_TEMPERATURE]
+            if self._PARAM_CH_ECONOMY_TEMPERATURE in set_values:
+                economy_new = set_values[self._PARAM_CH_ECONOMY_TEMPERATURE]
+            if self._PARAM_CH_SET_TEMPERATURE in set_values:
+                set_temp = self._confirmed_sensor_value(self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone))
+                if set_temp == economy_old and \
+                        self._confirmed_sensor_value(self._zone_sensor_name(self._PARAM_CH_MODE, zone)) == "Time program":
+                    economy_new = set_values[self._PARAM_CH_SET_TEMPERATURE]
+                else:
+                    comfort_new = set_values[self._PARAM_CH_SET_TEMPERATURE]
+            return self._api_client.set_zone_temperatures, (self._plant_id, zone), \
+                {"new_payload": {"comf": comfort_new,
+                                 "econ": economy_new},
+                 "old_payload": {"comf": comfort_old,
+                                 "econ": economy_old}}
+
+        elif group == self._PARAM_DHW_SET_TEMPERATURE:
+
+            old_value = self._confirmed_sensor_value(parameters[0])
+            return self._api_client.set_dhw_temp, (self._plant_id, set_values[group], old_value), {}
+
+        elif group == self._PARAM_DHW_COMFORT_TEMPERATURE:
+
+            comfort_old = self._confirmed_sensor_value(self._PARAM_DHW_COMFORT_TEMPERATURE)
+            comfort_new = set_values.get(self._PARAM_DHW_COMFORT_TEMPERATURE,
+                                         self._ariston_sensors[self._PARAM_DHW_COMFORT_TEMPERATURE][self._VALUE])
+            economy_old = self._confirmed_sensor_value(self._PARAM_DHW_ECONOMY_TEMPERATURE)
+            economy_new = set_values.get(self._PARAM_DHW_ECONOMY_TEMPERATURE,
+                                         self._ariston_sensors[self._PARAM_DHW_ECONOMY_TEMPERATURE][self._VALUE])
+            return self._api_client.set_dhw_timeprog_temps, (self._plant_id,), \
+                {"new_payload": {"comf": comfort_new,
+                                 "econ": economy_new},
+                 "old_payload": {"comf": comfort_old,
+                                 "econ": economy_old}}
 
-                        elif original_parameter == self._PARAM_CH_MODE:
+        else:
+            self._LOGGER.error(f"Unsupported parameter to set {', '.join(parameters)}")
+            raise Exception(f"Unsupported parameter to set {', '.join(parameters)}")
 
-                            old_value = self._string_option_to_number(parameter, self._get_sensor_value(parameter))
-                            self._api_client.set_zone_mode(
-                                self._plant_id, zone, set_value, old_value)
-                            break
 
-                        elif original_parameter == self._PARAM_DHW_MODE:
+    def _count_set_attempt(self, parameter):
+        """Count attempt to set the parameter, parameter is not set anymore after the last attempt"""
+        self._set_param[parameter][self._ATTEMPT] += 1
+        if self._set_param[parameter][self._ATTEMPT] > self._max_set_retries:
+            del self._set_param[parameter]
 
-                            old_value = self._string_option_to_number(parameter, self._get_sensor_value(parameter))
-                            self._api_client.set_dhw_mode(
-                                self._plant_id, set_value, old_value)
-                            break
 
-                        elif original_parameter == self._PARAM_CH_SET_TEMPERATURE:
-                            
-                            comfort_old = self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone))
-                            comfort_new = self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)][self._VALUE]
-                            economy_old= self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone)) 
-                            economy_new = self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone)][self._VALUE]
-                            set_temp = self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_SET_TEMPERATURE, zone))
-                            if set_temp == economy_old and self._get_sensor_value(self._PARAM_CH_MODE) == "Time program":
-                                economy_new = set_value
-                            else:
-                                comfort_new = set_value
-                            self._api_client.set_zone_temperatures(
-                                self._plant_id,
-                                zone,
-                                new_payload={"comf": comfort_new,
-                                             "econ": economy_new},
-                                old_payload={"comf": comfort_old,
-                                             "econ": economy_old},
-                            )
-                            break
+    def _set_call_done(self, parameters):
+        """Remember values accepted by the server, they are old values of further changes until read back"""
+        for parameter, set_request in parameters.items():
+            self._written_values[parameter] = set_request[self._VALUE]
+            self._confirm_requests.add(self._get_request_for_parameter(parameter))
 
-                        elif original_parameter == self._PARAM_CH_COMFORT_TEMPERATURE:
-                            
-                            comfort_old = self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone))
-                            economy_old= self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone)) 
-                            economy_new = self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone)][self._VALUE]
-                            self._api_client.set_zone_temperatures(
-                                self._plant_id,
-                                zone,
-                                new_payload={"comf": set_value,
-                                             "econ": economy_new},
-                                old_payload={"comf": comfort_old,
-                                             "econ": economy_old},
-                            )
-                            break
 
-                        elif original_parameter == self._PARAM_CH_ECONOMY_TEMPERATURE:
-                            
-                            comfort_old = self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone))
-                            comfort_new = self._ariston_sensors[self._zone_sensor_name(self._PARAM_CH_COMFORT_TEMPERATURE, zone)][self._VALUE]
-                            economy_old= self._get_sensor_value(self._zone_sensor_name(self._PARAM_CH_ECONOMY_TEMPERATURE, zone)) 
-                            self._api_client.set_zone_temperatures(
-                                self._plant_id,
-                                zone,
-                                new_payload={"comf": comfort_new,
-                                             "econ": set_value},
-                                old_payload={"comf": comfort_old,
-                                             "econ": economy_old},
-                            )
-                            break
+    def _set_call_failed(self, parameters, ex):
+        """Handle failed API call to set the data, menu parameters are retried"""
+        self._LOGGER.warning(f"Problem setting {', '.join(parameters)}: {ex}")
+        for parameter, set_request in parameters.items():
+            # Newer value of the parameter is kept
+            if parameter not in self._LIST_ARISTON_WEB_PARAMS and self._set_param.get(parameter) is set_request:
+                del self._set_param[parameter]
 
-                        elif original_parameter == self._PARAM_DHW_SET_TEMPERATURE:
 
-                            old_value = self._get_sensor_value(parameter) 
-                            self._api_client.set_dhw_temp(
-                                self._plant_id, set_value, old_value)
-                            break
+    def _set_calls_done(self):
+        """Inform about results of setting the data, returns requests to be read to confirm accepted values"""
+        confirm_requests = set()
+        if self._set_confirm_delay is not None:
+            confirm_requests = self._confirm_requests
+            for request in confirm_requests:
+                self._confirm_attempts[request] = 0
+        self._confirm_requests = set()
+        self._subscribers_sensors_inform()
+        self._subscribers_statuses_inform()
+        self._reset_set_requests()
+        return confirm_requests
 
-                        elif original_parameter == self._PARAM_DHW_COMFORT_TEMPERATURE:
-
-                            comfort_old = self._get_sensor_value(self._PARAM_DHW_COMFORT_TEMPERATURE) 
-                            economy_old= self._get_sensor_value(self._PARAM_DHW_ECONOMY_TEMPERATURE) 
-                            economy_new = self._ariston_sensors[self._PARAM_DHW_ECONOMY_TEMPERATURE][self._VALUE]
-                            self._api_client.set_dhw_timeprog_temps(
-                                self._plant_id,
-                                new_payload={"comf": set_value,
-                                             "econ": economy_new},
-                                old_payload={"comf": comfort_old,
-                                             "econ": economy_old},
-                            )
-                            break
 
-                        elif original_parameter == self._PARAM_DHW_ECONOMY_TEMPERATURE:
-
-                            comfort_old = self._get_sensor_value(self._PARAM_DHW_COMFORT_TEMPERATURE)
-                            comfort_new = self._ariston_sensors[self._PARAM_DHW_COMFORT_TEMPERATURE][self._VALUE]
-                            economy_old= self._get_sensor_value(self._PARAM_DHW_ECONOMY_TEMPERATURE) 
-                            self._api_client.set_dhw_timeprog_temps(
-                                self._plant_id,
-                                new_payload={"comf": comfort_new,
-                                             "econ": set_value},
-                                old_payload={"comf": comfort_old,
-                                             "econ": economy_old},
-                            )
-                            break
+    def _set_retry_needed(self):
+        """Check if some values are to be set again after the period, others wait for confirmation read"""
+        return any(self._get_request_for_parameter(parameter) not in self._confirm_attempts
+                   for parameter in self._set_param)
 
-                        elif original_parameter in self._LIST_ARISTON_WEB_PARAMS:
 
-                            # Many parameters in one request
-                            
-                            set_additional_params.append(
-                                {
-                                    "id": self._MAP_ARISTON_WEB_MENU_PARAMS[parameter],
-                                    "value": set_value,
-                                    "prevValue": self._string_option_to_number(parameter, self._get_sensor_value(parameter))
-                                }
-                            )
+    def _confirm_pending(self, request):
+        """Check if set values are waiting for confirmation by the request"""
+        if request not in self._confirm_attempts:
+            return False
+        if any(self._get_request_for_parameter(parameter) == request for parameter in self._set_param):
+            return True
+        # Values were confirmed by other read
+        del self._confirm_attempts[request]
+        self._reset_set_requests()
+        return False
 
-                        else:
-                            self._LOGGER.error(f"Unsupported parameter to set {parameter}")
-                            raise Exception(f"Unsupported parameter to set {parameter}")
 
-                    except Exception as ex:
-                        self._LOGGER.warning(f"Problem setting {parameter}: {ex}")
-                        del self._set_param[parameter]
-                        continue
+    def _confirm_read_done(self, request):
+        """Evaluate confirmation read, returns delay of next confirmation read or None"""
+        if request in self._requests_schedule:
+            self._reschedule_request(request, time.monotonic())
+        if not self._confirm_pending(request):
+            self._LOGGER.info(f"Set values confirmed by {request}")
+            if self._set_retry_needed():
+                self._schedule_setting_http_data(self._set_period_time)
+            return None
+        attempt = self._confirm_attempts[request] + 1
+        if attempt < self._SET_CONFIRM_READS:
+            self._confirm_attempts[request] = attempt
+            return min(self._set_confirm_delay * 2 ** attempt, self._set_period_time)
+        # Values were not applied, so they are set again
+        del self._confirm_attempts[request]
+        self._reset_set_requests()
+        self._LOGGER.info(f"Set values not confirmed by {request}, attempting to set them again")
+        self._schedule_setting_http_data(self._TIME_SPLIT)
+        return None
 
-                    self._set_param[parameter][self._ATTEMPT] += 1
-                    if self._set_param[parameter][self._ATTEMPT] > self._max_set_retries:
-                        del self._set_param[parameter]
 
-                else:
+    def _preparing_setting_http_data(self):
+        """Preparing and setting http data"""
+        self._login_session()
+        with self._data_lock:
+            if self._available and self._set_param:
+
+                for parameters, api_call, args, kwargs in self._plan_set_calls():
                     try:
-                        if set_additional_params:
-                            self._api_client.submit_additional_params(
-                                self._plant_id, set_additional_params)
+                        api_call(*args, **kwargs)
                     except Exception as ex:
-                        self._LOGGER.warning(f"Problem setting multiple parameters: {ex}")
+                        self._set_call_failed(parameters, ex)
+                    else:
+                        self._set_call_done(parameters)
 
-                self._subscribers_sensors_inform()
-                self._subscribers_statuses_inform()
-                self._reset_set_requests()
+                for request in self._set_calls_done():
+                    self._schedule_confirm_read(request, self._set_confirm_delay)
+
+                if self._set_retry_needed():
+                    self._LOGGER.info(f"Attempting to set parameter values in {self._set_period_time} seconds")
+                    self._schedule_setting_http_data(self._set_period_time)
+
+
+    def _schedule_setting_http_data(self, delay):
+        """Schedule setting of http data after the delay, replacing previously scheduled one"""
+        self._timer_set_delay.cancel()
+        if self._started:
+            self._timer_set_delay = threading.Timer(delay, self._preparing_setting_http_data)
+            self._timer_set_delay.start()
+
+
+    def _schedule_confirm_read(self, request, delay):
+        """Schedule read of the request confirming set values, replacing previously scheduled one"""
+        if request in self._confirm_timers:
+            self._confirm_timers.pop(request).cancel()
+        if self._started:
+            self._confirm_timers[request] = threading.Timer(delay, self._confirm_setting_http_data, [request])
+            self._confirm_timers[request].start()
+
+
+    def _confirm_setting_http_data(self, request):
+        """Read the request to confirm set values"""
+        with self._data_lock:
+            pending = self._confirm_pending(request)
+        if not pending:
+            return
+        self._control_availability_state(request)
+        with self._data_lock:
+            delay = self._confirm_read_done(request)
+        if delay is not None:
+            self._LOGGER.info(f"Set values not confirmed by {request} yet, reading again in {delay} seconds")
+            self._schedule_confirm_read(request, delay)
 
-                if self._set_param:
-                    self._timer_set_delay.cancel()
-                    if self._started:
-                        self._LOGGER.info(f"Attempting to set parameter values in {self._set_period_time} seconds")
-                        self._timer_set_delay = threading.Timer(self._set_period_time, self._preparing_setting_http_data)
-                        self._timer_set_delay.start()
-                
 
     def _reset_set_requests(self):
         self._set_requests = {request: False for request in self._MAP_REQUEST}
         for parameter in self._set_param:
             self._set_requests[self._get_request_for_parameter(parameter)] = True
+        # Values waiting for confirmation are read by dedicated requests
+        for request in self._confirm_attempts:
+            self._set_requests[request] = False
 
 
     def _is_digit_string(self, text):
@@ -1725,10 +2402,12 @@ class AristonHandler:
                         else:
                             bad_values[parameter] = value
 
-                self._timer_set_delay.cancel()
-                if self._started:
-                    self._timer_set_delay = threading.Timer(self._TIME_SPLIT, self._preparing_setting_http_data)
-                    self._timer_set_delay.start()
+                if self._set_param:
+                    # Show values being set to the subscribers
+                    self._subscribers_sensors_inform(list(self._set_param))
+
+                # Values set in quick succession are sent together, last value of each parameter wins
+                self._schedule_setting_http_data(self._set_debounce)
 
                 if bad_values:
                     self._LOGGER.error(f"Unsupported parameters to be set: {bad_values}")
@@ -1744,15 +2423,24 @@ class AristonHandler:
         self._features = {}
         self._main_data = {}
         self._additional_data = {}
+        self._main_index = {}
+        self._additional_index = {}
         self._error_data = {}
         self._ch_schedule_data = {}
         self._dhw_schedule_data = {}
         self._set_param = {}
+        self._written_values = {}
+        self._confirm_requests = set()
+        self._confirm_attempts = {}
+        self._request_bodies = {}
+        self._hp_energy_data = {}
+        self._hp_energy_date = None
         self._last_dhw_storage_temp = None
         self._zones = []
         for sensor in self._ariston_sensors:
             self._reset_sensor(sensor)
         self._reset_set_requests()
+        self._circuits = self._create_circuits()
         self._subscribers_sensors_inform()
         self._subscribers_statuses_inform()
 
@@ -1760,15 +2448,18 @@ class AristonHandler:
         """Start communication with the server."""
         self._started = True
         self._LOGGER.info("Connection started")
-        self._timer_periodic_read = threading.Timer(self._TIME_SPLIT, self._queue_get_data)
-        self._timer_periodic_read.start()
+        self._stop_event = threading.Event()
+        self._read_thread = threading.Thread(
+            target=self._queue_get_data, args=(self._stop_event,), name="ariston_requests", daemon=True)
+        self._read_thread.start()
 
 
     def stop(self) -> None:
         """Stop communication with the server."""
         self._started = False
-        self._timer_periodic_read.cancel()
-        self._timer_queue_delay.cancel()
+        self._stop_event.set()
+        for timer in self._confirm_timers.values():
+            timer.cancel()
 
         if self._login and self.available:
             self._api_client.logout()
@@ -1776,3 +2467,274 @@ class AristonHandler:
         self._clear_data()
         self._subscribers_statuses_inform()
         self._LOGGER.info("Connection stopped")
+
+
+class AsyncAristonHandler(AristonHandler):
+    """
+    Ariston NET Remotethermo API running on asyncio event loop.
+
+    Accepts the same arguments as AristonHandler and optional:
+
+    'session' - aiohttp session to be used for requests;
+
+    'api_client' - AsyncAristonApiClient shared by handlers of gateways of the same account, it logs in once
+    and limits concurrent requests of all handlers. Owner of the shared client closes it.
+
+    'start' must be called from the event loop, 'async_stop' stops communication and cancels pending requests.
+    Methods to set data and properties can be used from any thread. Data of the handler is changed on
+    the event loop only, so coroutines do not lock it and values to be set are passed to the loop.
+    """
+
+    # Maximum number of concurrent calls to set the data
+    _SET_CALLS_CONCURRENCY = 4
+
+    def __init__(self, *args, session=None, api_client=None, **kwargs) -> None:
+        """
+        Initialize API.
+        """
+        self._session = session
+        self._shared_api_client = api_client
+        self._loop = None
+        self._tasks = set()
+        self._read_task = None
+        self._set_handle = None
+        self._confirm_handles = {}
+        self._login_lock = asyncio.Lock()
+        self._set_lock = asyncio.Lock()
+        super().__init__(*args, **kwargs)
+
+
+    def _create_api_client(self):
+        """Create client for HTTP communication"""
+        if self._shared_api_client is not None:
+            return self._shared_api_client
+        return AsyncAristonApiClient(self._LOGGER, session=self._session)
+
+
+    def _create_task(self, func, *args):
+        """Create tracked task so it can be cancelled on stop"""
+        task = self._loop.create_task(func(*args))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+
+    async def _async_login_session(self):
+        """Login to fetch Ariston Plant ID and confirm login"""
+        async with self._login_lock:
+            if not self._login and self._started:
+                if self._restore_login_state():
+                    return
+
+                # First login, session of the account might be logged in already by other handler
+                self._account_generation, gateways = await self._api_client.account_login(
+                    self._user, self._password, self._account_generation)
+
+                # Fetch plant IDs
+                plant_id = self._select_plant_id(gateways)
+
+                features = await self._api_client.get_plant_features(plant_id)
+                self._store_login_data(plant_id, features)
+                self._save_login_state()
+
+
+    async def _async_get_http_data(self, request_type=""):
+        """Common fetching of http data"""
+        await self._async_login_session()
+        if self._login and self._plant_id != "":
+            api_call, args = self._read_request_call(request_type)
+            resp = await api_call(*args)
+            self._store_data(resp, request_type)
+        else:
+            self._LOGGER.warning(f"Not properly logged in to read {request_type}")
+            raise Exception(f"Not properly logged in to read {request_type}")
+        self._LOGGER.info(f'Data read for {request_type}')
+        return True
+
+
+    async def _async_control_availability_state(self, request_type=""):
+        """Control component availability"""
+        try:
+            result_ok = await self._async_get_http_data(request_type)
+            self._LOGGER.info(f"ariston action ok for {request_type}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._error_detected(request_type, ex)
+            self._LOGGER.warning(f"ariston action nok for {request_type}: {ex}")
+            return
+        if result_ok:
+            self._no_error_detected(request_type)
+
+
+    async def _async_queue_get_data(self):
+        """Queue all request items"""
+        await asyncio.sleep(self._TIME_SPLIT)
+        while self._started:
+            sent_at = time.monotonic()
+            request_to_send, retry_in = self._next_request()
+            self._LOGGER.info(f'Shall send next request in {retry_in} seconds, current request is {request_to_send}')
+            if request_to_send:
+                # One request at a time, slow responses delay the following requests
+                await self._async_control_availability_state(request_to_send)
+            await asyncio.sleep(max(0, retry_in - (time.monotonic() - sent_at)))
+
+
+    async def _async_preparing_setting_http_data(self):
+        """Preparing and setting http data, one setting at a time"""
+        async with self._set_lock:
+            await self._async_setting_http_data()
+
+
+    async def _async_setting_http_data(self):
+        """Set http data"""
+        try:
+            await self._async_login_session()
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._LOGGER.warning(f"Problem to login to set data: {ex}")
+            return
+        if not self._available or not self._set_param:
+            return
+        calls = self._plan_set_calls()
+
+        # Calls use independent endpoints, so they are sent together
+        semaphore = asyncio.Semaphore(self._SET_CALLS_CONCURRENCY)
+        await asyncio.gather(*(self._async_set_call(semaphore, *call) for call in calls))
+
+        confirm_requests = self._set_calls_done()
+        retry = self._set_retry_needed()
+        for request in confirm_requests:
+            self._async_schedule_confirm_read(request, self._set_confirm_delay)
+        if retry:
+            self._LOGGER.info(f"Attempting to set parameter values in {self._set_period_time} seconds")
+            self._async_schedule_setting_http_data(self._set_period_time)
+
+
+    async def _async_set_call(self, semaphore, parameters, api_call, args, kwargs):
+        """Send one planned call setting the data"""
+        async with semaphore:
+            try:
+                await api_call(*args, **kwargs)
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                self._set_call_failed(parameters, ex)
+            else:
+                self._set_call_done(parameters)
+
+
+    def _on_loop(self):
+        """Check if the caller runs on the event loop of the handler"""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+
+    def set_http_data(self, **parameter_list: Union[str, int, float, bool]) -> None:
+        """
+        Set data over http, see AristonHandler.set_http_data.
+
+        Calls from other threads wait until values are checked and stored on the event loop.
+        """
+        if self._loop is None or self._on_loop():
+            super().set_http_data(**parameter_list)
+            return
+        asyncio.run_coroutine_threadsafe(self._async_set_http_data(parameter_list), self._loop).result()
+
+
+    async def _async_set_http_data(self, parameter_list):
+        """Check and store values to be set on the event loop"""
+        super().set_http_data(**parameter_list)
+
+
+    def _schedule_notifications(self):
+        """Deliver queued notifications from the event loop (called with the queue locked)"""
+        if self._loop is None or self._loop.is_closed():
+            super()._schedule_notifications()
+            return
+        self._loop.call_soon_threadsafe(self._dispatch_notifications_on_loop)
+
+
+    def _dispatch_notifications_on_loop(self):
+        """Deliver all queued notifications"""
+        with self._notify_condition:
+            notifications = self._take_notifications()
+            self._notify_scheduled = False
+        self._deliver_notifications(notifications)
+
+
+    def _schedule_setting_http_data(self, delay):
+        """Schedule setting of http data after the delay, replacing previously scheduled one"""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._async_schedule_setting_http_data, delay)
+
+
+    def _async_schedule_setting_http_data(self, delay):
+        """Schedule setting of http data after the delay (called from the event loop)"""
+        if self._set_handle is not None:
+            self._set_handle.cancel()
+            self._set_handle = None
+        if self._started:
+            self._set_handle = self._loop.call_later(
+                delay, self._create_task, self._async_preparing_setting_http_data)
+
+
+    def _async_schedule_confirm_read(self, request, delay):
+        """Schedule read of the request confirming set values (called from the event loop)"""
+        if request in self._confirm_handles:
+            self._confirm_handles.pop(request).cancel()
+        if self._started:
+            self._confirm_handles[request] = self._loop.call_later(
+                delay, self._create_task, self._async_confirm_setting_http_data, request)
+
+
+    async def _async_confirm_setting_http_data(self, request):
+        """Read the request to confirm set values"""
+        self._confirm_handles.pop(request, None)
+        if not self._confirm_pending(request):
+            return
+        await self._async_control_availability_state(request)
+        delay = self._confirm_read_done(request)
+        if delay is not None:
+            self._LOGGER.info(f"Set values not confirmed by {request} yet, reading again in {delay} seconds")
+            self._async_schedule_confirm_read(request, delay)
+
+
+    def start(self) -> None:
+        """Start communication with the server (must be called from the event loop)."""
+        self._loop = asyncio.get_running_loop()
+        self._started = True
+        self._LOGGER.info("Connection started")
+        self._read_task = self._create_task(self._async_queue_get_data)
+
+
+    def stop(self) -> None:
+        """Stop communication with the server from any thread."""
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self.async_stop(), self._loop)
+
+
+    async def async_stop(self) -> None:
+        """Stop communication with the server."""
+        self._started = False
+        if self._set_handle is not None:
+            self._set_handle.cancel()
+            self._set_handle = None
+        for handle in self._confirm_handles.values():
+            handle.cancel()
+        self._confirm_handles = {}
+        tasks = [task for task in self._tasks if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._shared_api_client is None:
+            if self._login and self.available:
+                await self._api_client.logout()
+            await self._api_client.close()
+        self._clear_data()
+        self._subscribers_statuses_inform()
+        self._LOGGER.info("Connection stopped")
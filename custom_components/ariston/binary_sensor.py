@@ -1,11 +1,11 @@
 """Suppoort for Ariston binary sensors."""
 import logging
-from datetime import timedelta
 from copy import deepcopy
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
 
 from .const import param_zoned
 from .const import (
@@ -30,8 +30,6 @@ BINARY_SENSOR_INTERNET_TIME = "Internet Time"
 BINARY_SENSOR_INTERNET_WEATHER = "Internet Weather"
 BINARY_SENSOR_THERMAL_CLEANSE_FUNCTION = "Thermal Cleanse Function"
 
-SCAN_INTERVAL = timedelta(seconds=2)
-
 _LOGGER = logging.getLogger(__name__)
 
 # Binary sensor types are defined like: Name, device class
@@ -92,6 +90,20 @@ class AristonBinarySensor(BinarySensorEntity):
         self._name = "{} {}".format(name, BINARY_SENSORS[sensor_type][0])
         self._sensor_type = sensor_type
         self._state = None
+        self._generation = None
+        self._coordinator = device.api.coordinator
+
+    async def async_added_to_hass(self):
+        """Subscribe to changes of the sensor."""
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._handle_coordinator_update, [self._sensor_type])
+        )
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Update state from the snapshot and write it."""
+        self.update()
+        self.async_write_ha_state()
 
     @property
     def unique_id(self):
@@ -105,8 +117,8 @@ class AristonBinarySensor(BinarySensorEntity):
 
     @property
     def should_poll(self):
-        """Return True if entity has to be polled for state."""
-        return True
+        """Return False as state is pushed by the coordinator."""
+        return False
 
     @property
     def name(self):
@@ -151,7 +163,12 @@ class AristonBinarySensor(BinarySensorEntity):
         try:
             if not self._api.available:
                 return
-            if self._api.sensor_values[self._sensor_type][VALUE] == VAL_ON:
+            generation, sensor_values = self._api.sensor_snapshot
+            if generation == self._generation:
+                # Snapshot has not changed since last update
+                return
+            self._generation = generation
+            if sensor_values[self._sensor_type][VALUE] == VAL_ON:
                 self._state = True
             else:
                 self._state = False
@@ -2,7 +2,6 @@
 Adds support for the Ariston Boiler
 """
 import logging
-from datetime import timedelta
 from .const import param_zoned
 
 from homeassistant.components.climate import ClimateEntity
@@ -16,6 +15,7 @@ from homeassistant.const import (
     CONF_NAME,
     UnitOfTemperature,
 )
+from homeassistant.core import callback
 
 from .const import (
     DATA_ARISTON,
@@ -43,7 +43,6 @@ from .const import (
     STEP,
 )
 
-SCAN_INTERVAL = timedelta(seconds=2)
 SUPPORT_FLAGS = ClimateEntityFeature.PRESET_MODE | ClimateEntityFeature.TARGET_TEMPERATURE
 UNKNOWN_TEMP = 0.0
 
@@ -72,10 +71,32 @@ class AristonThermostat(ClimateEntity):
         """Initialize the thermostat."""
         self._name = name
         self._api = device.api.ariston_api
+        self._coordinator = device.api.coordinator
         self._device = device.device
         self._climate_name = climate_name
         self._zone = int(climate_name[-1])
 
+    async def async_added_to_hass(self):
+        """Subscribe to changes of sensors used by the entity."""
+        self.async_on_remove(
+            self._coordinator.async_add_listener(
+                self._handle_coordinator_update,
+                [
+                    PARAM_MODE,
+                    PARAM_HOLIDAY_MODE,
+                    PARAM_HEAT_PUMP,
+                    param_zoned(PARAM_CH_MODE, self._zone),
+                    param_zoned(PARAM_CH_SET_TEMPERATURE, self._zone),
+                    param_zoned(PARAM_CH_DETECTED_TEMPERATURE, self._zone),
+                ],
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Write state pushed by the coordinator."""
+        self.async_write_ha_state()
+
     @property
     def unique_id(self):
         """Return the unique id."""
@@ -103,8 +124,8 @@ class AristonThermostat(ClimateEntity):
 
     @property
     def should_poll(self):
-        """Polling is required."""
-        return True
+        """Return False as state is pushed by the coordinator."""
+        return False
 
     @property
     def min_temp(self):
@@ -1,4 +1,7 @@
 """ Constants for the integration """
+import sys
+from types import MappingProxyType
+
 PARAM_ACCOUNT_CH_ELECTRICITY = "account_ch_electricity"
 PARAM_ACCOUNT_DHW_ELECTRICITY = "account_dhw_electricity"
 PARAM_CH_ANTIFREEZE_TEMPERATURE = "ch_antifreeze_temperature"
@@ -73,6 +76,24 @@ PARAM_HP_DHW_COP = 'hp_dhw_cop'
 PARAM_HP_TOTAL_PRODUCED_TODAY = 'hp_total_produced_today'
 PARAM_HP_TOTAL_CONSUMED_TODAY = 'hp_total_consumed_today'
 PARAM_HP_TOTAL_COP = 'hp_total_cop'
+PARAM_HP_TOTAL_PRODUCED_THIS_WEEK = 'hp_total_produced_this_week'
+PARAM_HP_TOTAL_CONSUMED_THIS_WEEK = 'hp_total_consumed_this_week'
+PARAM_HP_TOTAL_COP_THIS_WEEK = 'hp_total_cop_this_week'
+PARAM_HP_TOTAL_PRODUCED_LAST_WEEK = 'hp_total_produced_last_week'
+PARAM_HP_TOTAL_CONSUMED_LAST_WEEK = 'hp_total_consumed_last_week'
+PARAM_HP_TOTAL_COP_LAST_WEEK = 'hp_total_cop_last_week'
+PARAM_HP_TOTAL_PRODUCED_THIS_MONTH = 'hp_total_produced_this_month'
+PARAM_HP_TOTAL_CONSUMED_THIS_MONTH = 'hp_total_consumed_this_month'
+PARAM_HP_TOTAL_COP_THIS_MONTH = 'hp_total_cop_this_month'
+PARAM_HP_TOTAL_PRODUCED_LAST_MONTH = 'hp_total_produced_last_month'
+PARAM_HP_TOTAL_CONSUMED_LAST_MONTH = 'hp_total_consumed_last_month'
+PARAM_HP_TOTAL_COP_LAST_MONTH = 'hp_total_cop_last_month'
+PARAM_HP_TOTAL_PRODUCED_THIS_YEAR = 'hp_total_produced_this_year'
+PARAM_HP_TOTAL_CONSUMED_THIS_YEAR = 'hp_total_consumed_this_year'
+PARAM_HP_TOTAL_COP_THIS_YEAR = 'hp_total_cop_this_year'
+PARAM_HP_TOTAL_PRODUCED_LAST_YEAR = 'hp_total_produced_last_year'
+PARAM_HP_TOTAL_CONSUMED_LAST_YEAR = 'hp_total_consumed_last_year'
+PARAM_HP_TOTAL_COP_LAST_YEAR = 'hp_total_cop_last_year'
 PARAM_HP_SCOP_RUNNING = 'hp_scop_running'
 PARAM_HP_SCOP_365D = 'hp_scop_365d'
 PARAM_HEATING_FLOW_TEMP = "ch_heating_flow_temp"
@@ -125,9 +146,20 @@ ATTRIBUTES = "attributes"
 DOMAIN = "ariston"
 DATA_ARISTON = DOMAIN
 DEVICES = "devices"
+ACCOUNTS = "accounts"
 SERVICE_SET_DATA = "set_data"
+SERVICE_BACKFILL_STATISTICS = "backfill_statistics"
+SERVICE_REPAIR_STATISTICS = "repair_statistics"
+
+# Zoned parameter names, interned so the same strings are shared with the API handler
+_PARAM_ZONED_NAMES = MappingProxyType({
+    (param, zone): sys.intern(f'{param}_zone{zone}') for param in ZONED_PARAMS for zone in range(1, 10)
+})
 
 def param_zoned(param, zone):
+    zoned = _PARAM_ZONED_NAMES.get((param, zone))
+    if zoned is not None:
+        return zoned
     if param in ZONED_PARAMS:
         return f'{param}_zone{zone}'
     else:
@@ -0,0 +1,76 @@
+"""Push updates of Ariston data to entities."""
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AristonCoordinator:
+    """
+    Coordinator between API change feeds and entities.
+
+    Entities register with the sensors they read. Sensor changes reported by the API
+    mark only the entities depending on them as dirty, status changes (availability,
+    setting of data) mark all entities. Dirty entities are updated once per loop iteration.
+    """
+
+    def __init__(self, hass: HomeAssistant, ariston_api) -> None:
+        """Initialize coordinator and subscribe to API changes."""
+        self._hass = hass
+        self._listeners_by_sensor = dict()
+        self._listeners = set()
+        self._dirty = set()
+        self._flush_scheduled = False
+        ariston_api.subscribe_sensors(self._sensors_changed)
+        ariston_api.subscribe_statuses(self._statuses_changed)
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE, sensors) -> CALLBACK_TYPE:
+        """Listen for changes of sensors, returns function to remove the listener."""
+        sensors = list(sensors)
+        self._listeners.add(update_callback)
+        for sensor in sensors:
+            self._listeners_by_sensor.setdefault(sensor, set()).add(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.discard(update_callback)
+            self._dirty.discard(update_callback)
+            for sensor in sensors:
+                listeners = self._listeners_by_sensor.get(sensor)
+                if listeners is not None:
+                    listeners.discard(update_callback)
+                    if not listeners:
+                        del self._listeners_by_sensor[sensor]
+
+        return remove_listener
+
+    def _sensors_changed(self, changed_data, *args, **kwargs):
+        """Changed sensors reported by API (called outside of event loop)."""
+        self._hass.loop.call_soon_threadsafe(self._async_mark_dirty, list(changed_data))
+
+    def _statuses_changed(self, changed_data, *args, **kwargs):
+        """Changed statuses reported by API (called outside of event loop)."""
+        self._hass.loop.call_soon_threadsafe(self._async_mark_dirty, None)
+
+    @callback
+    def _async_mark_dirty(self, sensors) -> None:
+        """Mark entities as dirty, None marks all entities."""
+        if sensors is None:
+            self._dirty.update(self._listeners)
+        else:
+            for sensor in sensors:
+                self._dirty.update(self._listeners_by_sensor.get(sensor, ()))
+        if self._dirty and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Update dirty entities."""
+        self._flush_scheduled = False
+        dirty, self._dirty = self._dirty, set()
+        _LOGGER.debug("Pushing state of %d entities", len(dirty))
+        for update_callback in dirty:
+            update_callback()
@@ -1,10 +1,10 @@
 """Suppoort for Ariston seletion."""
 import logging
-from datetime import timedelta
 from copy import deepcopy
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
 
 from .const import param_zoned
 from .const import (
@@ -43,8 +43,6 @@ SELECT_DHW_SET_TEMPERATURE = "DHW Set Temperature"
 SELECT_DHW_COMFORT_TEMPERATURE = "DHW Comfort Temperature"
 SELECT_DHW_ECONOMY_TEMPERATURE = "DHW Economy Temperature"
 
-SCAN_INTERVAL = timedelta(seconds=2)
-
 selects_deafult = {
     PARAM_MODE: (SELECT_MODE, "mdi:water-boiler"),
     PARAM_CH_MODE: (SELECT_CH_MODE, "mdi:radiator"),
@@ -99,6 +97,18 @@ class AristonSelect(SelectEntity):
         self._select_type = select_type
         self._state = None
         self._device = device.device
+        self._coordinator = device.api.coordinator
+
+    async def async_added_to_hass(self):
+        """Subscribe to changes of the sensor."""
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._handle_coordinator_update, [self._select_type])
+        )
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Write state pushed by the coordinator."""
+        self.async_write_ha_state()
 
     @property
     def unique_id(self):
@@ -107,8 +117,8 @@ class AristonSelect(SelectEntity):
 
     @property
     def should_poll(self):
-        """Return True if entity has to be polled for state."""
-        return True
+        """Return False as state is pushed by the coordinator."""
+        return False
 
     @property
     def name(self):
@@ -5,8 +5,9 @@ from copy import deepcopy
 import calendar
 
 from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
-from homeassistant.util import slugify
+from homeassistant.util import slugify, dt as dt_util
 
 try:
     from homeassistant.components.recorder.statistics import get_last_statistics
@@ -62,6 +63,24 @@ from .const import (
     PARAM_HP_TOTAL_PRODUCED_TODAY,
     PARAM_HP_TOTAL_CONSUMED_TODAY,
     PARAM_HP_TOTAL_COP,
+    PARAM_HP_TOTAL_PRODUCED_THIS_WEEK,
+    PARAM_HP_TOTAL_CONSUMED_THIS_WEEK,
+    PARAM_HP_TOTAL_COP_THIS_WEEK,
+    PARAM_HP_TOTAL_PRODUCED_LAST_WEEK,
+    PARAM_HP_TOTAL_CONSUMED_LAST_WEEK,
+    PARAM_HP_TOTAL_COP_LAST_WEEK,
+    PARAM_HP_TOTAL_PRODUCED_THIS_MONTH,
+    PARAM_HP_TOTAL_CONSUMED_THIS_MONTH,
+    PARAM_HP_TOTAL_COP_THIS_MONTH,
+    PARAM_HP_TOTAL_PRODUCED_LAST_MONTH,
+    PARAM_HP_TOTAL_CONSUMED_LAST_MONTH,
+    PARAM_HP_TOTAL_COP_LAST_MONTH,
+    PARAM_HP_TOTAL_PRODUCED_THIS_YEAR,
+    PARAM_HP_TOTAL_CONSUMED_THIS_YEAR,
+    PARAM_HP_TOTAL_COP_THIS_YEAR,
+    PARAM_HP_TOTAL_PRODUCED_LAST_YEAR,
+    PARAM_HP_TOTAL_CONSUMED_LAST_YEAR,
+    PARAM_HP_TOTAL_COP_LAST_YEAR,
     PARAM_HP_SCOP_RUNNING,
     PARAM_HP_SCOP_365D,
     PARAM_VERSION,
@@ -75,7 +94,8 @@ from .const import (
     ZONED_PARAMS
 )
 
-SCAN_INTERVAL = timedelta(seconds=2)
+# Only locally computed sensors are polled, others are pushed by the coordinator
+SCAN_INTERVAL = timedelta(minutes=5)
 
 STATE_AVAILABLE = "available"
 
@@ -116,6 +136,24 @@ SENSOR_HP_DHW_COP = 'HP DHW COP'
 SENSOR_HP_TOTAL_PRODUCED_TODAY = 'HP total produced energy today'
 SENSOR_HP_TOTAL_CONSUMED_TODAY = 'HP total consumed energy today'
 SENSOR_HP_TOTAL_COP = 'HP total COP'
+SENSOR_HP_TOTAL_PRODUCED_THIS_WEEK = 'HP total produced energy this week'
+SENSOR_HP_TOTAL_CONSUMED_THIS_WEEK = 'HP total consumed energy this week'
+SENSOR_HP_TOTAL_COP_THIS_WEEK = 'HP total COP this week'
+SENSOR_HP_TOTAL_PRODUCED_LAST_WEEK = 'HP total produced energy last week'
+SENSOR_HP_TOTAL_CONSUMED_LAST_WEEK = 'HP total consumed energy last week'
+SENSOR_HP_TOTAL_COP_LAST_WEEK = 'HP total COP last week'
+SENSOR_HP_TOTAL_PRODUCED_THIS_MONTH = 'HP total produced energy this month'
+SENSOR_HP_TOTAL_CONSUMED_THIS_MONTH = 'HP total consumed energy this month'
+SENSOR_HP_TOTAL_COP_THIS_MONTH = 'HP total COP this month'
+SENSOR_HP_TOTAL_PRODUCED_LAST_MONTH = 'HP total produced energy last month'
+SENSOR_HP_TOTAL_CONSUMED_LAST_MONTH = 'HP total consumed energy last month'
+SENSOR_HP_TOTAL_COP_LAST_MONTH = 'HP total COP last month'
+SENSOR_HP_TOTAL_PRODUCED_THIS_YEAR = 'HP total produced energy this year'
+SENSOR_HP_TOTAL_CONSUMED_THIS_YEAR = 'HP total consumed energy this year'
+SENSOR_HP_TOTAL_COP_THIS_YEAR = 'HP total COP this year'
+SENSOR_HP_TOTAL_PRODUCED_LAST_YEAR = 'HP total produced energy last year'
+SENSOR_HP_TOTAL_CONSUMED_LAST_YEAR = 'HP total consumed energy last year'
+SENSOR_HP_TOTAL_COP_LAST_YEAR = 'HP total COP last year'
 SENSOR_HP_SCOP_RUNNING = 'HP SCOP running'
 SENSOR_HP_SCOP_365D = 'HP SCOP 365d'
 SENSOR_VERSION = 'Integration local version'
@@ -161,12 +199,61 @@ sensors_default = {
     PARAM_HP_TOTAL_PRODUCED_TODAY: [SENSOR_HP_TOTAL_PRODUCED_TODAY, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.MEASUREMENT],
     PARAM_HP_TOTAL_CONSUMED_TODAY: [SENSOR_HP_TOTAL_CONSUMED_TODAY, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.MEASUREMENT],
     PARAM_HP_TOTAL_COP: [SENSOR_HP_TOTAL_COP, None, "mdi:gauge", SensorStateClass.MEASUREMENT],
+    PARAM_HP_TOTAL_PRODUCED_THIS_WEEK: [SENSOR_HP_TOTAL_PRODUCED_THIS_WEEK, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.TOTAL],
+    PARAM_HP_TOTAL_CONSUMED_THIS_WEEK: [SENSOR_HP_TOTAL_CONSUMED_THIS_WEEK, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.TOTAL],
+    PARAM_HP_TOTAL_COP_THIS_WEEK: [SENSOR_HP_TOTAL_COP_THIS_WEEK, None, "mdi:gauge", SensorStateClass.MEASUREMENT],
+    PARAM_HP_TOTAL_PRODUCED_LAST_WEEK: [SENSOR_HP_TOTAL_PRODUCED_LAST_WEEK, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.TOTAL],
+    PARAM_HP_TOTAL_CONSUMED_LAST_WEEK: [SENSOR_HP_TOTAL_CONSUMED_LAST_WEEK, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.TOTAL],
+    PARAM_HP_TOTAL_COP_LAST_WEEK: [SENSOR_HP_TOTAL_COP_LAST_WEEK, None, "mdi:gauge", SensorStateClass.MEASUREMENT],
+    PARAM_HP_TOTAL_PRODUCED_THIS_MONTH: [SENSOR_HP_TOTAL_PRODUCED_THIS_MONTH, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.TOTAL],
+    PARAM_HP_TOTAL_CONSUMED_THIS_MONTH: [SENSOR_HP_TOTAL_CONSUMED_THIS_MONTH, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.TOTAL],
+    PARAM_HP_TOTAL_COP_THIS_MONTH: [SENSOR_HP_TOTAL_COP_THIS_MONTH, None, "mdi:gauge", SensorStateClass.MEASUREMENT],
+    PARAM_HP_TOTAL_PRODUCED_LAST_MONTH: [SENSOR_HP_TOTAL_PRODUCED_LAST_MONTH, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.TOTAL],
+    PARAM_HP_TOTAL_CONSUMED_LAST_MONTH: [SENSOR_HP_TOTAL_CONSUMED_LAST_MONTH, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.TOTAL],
+    PARAM_HP_TOTAL_COP_LAST_MONTH: [SENSOR_HP_TOTAL_COP_LAST_MONTH, None, "mdi:gauge", SensorStateClass.MEASUREMENT],
+    PARAM_HP_TOTAL_PRODUCED_THIS_YEAR: [SENSOR_HP_TOTAL_PRODUCED_THIS_YEAR, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.TOTAL],
+    PARAM_HP_TOTAL_CONSUMED_THIS_YEAR: [SENSOR_HP_TOTAL_CONSUMED_THIS_YEAR, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.TOTAL],
+    PARAM_HP_TOTAL_COP_THIS_YEAR: [SENSOR_HP_TOTAL_COP_THIS_YEAR, None, "mdi:gauge", SensorStateClass.MEASUREMENT],
+    PARAM_HP_TOTAL_PRODUCED_LAST_YEAR: [SENSOR_HP_TOTAL_PRODUCED_LAST_YEAR, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.TOTAL],
+    PARAM_HP_TOTAL_CONSUMED_LAST_YEAR: [SENSOR_HP_TOTAL_CONSUMED_LAST_YEAR, SensorDeviceClass.ENERGY, "mdi:flash", SensorStateClass.TOTAL],
+    PARAM_HP_TOTAL_COP_LAST_YEAR: [SENSOR_HP_TOTAL_COP_LAST_YEAR, None, "mdi:gauge", SensorStateClass.MEASUREMENT],
     PARAM_HP_SCOP_RUNNING: [SENSOR_HP_SCOP_RUNNING, None, "mdi:chart-line", SensorStateClass.MEASUREMENT],
     PARAM_HP_SCOP_365D: [SENSOR_HP_SCOP_365D, None, "mdi:calendar-range", SensorStateClass.MEASUREMENT],
     PARAM_VERSION: [SENSOR_VERSION, None, "mdi:package-down", None],
 }
 
 LOCAL_COMPUTED_SENSORS = {PARAM_HP_SCOP_RUNNING, PARAM_HP_SCOP_365D}
+
+
+def _week_start(day, weeks_back):
+    return day - timedelta(days=day.weekday() + 7 * weeks_back)
+
+
+def _month_start(day, months_back):
+    month = day.year * 12 + day.month - 1 - months_back
+    return day.replace(year=month // 12, month=month % 12 + 1, day=1)
+
+
+def _year_start(day, years_back):
+    return day.replace(year=day.year - years_back, month=1, day=1)
+
+
+# First day of metering period of period energy sensors (weeks start on Monday) by date of the read data,
+# it is their last reset
+PERIOD_SENSORS_START = {
+    PARAM_HP_TOTAL_PRODUCED_THIS_WEEK: lambda day: _week_start(day, 0),
+    PARAM_HP_TOTAL_CONSUMED_THIS_WEEK: lambda day: _week_start(day, 0),
+    PARAM_HP_TOTAL_PRODUCED_LAST_WEEK: lambda day: _week_start(day, 1),
+    PARAM_HP_TOTAL_CONSUMED_LAST_WEEK: lambda day: _week_start(day, 1),
+    PARAM_HP_TOTAL_PRODUCED_THIS_MONTH: lambda day: _month_start(day, 0),
+    PARAM_HP_TOTAL_CONSUMED_THIS_MONTH: lambda day: _month_start(day, 0),
+    PARAM_HP_TOTAL_PRODUCED_LAST_MONTH: lambda day: _month_start(day, 1),
+    PARAM_HP_TOTAL_CONSUMED_LAST_MONTH: lambda day: _month_start(day, 1),
+    PARAM_HP_TOTAL_PRODUCED_THIS_YEAR: lambda day: _year_start(day, 0),
+    PARAM_HP_TOTAL_CONSUMED_THIS_YEAR: lambda day: _year_start(day, 0),
+    PARAM_HP_TOTAL_PRODUCED_LAST_YEAR: lambda day: _year_start(day, 1),
+    PARAM_HP_TOTAL_CONSUMED_LAST_YEAR: lambda day: _year_start(day, 1),
+}
 SCOP_365_HOURLY_SAMPLES = 9000
 SENSORS = deepcopy(sensors_default)
 for param in sensors_default:
@@ -211,10 +298,31 @@ class AristonSensor(SensorEntity):
         self._sensor_type = sensor_type
         self._state = None
         self._attrs = {}
+        self._generation = None
+        self._coordinator = device.api.coordinator
         self._icon = SENSORS[sensor_type][2]
         self._device_class = SENSORS[sensor_type][1]
         self._state_class = SENSORS[sensor_type][3]
 
+    async def async_added_to_hass(self):
+        """Subscribe to changes of the sensor."""
+        if self.should_poll or self._sensor_type == PARAM_VERSION:
+            return
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._handle_coordinator_update, [self._sensor_type])
+        )
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Update state from the snapshot and write it."""
+        self.update()
+        self.async_write_ha_state()
+
+    @property
+    def should_poll(self):
+        """Poll only locally computed sensors, others are pushed by the coordinator."""
+        return self._sensor_type in LOCAL_COMPUTED_SENSORS
+
     @property
     def unique_id(self):
         """Return the unique id."""
@@ -240,6 +348,15 @@ class AristonSensor(SensorEntity):
         """State class of sensor."""
         return self._state_class
 
+    @property
+    def last_reset(self):
+        """Start of metering period of period energy sensors, it follows the data and not the clock."""
+        period_start = PERIOD_SENSORS_START.get(self._sensor_type)
+        read_date = self._api.hp_energy_date
+        if period_start is None or read_date is None:
+            return None
+        return dt_util.start_of_local_day(period_start(read_date))
+
     @property
     def native_unit_of_measurement(self):
         """Return unit of sensor."""
@@ -477,18 +594,24 @@ class AristonSensor(SensorEntity):
                 return
             if not self._api.available:
                 return
-            self._state = self._api.sensor_values[self._sensor_type][VALUE]
-            self._attrs = self._api.sensor_values[self._sensor_type][ATTRIBUTES]
+            generation, sensor_values = self._api.sensor_snapshot
+            if generation == self._generation:
+                # Snapshot has not changed since last update
+                return
+            self._generation = generation
+            sensor_data = sensor_values[self._sensor_type]
+            self._state = sensor_data[VALUE]
+            self._attrs = dict(sensor_data[ATTRIBUTES])
             if not self._attrs:
-                if self._api.sensor_values[self._sensor_type][OPTIONS_TXT]:
-                    self._attrs[OPTIONS_TXT] = self._api.sensor_values[self._sensor_type][OPTIONS_TXT]
-                    self._attrs[OPTIONS] = self._api.sensor_values[self._sensor_type][OPTIONS]
-                elif self._api.sensor_values[self._sensor_type][MIN] and \
-                    self._api.sensor_values[self._sensor_type][MAX] and \
-                    self._api.sensor_values[self._sensor_type][STEP]:
-                    self._attrs[MIN] = self._api.sensor_values[self._sensor_type][MIN]
-                    self._attrs[MAX] = self._api.sensor_values[self._sensor_type][MAX]
-                    self._attrs[STEP] = self._api.sensor_values[self._sensor_type][STEP]
+                if sensor_data[OPTIONS_TXT]:
+                    self._attrs[OPTIONS_TXT] = sensor_data[OPTIONS_TXT]
+                    self._attrs[OPTIONS] = sensor_data[OPTIONS]
+                elif sensor_data[MIN] and \
+                    sensor_data[MAX] and \
+                    sensor_data[STEP]:
+                    self._attrs[MIN] = sensor_data[MIN]
+                    self._attrs[MAX] = sensor_data[MAX]
+                    self._attrs[STEP] = sensor_data[STEP]
             if self._state_class:
                 self._attrs["state_class"] = self._state_class
 
@@ -0,0 +1,438 @@
+"""Import, backfill and repair of Ariston heat pump energy statistics."""
+import asyncio
+import logging
+from datetime import date, timedelta
+from functools import partial
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+try:
+    from homeassistant.components.recorder import get_instance as _get_recorder_instance
+    from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+    from homeassistant.components.recorder.statistics import (
+        async_add_external_statistics,
+        async_import_statistics,
+        get_last_statistics,
+        get_metadata,
+        statistics_during_period,
+    )
+except Exception:
+    # Availability of recorder statistics is checked by the integration setup
+    pass
+
+_LOGGER = logging.getLogger(__name__)
+
+# Energy buckets (days or months) checked against the recorder per query
+BACKFILL_CHUNK_BUCKETS = 31
+# Statistics backfilled at the same time
+BACKFILL_CONCURRENCY = 2
+# Statistics rows written per import, pause in seconds between queries and imports
+BACKFILL_IMPORT_ROWS = 1000
+BACKFILL_PAUSE_SECONDS = 1
+# Missing energy in kWh below which a bucket is considered complete
+BACKFILL_TOLERANCE = 0.001
+# Days searched back for the sum preceding the first backfilled hour
+BACKFILL_BASELINE_DAYS = (2, 32, 800)
+
+BACKFILL_STORAGE_VERSION = 1
+BACKFILL_STORAGE_KEY = "ariston.backfill.{}"
+
+# Heat pump slot importer cursor (running sum and today's imported records) reused by restarts
+IMPORTER_STORAGE_VERSION = 1
+IMPORTER_STORAGE_KEY = "ariston.importer.{}"
+IMPORTER_SAVE_DELAY = 10
+IMPORTER_TOLERANCE = 0.0001
+
+
+def _row_ts(row):
+    """Start of statistics row as epoch, 'start' may be a datetime or a float epoch depending on HA version."""
+    start = row["start"]
+    return start.timestamp() if hasattr(start, "timestamp") else float(start)
+
+
+async def _async_rows(hass, statistic_id, start_time, end_time):
+    """Hourly rows of the statistic as (start epoch, state, sum), oldest first."""
+    stats = await _get_recorder_instance(hass).async_add_executor_job(
+        statistics_during_period, hass, start_time, end_time, {statistic_id}, "hour", None, {"state", "sum"}
+    )
+    return sorted(
+        (_row_ts(row), float(row.get("state") or 0.0), row.get("sum"))
+        for row in stats.get(statistic_id, [])
+    )
+
+
+async def _async_sum_before(hass, statistic_id, start_time):
+    """Sum of the last row before the time, 0 if the statistic has no earlier rows."""
+    for days in BACKFILL_BASELINE_DAYS:
+        rows = await _async_rows(hass, statistic_id, start_time - timedelta(days=days), start_time)
+        rows = [row for row in rows if row[2] is not None]
+        if rows:
+            return float(rows[-1][2])
+    return 0.0
+
+
+def missing_energy_records(buckets, rows):
+    """
+    Return hourly records {start epoch: kWh} completing buckets (start, end, kWh) to their energy.
+
+    Missing energy of a bucket is spread evenly across its hours without a row, or across all its hours
+    when every hour has one, so a day or month missing in statistics does not show up as one hour.
+    """
+    records = {}
+    for start_time, end_time, energy in buckets:
+        start_ts = start_time.timestamp()
+        end_ts = end_time.timestamp()
+        bucket_rows = {row[0]: row[1] for row in rows if start_ts <= row[0] < end_ts}
+        missing = round(energy - sum(bucket_rows.values()), 6)
+        if missing <= BACKFILL_TOLERANCE:
+            continue
+        # Statistics rows start on full UTC hours
+        hours = [float(hour_ts) for hour_ts in range(-int(-start_ts // 3600) * 3600, int(end_ts), 3600)]
+        empty_hours = [hour_ts for hour_ts in hours if hour_ts not in bucket_rows] or hours
+        # Shares are whole micro kWh, the first hours take the remainder so shares add up to missing energy
+        share, remainder = divmod(round(missing * 1e6), len(empty_hours))
+        for index, hour_ts in enumerate(empty_hours):
+            hour_share = (share + (index < remainder)) / 1e6
+            records[hour_ts] = round(bucket_rows.get(hour_ts, 0.0) + hour_share, 6)
+    return records
+
+
+def recomputed_rows(rows, records, base_sum):
+    """
+    Return rows (start epoch, state, sum) from the first record onward whose sum or state changes
+    when records replace or add hourly states, running sum starts at base_sum.
+    """
+    first_ts = min(records)
+    states = {row[0]: (row[1], row[2]) for row in rows if row[0] >= first_ts}
+    for start_ts, state in records.items():
+        states[start_ts] = (state, None)
+    changed = []
+    running_sum = base_sum
+    for start_ts in sorted(states):
+        state, old_sum = states[start_ts]
+        running_sum = round(running_sum + state, 6)
+        if start_ts in records or old_sum is None or abs(float(old_sum) - running_sum) > 1e-6:
+            changed.append((start_ts, state, running_sum))
+    return changed
+
+
+def importer_state_valid(state, day: str) -> bool:
+    """Check saved importer state of a statistic against its per-day checksum."""
+    try:
+        hours = state["hours"]
+        hours_total = sum(float(value) for value in hours.values())
+        return (
+            date.fromisoformat(state["day"]).isoformat() <= day
+            and state["last"] == (list(hours)[-1] if hours else None)
+            and abs(hours_total - float(state["checksum"])) <= IMPORTER_TOLERANCE
+            and abs(float(state["base"]) + hours_total - float(state["sum"])) <= IMPORTER_TOLERANCE
+        )
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return False
+
+
+async def _async_day_base_sum(hass, statistic_id, now):
+    """Seed running sum from the recorder DB when there is no usable saved importer state.
+
+    Returns the cumulative baseline from before today's midnight so today's
+    elapsed slots can be rebuilt deterministically after restart.
+
+    We intentionally do NOT pre-mark today's DB rows as imported because
+    recorder may have written provisional hourly rows for an open 2-hour
+    slot (for example 10:00 before 10-12 is closed). If we pre-mark those
+    starts, the importer cannot overwrite them when the real slot value
+    arrives, leaving stale state/sum rows.
+
+    Falls back to 0.0 when no prior data exists (first-ever run).
+
+    Why 50 entries: SPLIT mode writes up to 24 hourly records per day.
+    Querying only 24 would return only today's records after a busy day,
+    leaving prev_entries empty and resetting the baseline to 0.0 — which
+    then overwrites the DB with wrong (lower) cumulative sums and corrupts
+    the statistics table.
+    """
+    today_midnight_utc = dt_util.as_utc(
+        now.replace(hour=0, minute=0, second=0, microsecond=0)
+    )
+    today_midnight_ts = today_midnight_utc.timestamp()
+    try:
+        last_stats = await _get_recorder_instance(hass).async_add_executor_job(
+            get_last_statistics, hass, 50, statistic_id, False, {"sum", "start"}
+        )
+    except Exception as ex:  # noqa: BLE001
+        _LOGGER.warning("Could not query DB state for %s: %s", statistic_id, ex)
+        return 0.0
+
+    entries = last_stats.get(statistic_id, [])
+    if not entries:
+        return 0.0
+
+    # Seed baseline from the latest entry BEFORE local midnight so today's
+    # rows are always recomputed from a stable pre-day anchor.
+    valid_entries = [e for e in entries if e.get("start") is not None and e.get("sum") is not None]
+    if not valid_entries:
+        return 0.0
+
+    previous_day_entries = [e for e in valid_entries if _row_ts(e) < today_midnight_ts]
+    baseline_sum = 0.0
+    if previous_day_entries:
+        previous_day_entries.sort(key=_row_ts, reverse=True)
+        baseline_sum = float(previous_day_entries[0].get("sum") or 0.0)
+
+    latest_sum = float(max(valid_entries, key=_row_ts).get("sum") or 0.0)
+    today_rows = sum(1 for e in valid_entries if _row_ts(e) >= today_midnight_ts)
+    _LOGGER.debug(
+        "DB baseline for %s: baseline_pre_midnight=%.6f, latest_sum_any_day=%.6f, existing_today_rows=%d",
+        statistic_id,
+        baseline_sum,
+        latest_sum,
+        today_rows,
+    )
+    return baseline_sum
+
+
+class AristonSlotImporter:
+    """Import of closed heat pump energy slots into lifetime statistics with a persisted cursor."""
+
+    def __init__(self, hass, store, split=True):
+        """Initialize."""
+        self._hass = hass
+        self._store = store
+        self._split = split
+        self._states = {}
+
+    async def async_load(self):
+        """Load saved importer state of all statistics."""
+        self._states = await self._store.async_load() or {}
+
+    def _async_delay_save(self):
+        self._store.async_delay_save(lambda: self._states, IMPORTER_SAVE_DELAY)
+
+    async def _async_state(self, statistic_id, now):
+        """Return importer state of the statistic for today, the recorder is queried only without usable saved state."""
+        day = now.date().isoformat()
+        state = self._states.get(statistic_id)
+        if state is None or not importer_state_valid(state, day):
+            if state is not None:
+                _LOGGER.warning("Saved importer state of %s is not consistent, seeding it from the recorder", statistic_id)
+            baseline = await _async_day_base_sum(self._hass, statistic_id, now)
+            state = {"day": day, "base": baseline, "sum": baseline, "last": None, "hours": {}, "checksum": 0.0}
+            self._states[statistic_id] = state
+        elif state["day"] != day:
+            # Running sum carries over to the next day, only its imported records start empty
+            state = {"day": day, "base": state["sum"], "sum": state["sum"], "last": None, "hours": {}, "checksum": 0.0}
+            self._states[statistic_id] = state
+        return state
+
+    async def async_import(self, statistic_id, slot_points, now):
+        """Import closed slots [(slot start, kWh)] of today oldest first, slots imported before are skipped."""
+        state = await self._async_state(statistic_id, now)
+        imported_hours = state["hours"]
+
+        stats_payload = []
+        for slot_start, slot_value in slot_points:
+            if self._split:
+                # Divide the 2-hour bucket evenly across two 1-hour records.
+                half_value = round(slot_value / 2, 6)
+                records = ((slot_start, half_value), (slot_start + timedelta(hours=1), half_value))
+            else:
+                # Verbatim: one record at the slot start with the full value.
+                records = ((slot_start, slot_value),)
+
+            for record_start, record_value in records:
+                record_key = record_start.isoformat()
+                if record_key in imported_hours:
+                    continue
+                state["sum"] = round(state["sum"] + record_value, 6)
+                state["last"] = record_key
+                imported_hours[record_key] = record_value
+                stats_payload.append(
+                    StatisticData(
+                        start=record_start,
+                        state=record_value,
+                        sum=state["sum"],
+                    )
+                )
+
+        if not stats_payload:
+            return
+
+        metadata = StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=None,
+            source="recorder",
+            statistic_id=statistic_id,
+            unit_of_measurement="kWh",
+        )
+        async_import_statistics(self._hass, metadata, stats_payload)
+        state["checksum"] = round(sum(imported_hours.values()), 6)
+        self._async_delay_save()
+
+    def reset(self, statistic_id):
+        """Drop importer state of a rewritten statistic, it is seeded from the recorder again."""
+        if self._states.pop(statistic_id, None) is not None:
+            self._async_delay_save()
+
+
+class AristonStatisticsBackfill:
+    """Backfill of energy statistics from heat pump metering history with a persisted cursor."""
+
+    def __init__(self, hass, store, on_statistic_done=None):
+        """Initialize."""
+        self._hass = hass
+        self._store = store
+        self._on_statistic_done = on_statistic_done
+        self._cursor = None
+        self._semaphore = asyncio.Semaphore(BACKFILL_CONCURRENCY)
+        self._lock = asyncio.Lock()
+
+    async def _async_save(self):
+        await self._store.async_save(self._cursor)
+
+    async def async_run(self, histories, restart=False):
+        """
+        Backfill statistics from histories {statistic_id: [(first day, day after last day, kWh)]}.
+
+        Buckets before the saved cursor are skipped unless restart is requested, found records are
+        saved with the cursor so an interrupted run continues where it stopped.
+        """
+        async with self._lock:
+            if self._cursor is None or restart:
+                self._cursor = {} if restart else (await self._store.async_load() or {})
+            await asyncio.gather(*(
+                self._async_backfill(statistic_id, history)
+                for statistic_id, history in histories.items()
+            ))
+
+    async def _async_backfill(self, statistic_id, history):
+        async with self._semaphore:
+            cursor = self._cursor.setdefault(statistic_id, {"day": None, "records": {}})
+            buckets = [
+                (dt_util.as_utc(dt_util.start_of_local_day(first_day)),
+                 dt_util.as_utc(dt_util.start_of_local_day(end_day)),
+                 energy, first_day)
+                for first_day, end_day, energy in history
+                if cursor["day"] is None or first_day.isoformat() > cursor["day"]
+            ]
+            for index in range(0, len(buckets), BACKFILL_CHUNK_BUCKETS):
+                chunk = buckets[index:index + BACKFILL_CHUNK_BUCKETS]
+                rows = await _async_rows(self._hass, statistic_id, chunk[0][0], chunk[-1][1])
+                records = missing_energy_records([bucket[:3] for bucket in chunk], rows)
+                cursor["records"].update({str(int(start_ts)): state for start_ts, state in records.items()})
+                cursor["day"] = chunk[-1][3].isoformat()
+                await self._async_save()
+                _LOGGER.debug("Backfill of %s checked until %s, %d records found", statistic_id, cursor["day"], len(records))
+                await asyncio.sleep(BACKFILL_PAUSE_SECONDS)
+            if cursor["records"]:
+                await self._async_import(statistic_id, {int(start_ts): state for start_ts, state in cursor["records"].items()})
+                cursor["records"] = {}
+                await self._async_save()
+                if self._on_statistic_done is not None:
+                    self._on_statistic_done(statistic_id)
+
+    async def _async_import(self, statistic_id, records):
+        """Import records and rebuild running sum from the first record onward."""
+        first_time = dt_util.utc_from_timestamp(min(records))
+        base_sum = await _async_sum_before(self._hass, statistic_id, first_time)
+        rows = await _async_rows(self._hass, statistic_id, first_time, dt_util.utcnow() + timedelta(hours=1))
+        changed = recomputed_rows(rows, records, base_sum)
+        metadata = StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=None,
+            source="recorder",
+            statistic_id=statistic_id,
+            unit_of_measurement="kWh",
+        )
+        for index in range(0, len(changed), BACKFILL_IMPORT_ROWS):
+            async_import_statistics(self._hass, metadata, [
+                StatisticData(start=dt_util.utc_from_timestamp(start_ts), state=state, sum=running_sum)
+                for start_ts, state, running_sum in changed[index:index + BACKFILL_IMPORT_ROWS]
+            ])
+            await asyncio.sleep(BACKFILL_PAUSE_SECONDS)
+        await _get_recorder_instance(self._hass).async_block_till_done()
+        _LOGGER.info(
+            "Backfilled %d hours of %s, %d rows rewritten from %s",
+            len(records), statistic_id, len(changed), first_time.isoformat())
+
+
+def slot_hour_states(slots, split=True, slot_hours=2):
+    """
+    Return hourly states {start epoch: kWh} of corrected slots {slot start: kWh}.
+
+    Slot value is divided evenly across its hours when split, otherwise it is kept in the first hour
+    and the other hours get 0.
+    """
+    hour_states = {}
+    for slot_start, energy in slots.items():
+        start_ts = dt_util.as_utc(slot_start).timestamp()
+        for hour in range(slot_hours):
+            if split:
+                hour_states[start_ts + hour * 3600] = round(energy / slot_hours, 6)
+            else:
+                hour_states[start_ts + hour * 3600] = energy if hour == 0 else 0.0
+    return hour_states
+
+
+def repaired_rows(rows, hour_states, base_sum):
+    """
+    Return rows (start epoch, state, sum) of the corrected range changed by hourly states and the
+    difference of sum at the last corrected hour, by which sums of all later rows move.
+
+    rows are existing rows (start epoch, state, sum) of the range oldest first, running sum starts at
+    base_sum.
+    """
+    first_ts = min(hour_states)
+    last_ts = max(hour_states)
+    existing = {row[0]: row for row in rows if first_ts <= row[0] <= last_ts}
+    changed = []
+    running_sum = old_sum = base_sum
+    for start_ts in sorted({*existing, *hour_states}):
+        row = existing.get(start_ts)
+        state = hour_states[start_ts] if start_ts in hour_states else row[1]
+        running_sum = round(running_sum + state, 6)
+        if row is not None and row[2] is not None:
+            old_sum = float(row[2])
+        if row is None or row[1] != state or row[2] is None or abs(float(row[2]) - running_sum) > 1e-6:
+            changed.append((start_ts, state, running_sum))
+    return changed, round(running_sum - old_sum, 6)
+
+
+async def async_repair_statistics(hass, statistic_id, hour_states):
+    """
+    Repair hourly states of a statistic, returns number of rows changed.
+
+    Corrected rows are imported with recomputed sums and sums of later rows are adjusted by the recorder,
+    both are queued one after the other so they are written in order with its own statistics.
+    """
+    instance = _get_recorder_instance(hass)
+    metadata = await instance.async_add_executor_job(partial(get_metadata, hass, statistic_ids={statistic_id}))
+    if statistic_id not in metadata:
+        raise HomeAssistantError(f"Unknown statistic {statistic_id}")
+    metadata = metadata[statistic_id][1]
+    if not metadata["has_sum"]:
+        raise HomeAssistantError(f"Statistic {statistic_id} has no sum")
+
+    await instance.async_block_till_done()
+    first_time = dt_util.utc_from_timestamp(min(hour_states))
+    end_time = dt_util.utc_from_timestamp(max(hour_states)) + timedelta(hours=1)
+    base_sum = await _async_sum_before(hass, statistic_id, first_time)
+    rows = await _async_rows(hass, statistic_id, first_time, end_time)
+    changed, delta = repaired_rows(rows, hour_states, base_sum)
+
+    if changed:
+        # External statistics 'domain:name' are written with their own source
+        import_statistics = async_add_external_statistics if ":" in statistic_id else async_import_statistics
+        import_statistics(hass, metadata, [
+            StatisticData(start=dt_util.utc_from_timestamp(start_ts), state=state, sum=running_sum)
+            for start_ts, state, running_sum in changed
+        ])
+    if abs(delta) > 1e-6:
+        instance.async_adjust_statistics(statistic_id, end_time, delta, metadata["unit_of_measurement"])
+    await instance.async_block_till_done()
+    _LOGGER.info(
+        "Repaired %d hours of %s, %d rows changed, later sums moved by %s",
+        len(hour_states), statistic_id, len(changed), delta)
+    return len(changed)
@@ -1,9 +1,9 @@
 """Suppoort for Ariston switch."""
 import logging
-from datetime import timedelta
 from copy import deepcopy
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
 
 from .const import param_zoned
 from .const import (
@@ -28,8 +28,6 @@ SWITCH_INTERNET_WEATHER = "Internet Weather"
 SWITCH_THERMAL_CLEANSE_FUNCTION = "Thermal Cleanse Function"
 SWITCH_POWER = "Power"
 
-SCAN_INTERVAL = timedelta(seconds=2)
-
 switches_default = {
     PARAM_INTERNET_TIME: (SWITCH_INTERNET_TIME, "mdi:update"),
     PARAM_INTERNET_WEATHER: (SWITCH_INTERNET_WEATHER, "mdi:weather-partly-cloudy"),
@@ -76,6 +74,18 @@ class AristonSwitch(SwitchEntity):
         self._switch_type = switch_type
         self._state = None
         self._device = device.device
+        self._coordinator = device.api.coordinator
+
+    async def async_added_to_hass(self):
+        """Subscribe to changes of the sensor."""
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._handle_coordinator_update, [self._switch_type])
+        )
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Write state pushed by the coordinator."""
+        self.async_write_ha_state()
 
     @property
     def unique_id(self):
@@ -84,8 +94,8 @@ class AristonSwitch(SwitchEntity):
 
     @property
     def should_poll(self):
-        """Return True if entity has to be polled for state."""
-        return True
+        """Return False as state is pushed by the coordinator."""
+        return False
 
     @property
     def name(self):
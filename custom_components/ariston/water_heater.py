@@ -1,6 +1,5 @@
 """Support for Ariston water heaters."""
 import logging
-from datetime import timedelta
 
 from homeassistant.components.water_heater import (
     WaterHeaterEntity,
@@ -12,6 +11,7 @@ from homeassistant.const import (
     CONF_NAME,
     UnitOfTemperature,
 )
+from homeassistant.core import callback
 
 from .const import (
     DATA_ARISTON,
@@ -38,8 +38,6 @@ ACTION_IDLE = "idle"
 ACTION_HEATING = "heating"
 UNKNOWN_TEMP = 0.0
 
-SCAN_INTERVAL = timedelta(seconds=2)
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -58,6 +56,26 @@ class AristonWaterHeater(WaterHeaterEntity):
         """Initialize the thermostat."""
         self._name = name
         self._api = device.api.ariston_api
+        self._coordinator = device.api.coordinator
+
+    async def async_added_to_hass(self):
+        """Subscribe to changes of sensors used by the entity."""
+        self.async_on_remove(
+            self._coordinator.async_add_listener(
+                self._handle_coordinator_update,
+                [
+                    PARAM_MODE,
+                    PARAM_DHW_MODE,
+                    PARAM_DHW_STORAGE_TEMPERATURE,
+                    PARAM_DHW_SET_TEMPERATURE,
+                ],
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Write state pushed by the coordinator."""
+        self.async_write_ha_state()
 
     @property
     def unique_id(self):
@@ -86,8 +104,8 @@ class AristonWaterHeater(WaterHeaterEntity):
 
     @property
     def should_poll(self):
-        """Polling is required."""
-        return True
+        """Return False as state is pushed by the coordinator."""
+        return False
 
     @property
     def available(self):
@@ -0,0 +1,43 @@
+"""Tests of the Ariston handler running on asyncio event loop."""
+import asyncio
+import threading
+
+from custom_components.ariston.ariston import AristonHandler, AsyncAristonHandler
+
+
+def _handler():
+    handler = AsyncAristonHandler("user", "password", sensors=list(AristonHandler._SENSOR_LIST))
+    handler._TIME_SPLIT = 0
+    return handler
+
+
+async def test_requests_are_sent_one_at_a_time(monkeypatch):
+    handler = _handler()
+    running = []
+    sent = []
+
+    async def slow_request(request_type):
+        running.append(request_type)
+        assert len(running) == 1
+        await asyncio.sleep(0.02)
+        sent.append(request_type)
+        running.remove(request_type)
+
+    monkeypatch.setattr(handler, "_next_request", lambda: (handler._REQUEST_MAIN, 0))
+    monkeypatch.setattr(handler, "_async_control_availability_state", slow_request)
+    handler.start()
+    await asyncio.sleep(0.1)
+    await handler.async_stop()
+    assert 2 <= len(sent) <= 5
+
+
+async def test_values_from_other_threads_are_set_on_the_loop(monkeypatch):
+    handler = _handler()
+    threads = []
+    monkeypatch.setattr(AristonHandler, "set_http_data", lambda self, **values: threads.append(
+        (threading.get_ident(), values)))
+    handler.start()
+    await asyncio.get_running_loop().run_in_executor(None, lambda: handler.set_http_data(mode="OFF"))
+    handler.set_http_data(mode="ON")
+    await handler.async_stop()
+    assert threads == [(threading.get_ident(), {"mode": "OFF"}), (threading.get_ident(), {"mode": "ON"})]
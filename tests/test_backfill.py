@@ -0,0 +1,43 @@
+"""Tests of backfill of heat pump energy statistics."""
+from datetime import datetime, timedelta, timezone
+
+from custom_components.ariston.stats import missing_energy_records
+
+DAY = datetime(2026, 4, 15, tzinfo=timezone.utc)
+DAY_TS = DAY.timestamp()
+HOUR = 3600
+
+
+def test_complete_bucket_has_no_records():
+    rows = [(DAY_TS + HOUR * hour, 0.5, None) for hour in range(4)]
+    assert missing_energy_records([(DAY, DAY + timedelta(days=1), 2.0)], rows) == {}
+    assert missing_energy_records([(DAY, DAY + timedelta(days=1), 2.0005)], rows) == {}
+
+
+def test_partially_filled_bucket_spreads_missing_energy_over_empty_hours():
+    rows = [(DAY_TS + HOUR * hour, 0.2, None) for hour in range(24) if hour not in (3, 4, 10, 23)]
+    records = missing_energy_records([(DAY, DAY + timedelta(days=1), 6.0)], rows)
+    assert records == {DAY_TS + HOUR * hour: 0.5 for hour in (3, 4, 10, 23)}
+
+
+def test_filled_bucket_spreads_missing_energy_over_all_hours():
+    rows = [(DAY_TS + HOUR * hour, 0.1, None) for hour in range(24)]
+    records = missing_energy_records([(DAY, DAY + timedelta(days=1), 3.0)], rows)
+    assert len(records) == 24
+    assert set(records.values()) == {0.125}
+
+
+def test_missing_energy_shares_add_up():
+    rows = [(DAY_TS + HOUR * hour, 0.0, None) for hour in range(3, 24)]
+    records = missing_energy_records([(DAY, DAY + timedelta(days=1), 1.0)], rows)
+    assert records == {DAY_TS: 0.333334, DAY_TS + HOUR: 0.333333, DAY_TS + 2 * HOUR: 0.333333}
+    month = missing_energy_records([(DAY, DAY + timedelta(days=31), 0.002)], [])
+    assert len(month) == 31 * 24
+    assert min(month.values()) >= 0
+    assert round(sum(month.values()), 6) == 0.002
+
+
+def test_empty_bucket_starts_on_full_hour():
+    start = DAY + timedelta(minutes=30)
+    records = missing_energy_records([(start, start + timedelta(hours=3), 0.3)], [])
+    assert records == {DAY_TS + HOUR: 0.1, DAY_TS + 2 * HOUR: 0.1, DAY_TS + 3 * HOUR: 0.1}
\ No newline at end of file
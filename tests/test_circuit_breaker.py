@@ -0,0 +1,42 @@
+"""Tests of per-request circuit breakers of the API client."""
+from custom_components.ariston.api_client import CircuitBreaker
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, backoff=10, backoff_max=40)
+    assert not breaker.record_failure(100, "transport")
+    assert not breaker.record_failure(100, "transport")
+    assert breaker.allow(100)
+    assert breaker.record_failure(100, "transport")
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow(100)
+    assert 5 <= breaker.retry_in(100) <= 10
+
+
+def test_breaker_half_open_trial_closes_or_reopens():
+    breaker = CircuitBreaker(failure_threshold=1, backoff=10, backoff_max=40)
+    breaker.record_failure(0, "other")
+    assert breaker.allow(10)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Failed trial opens the circuit with doubled backoff
+    assert breaker.record_failure(10, "other")
+    assert breaker.state == CircuitBreaker.OPEN
+    assert 20 <= breaker.open_until <= 30
+    assert breaker.allow(30)
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+    assert breaker.retry_in(30) == 0
+
+
+def test_breaker_opens_at_once_when_throttled_and_caps_backoff():
+    breaker = CircuitBreaker(failure_threshold=5, backoff=10, backoff_max=15)
+    assert breaker.record_failure(0, "throttled", throttled=True)
+    assert breaker.last_error == "throttled"
+    for _ in range(5):
+        breaker.allow(breaker.open_until)
+        breaker.record_failure(breaker.open_until, "throttled", throttled=True)
+    start = breaker.open_until
+    breaker.allow(start)
+    breaker.record_failure(start, "throttled", throttled=True)
+    assert start + 7.5 <= breaker.open_until <= start + 15
@@ -0,0 +1,94 @@
+"""Tests of the limit of requests sent at the same time by handlers sharing the API client."""
+import asyncio
+import logging
+import threading
+import time
+
+from custom_components.ariston.api_client import AristonApiClient, AsyncAristonApiClient
+
+REQUESTS = 12
+
+
+class InFlight:
+    """Count of requests being answered and its maximum."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = 0
+        self.peak = 0
+
+    def enter(self):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def exit(self):
+        with self.lock:
+            self.current -= 1
+
+
+class FakeResponse:
+    status_code = status = 200
+    ok = True
+    history = ()
+    content = b'[{"gwId": "gw1"}]'
+    url = ""
+
+    def json(self):
+        return [{"gwId": "gw1"}]
+
+    async def read(self):
+        return self.content
+
+
+class FakeSession:
+    def __init__(self, in_flight):
+        self.in_flight = in_flight
+
+    def get(self, url, **kwargs):
+        self.in_flight.enter()
+        time.sleep(0.05)
+        self.in_flight.exit()
+        return FakeResponse()
+
+
+class FakeAsyncSession:
+    closed = False
+
+    def __init__(self, in_flight):
+        self.in_flight = in_flight
+
+    def request(self, method, url, **kwargs):
+        in_flight = self.in_flight
+
+        class Context:
+            async def __aenter__(self):
+                in_flight.enter()
+                await asyncio.sleep(0.01)
+                return FakeResponse()
+
+            async def __aexit__(self, *args):
+                in_flight.exit()
+                return False
+
+        return Context()
+
+
+def test_requests_of_threads_are_limited():
+    in_flight = InFlight()
+    client = AristonApiClient(logging.getLogger(__name__))
+    client._session = FakeSession(in_flight)
+    threads = [threading.Thread(target=client.get_gateways) for _ in range(REQUESTS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert in_flight.peak == AristonApiClient._REQUESTS_CONCURRENCY
+
+
+async def test_requests_of_tasks_are_limited():
+    in_flight = InFlight()
+    client = AsyncAristonApiClient(logging.getLogger(__name__), session=FakeAsyncSession(in_flight))
+    results = await asyncio.gather(*(client.get_gateways() for _ in range(REQUESTS)))
+    assert results == [["gw1"]] * REQUESTS
+    assert in_flight.peak == AristonApiClient._REQUESTS_CONCURRENCY
@@ -0,0 +1,61 @@
+"""Tests of heat pump energy reads aligned to closing of 2-hour slots."""
+import datetime
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.ariston import ariston
+from custom_components.ariston.ariston import AristonHandler
+
+HP_ENERGY = AristonHandler._REQUEST_HP_ENERGY
+KEY = sorted(key for key in AristonHandler._HP_ENERGY_SERIES if key[1] == AristonHandler._HP_ENERGY_CURRENT_DAY)[0]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Local time seen by the handler"""
+    clock = SimpleNamespace(now=None)
+
+    class FakeDatetime(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock.now
+
+    monkeypatch.setattr(ariston, "datetime", SimpleNamespace(
+        datetime=FakeDatetime, date=datetime.date, timedelta=datetime.timedelta))
+    return clock
+
+
+def _handler():
+    return AristonHandler("user", "password", sensors=list(AristonHandler._LIST_HP_ENERGY), hp_energy_delay=300)
+
+
+def _series(*slots):
+    return {KEY: (list(slots), {})}
+
+
+def _read(handler, clock, hour, minute, hp_energy_series):
+    """Send heat pump energy request and return seconds until the following one"""
+    clock.now = datetime.datetime(2026, 1, 10, hour, minute)
+    now = time.monotonic()
+    handler._reschedule_request(HP_ENERGY, now)
+    handler._check_hp_energy_slot(hp_energy_series)
+    return round(handler._requests_due[HP_ENERGY] - now)
+
+
+def test_idle_slot_is_closed_after_delay(clock):
+    handler = _handler()
+    assert _read(handler, clock, 2, 5, _series(0.0, 0.0)) == 7200
+    # Values of idle heat pump do not change, the slot is closed by time
+    assert _read(handler, clock, 4, 5, _series(0.0, 0.0, 0.0)) == 7200
+    assert handler._hp_energy_attempts == 1
+
+
+def test_changed_values_close_slot_before_delay(clock):
+    handler = _handler()
+    assert _read(handler, clock, 2, 5, _series(0.0, 0.2)) == 7200
+    # Open slot of previous read is not reported closed yet, retry until the delay passes
+    assert _read(handler, clock, 4, 1, _series(0.0, 0.2, 0.0)) == handler._HP_ENERGY_RETRY_SECONDS
+    assert _read(handler, clock, 4, 4, _series(0.0, 0.2, 0.0)) == 60
+    assert _read(handler, clock, 4, 4, _series(0.0, 0.5, 0.0)) == 7260
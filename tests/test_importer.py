@@ -0,0 +1,120 @@
+"""Tests of heat pump slot import with persisted importer state."""
+from datetime import datetime, timedelta
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_import_statistics, statistics_during_period
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from pytest_homeassistant_custom_component.components.recorder.common import async_wait_recording_done
+
+from custom_components.ariston import stats
+from custom_components.ariston.stats import (
+    AristonSlotImporter,
+    IMPORTER_SAVE_DELAY,
+    IMPORTER_STORAGE_KEY,
+    IMPORTER_STORAGE_VERSION,
+)
+
+STATISTIC_ID = "sensor.ariston_hp_ch_consumed_energy_lifetime"
+STORAGE_KEY = IMPORTER_STORAGE_KEY.format("entry")
+
+
+def _local(day, hour, minute=0):
+    return datetime(2026, 4, day, hour, minute, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+
+async def _async_importer(hass):
+    importer = AristonSlotImporter(hass, Store(hass, IMPORTER_STORAGE_VERSION, STORAGE_KEY))
+    await importer.async_load()
+    return importer
+
+
+async def _async_flush(hass):
+    """Write delayed save of the importer state and statistics."""
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=IMPORTER_SAVE_DELAY + 1))
+    await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+
+async def _async_sums(hass):
+    rows = await get_instance(hass).async_add_executor_job(
+        statistics_during_period, hass, _local(13, 0), None, {STATISTIC_ID}, "hour", None, {"state", "sum"})
+    return [row["sum"] for row in rows[STATISTIC_ID]]
+
+
+def _no_recorder_seed(monkeypatch):
+    async def seed(*args):
+        raise AssertionError("importer state is seeded from the recorder")
+    monkeypatch.setattr(stats, "_async_day_base_sum", seed)
+
+
+async def test_saved_state_is_loaded_after_restart(recorder_mock, hass, hass_storage, monkeypatch):
+    importer = await _async_importer(hass)
+    await importer.async_import(STATISTIC_ID, [(_local(15, 0), 1.0), (_local(15, 2), 0.5)], _local(15, 4, 5))
+    await _async_flush(hass)
+    saved = hass_storage[STORAGE_KEY]["data"][STATISTIC_ID]
+    assert saved["day"] == "2026-04-15"
+    assert (saved["base"], saved["sum"], saved["checksum"]) == (0.0, 1.5, 1.5)
+    assert saved["last"] == _local(15, 3).isoformat()
+
+    # Restarted importer skips imported slots without querying the recorder
+    _no_recorder_seed(monkeypatch)
+    importer = await _async_importer(hass)
+    await importer.async_import(
+        STATISTIC_ID, [(_local(15, 0), 1.0), (_local(15, 2), 0.5), (_local(15, 4), 0.2)], _local(15, 6, 5))
+    await _async_flush(hass)
+    assert await _async_sums(hass) == [0.5, 1.0, 1.25, 1.5, 1.6, 1.7]
+    assert hass_storage[STORAGE_KEY]["data"][STATISTIC_ID]["sum"] == 1.7
+
+
+async def test_corrupted_state_is_seeded_from_recorder(recorder_mock, hass, hass_storage):
+    async_import_statistics(hass, StatisticMetaData(
+        has_mean=False,
+        has_sum=True,
+        name=None,
+        source="recorder",
+        statistic_id=STATISTIC_ID,
+        unit_of_measurement="kWh",
+    ), [
+        StatisticData(start=_local(14, 23), state=1.0, sum=10.0),
+        # Provisional row of today is not used as baseline
+        StatisticData(start=_local(15, 0), state=3.0, sum=13.0),
+    ])
+    await async_wait_recording_done(hass)
+    hass_storage[STORAGE_KEY] = {
+        "version": IMPORTER_STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": {STATISTIC_ID: {
+            "day": "2026-04-15",
+            "base": 2.0,
+            "sum": 3.0,
+            "last": _local(15, 1).isoformat(),
+            "hours": {_local(15, 0).isoformat(): 0.5, _local(15, 1).isoformat(): 0.5},
+            "checksum": 1.5,
+        }},
+    }
+
+    importer = await _async_importer(hass)
+    await importer.async_import(STATISTIC_ID, [(_local(15, 0), 1.0)], _local(15, 2, 5))
+    await _async_flush(hass)
+    saved = hass_storage[STORAGE_KEY]["data"][STATISTIC_ID]
+    assert (saved["base"], saved["sum"], saved["checksum"]) == (10.0, 11.0, 1.0)
+    assert await _async_sums(hass) == [10.0, 10.5, 11.0]
+
+
+async def test_running_sum_continues_after_midnight(recorder_mock, hass, hass_storage, monkeypatch):
+    importer = await _async_importer(hass)
+    await importer.async_import(STATISTIC_ID, [(_local(14, 18), 1.0), (_local(14, 20), 0.6)], _local(14, 22, 5))
+    await _async_flush(hass)
+
+    _no_recorder_seed(monkeypatch)
+    importer = await _async_importer(hass)
+    await importer.async_import(STATISTIC_ID, [(_local(15, 0), 0.4)], _local(15, 2, 5))
+    await _async_flush(hass)
+    saved = hass_storage[STORAGE_KEY]["data"][STATISTIC_ID]
+    assert saved["day"] == "2026-04-15"
+    assert (saved["base"], saved["sum"], saved["checksum"]) == (1.6, 2.0, 0.4)
+    assert list(saved["hours"]) == [_local(15, 0).isoformat(), _local(15, 1).isoformat()]
+    assert await _async_sums(hass) == [0.5, 1.0, 1.3, 1.6, 1.8, 2.0]
@@ -0,0 +1,63 @@
+"""Tests of setup and service schemas of the Ariston integration."""
+from datetime import datetime
+
+import pytest
+import voluptuous as vol
+from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_USERNAME
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ariston import BACKFILL_STATISTICS_SCHEMA, REPAIR_STATISTICS_SCHEMA, async_setup_entry
+from custom_components.ariston.const import ACCOUNTS, DATA_ARISTON, DEVICES, DOMAIN
+
+
+def test_repair_schema_coerces_fields():
+    assert REPAIR_STATISTICS_SCHEMA({
+        "statistic_id": "sensor.ariston_hp_ch_consumed_energy_lifetime",
+        "slots": {"2026-04-15 20:00": "0.4"},
+        "split": "false",
+    }) == {
+        "statistic_id": "sensor.ariston_hp_ch_consumed_energy_lifetime",
+        "slots": {datetime(2026, 4, 15, 20): 0.4},
+        "split": False,
+    }
+    assert REPAIR_STATISTICS_SCHEMA({"statistic_id": "sensor.energy", "slots": {}})["split"] is True
+
+
+def test_repair_schema_accepts_external_statistic():
+    data = REPAIR_STATISTICS_SCHEMA({"statistic_id": "ariston:hp_ch_consumed_energy", "slots": {}})
+    assert data["statistic_id"] == "ariston:hp_ch_consumed_energy"
+
+
+@pytest.mark.parametrize("data", [
+    {"slots": {"2026-04-15 20:00": 0.4}},
+    {"statistic_id": "sensor.energy"},
+    {"statistic_id": "sensor.energy", "slots": [0.4]},
+    {"statistic_id": "sensor.energy", "slots": {"2026-04-15 20:00": "high"}},
+    {"statistic_id": "sensor.energy", "slots": {"2026-04-15 20:00": -1}},
+    {"statistic_id": "sensor.energy", "slots": {"2026-13-01 20:00": 0.4}},
+    {"statistic_id": "energy", "slots": {"2026-04-15 20:00": 0.4}},
+    {"statistic_id": "ariston:", "slots": {"2026-04-15 20:00": 0.4}},
+    {"statistic_id": "ariston:hp__energy", "slots": {"2026-04-15 20:00": 0.4}},
+])
+def test_repair_schema_rejects_invalid_fields(data):
+    with pytest.raises(vol.Invalid):
+        REPAIR_STATISTICS_SCHEMA(data)
+
+
+def test_backfill_schema_coerces_restart():
+    assert BACKFILL_STATISTICS_SCHEMA({"restart": "true"}) == {"restart": True}
+
+
+async def test_failed_setup_releases_account_client(hass, monkeypatch):
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_NAME: "Ariston", CONF_USERNAME: "user", CONF_PASSWORD: "pw"})
+    entry.add_to_hass(hass)
+    hass.data[DATA_ARISTON] = {DEVICES: {}}
+
+    async def fail_forward(*args):
+        raise RuntimeError("platform setup failed")
+
+    monkeypatch.setattr(hass.config_entries, "async_forward_entry_setups", fail_forward)
+    with pytest.raises(RuntimeError):
+        await async_setup_entry(hass, entry)
+    assert hass.data[DATA_ARISTON][DEVICES] == {}
+    assert hass.data[DATA_ARISTON][ACCOUNTS] == {}
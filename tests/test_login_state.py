@@ -0,0 +1,38 @@
+"""Tests of saved login state restored into a session shared by handlers."""
+import logging
+import time
+
+from custom_components.ariston.api_client import AristonApiClient
+from custom_components.ariston.ariston import AristonHandler
+
+
+def _login_state(plant_id, cookie):
+    return {
+        "user": "user",
+        "saved": time.time(),
+        "plant_id": plant_id,
+        "features": {"zones": [{"num": 1}]},
+        "cookies": [{"name": "session", "value": cookie, "domain": "www.ariston-net.remotethermo.com", "path": "/"}],
+    }
+
+
+def _handler(client, login_state):
+    handler = AristonHandler("user", "password", login_state=login_state)
+    handler._api_client = client
+    return handler
+
+
+def test_only_first_handler_restores_shared_session():
+    client = AristonApiClient(logging.getLogger(__name__))
+    first = _handler(client, _login_state("gw1", "new"))
+    second = _handler(client, _login_state("gw2", "old"))
+
+    assert first._restore_login_state()
+    assert client.login_generation == 1
+    assert first._account_generation == 1
+    assert first._plant_id == "gw1"
+
+    # Session is logged in already, cookies of the other handler are not imported
+    assert not second._restore_login_state()
+    assert not second._login
+    assert [cookie["value"] for cookie in client.export_cookies()] == ["new"]
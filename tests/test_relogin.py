@@ -0,0 +1,147 @@
+"""Tests of renewal of expired sessions by the API clients."""
+import asyncio
+import logging
+import threading
+
+import pytest
+
+from custom_components.ariston.api_client import AristonApiClient, AristonAuthError, AsyncAristonApiClient
+
+class FakeServer:
+    """Server rejecting requests of expired session, login renews the session unless rejections are forced."""
+
+    def __init__(self, always_reject=False):
+        self.always_reject = always_reject
+        self.logged_in = False
+        self.logins = 0
+        self.requests = 0
+
+    def reply(self, method, url):
+        if url.endswith("/R2/Account/Login"):
+            self.logins += 1
+            self.logged_in = True
+            return 200, b"{}"
+        self.requests += 1
+        if self.always_reject or not self.logged_in:
+            return 401, b""
+        return 200, b'[{"gwId": "gw1"}]'
+
+
+class FakeResponse:
+    def __init__(self, status, content, url):
+        self.status_code = self.status = status
+        self.content = content
+        self.ok = status < 400
+        self.history = ()
+        self.url = url
+        self.text = content.decode()
+
+    def json(self):
+        return [{"gwId": "gw1"}]
+
+    async def read(self):
+        return self.content
+
+
+class FakeSession:
+    """requests session of the server, both first requests are rejected before one of them logs in"""
+
+    def __init__(self, server, barrier=None):
+        self.server = server
+        self.barrier = barrier
+
+    def get(self, url, **kwargs):
+        if self.barrier is not None and not self.server.logged_in and self.server.requests < 2:
+            status, content = self.server.reply("GET", url)
+            self.barrier.wait(timeout=5)
+            return FakeResponse(status, content, url)
+        return FakeResponse(*self.server.reply("GET", url), url)
+
+    def post(self, url, **kwargs):
+        return FakeResponse(*self.server.reply("POST", url), url)
+
+
+class FakeAsyncSession:
+    """aiohttp session of the server, answers come after other requests had a chance to start"""
+
+    closed = False
+
+    def __init__(self, server):
+        self.server = server
+
+    def request(self, method, url, **kwargs):
+        session = self
+
+        class Context:
+            async def __aenter__(self):
+                status, content = session.server.reply(method, url)
+                await asyncio.sleep(0)
+                return FakeResponse(status, content, url)
+
+            async def __aexit__(self, *args):
+                return False
+
+        return Context()
+
+
+def _client(server, barrier=None):
+    client = AristonApiClient(logging.getLogger(__name__))
+    client._session = FakeSession(server, barrier)
+    client.set_credentials("user", "password")
+    return client
+
+
+def _async_client(server):
+    client = AsyncAristonApiClient(logging.getLogger(__name__), session=FakeAsyncSession(server))
+    client.set_credentials("user", "password")
+    return client
+
+
+def test_concurrent_rejections_login_once():
+    server = FakeServer()
+    client = _client(server, threading.Barrier(2))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.get_gateways())) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [["gw1"], ["gw1"]]
+    assert server.logins == 1
+    # Each rejected request is repeated once
+    assert server.requests == 4
+    assert client.login_generation == 1
+
+
+def test_rejection_after_login_is_raised():
+    server = FakeServer(always_reject=True)
+    client = _client(server)
+    with pytest.raises(AristonAuthError):
+        client.get_gateways()
+    assert (server.logins, server.requests) == (1, 2)
+
+
+def test_rejection_without_credentials_is_raised():
+    server = FakeServer()
+    client = _client(server)
+    client._credentials = None
+    with pytest.raises(AristonAuthError):
+        client.get_gateways()
+    assert (server.logins, server.requests) == (0, 1)
+
+
+async def test_concurrent_rejections_login_once_on_event_loop():
+    server = FakeServer()
+    client = _async_client(server)
+    assert await asyncio.gather(client.get_gateways(), client.get_gateways()) == [["gw1"], ["gw1"]]
+    assert server.logins == 1
+    assert server.requests == 4
+    assert client.login_generation == 1
+
+
+async def test_rejection_after_login_is_raised_on_event_loop():
+    server = FakeServer(always_reject=True)
+    client = _async_client(server)
+    with pytest.raises(AristonAuthError):
+        await client.get_gateways()
+    assert (server.logins, server.requests) == (1, 2)
@@ -0,0 +1,111 @@
+"""Tests of repair of heat pump energy statistics."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    async_import_statistics,
+    statistics_during_period,
+)
+from homeassistant.exceptions import HomeAssistantError
+from pytest_homeassistant_custom_component.components.recorder.common import async_wait_recording_done
+
+from custom_components.ariston.stats import (
+    async_repair_statistics,
+    recomputed_rows,
+    repaired_rows,
+    slot_hour_states,
+)
+
+DAY = datetime(2026, 4, 15, tzinfo=timezone.utc)
+DAY_TS = DAY.timestamp()
+HOUR = 3600
+
+
+def test_recomputed_rows_from_first_record():
+    rows = [
+        (DAY_TS, 1.0, 11.0),
+        (DAY_TS + HOUR, 1.0, 12.0),
+        (DAY_TS + 3 * HOUR, 1.0, 13.0),
+        (DAY_TS + 4 * HOUR, 1.0, 14.0),
+    ]
+    changed = recomputed_rows(rows, {DAY_TS + 2 * HOUR: 0.5}, 12.0)
+    assert changed == [
+        (DAY_TS + 2 * HOUR, 0.5, 12.5),
+        (DAY_TS + 3 * HOUR, 1.0, 13.5),
+        (DAY_TS + 4 * HOUR, 1.0, 14.5),
+    ]
+
+
+def test_recomputed_rows_keeps_rows_with_matching_sums():
+    rows = [(DAY_TS, 1.0, 11.0), (DAY_TS + HOUR, 1.0, 12.0)]
+    assert recomputed_rows(rows, {DAY_TS: 1.0}, 10.0) == [(DAY_TS, 1.0, 11.0)]
+
+
+def test_slot_hour_states_split_and_verbatim():
+    slots = {DAY: 0.5, DAY + timedelta(hours=2): 0.3}
+    assert slot_hour_states(slots) == {
+        DAY_TS: 0.25, DAY_TS + HOUR: 0.25, DAY_TS + 2 * HOUR: 0.15, DAY_TS + 3 * HOUR: 0.15}
+    assert slot_hour_states(slots, split=False) == {
+        DAY_TS: 0.5, DAY_TS + HOUR: 0.0, DAY_TS + 2 * HOUR: 0.3, DAY_TS + 3 * HOUR: 0.0}
+
+
+def test_repaired_rows_returns_corrected_range_and_sum_difference():
+    rows = [
+        (DAY_TS, 1.0, 11.0),
+        (DAY_TS + HOUR, 1.0, 12.0),
+        (DAY_TS + 3 * HOUR, 1.0, 13.0),
+    ]
+    changed, delta = repaired_rows(rows, {DAY_TS + HOUR: 0.25, DAY_TS + 2 * HOUR: 0.25}, 11.0)
+    assert changed == [(DAY_TS + HOUR, 0.25, 11.25), (DAY_TS + 2 * HOUR, 0.25, 11.5)]
+    assert delta == -0.5
+
+
+def test_repaired_rows_without_change():
+    rows = [(DAY_TS, 1.0, 11.0)]
+    assert repaired_rows(rows, {DAY_TS: 1.0}, 10.0) == ([], 0.0)
+
+
+async def _async_sums(hass, statistic_id):
+    stats = await get_instance(hass).async_add_executor_job(
+        statistics_during_period, hass, DAY - timedelta(days=1), None, {statistic_id}, "hour", None, {"state", "sum"})
+    return [(row["start"], row["state"], row["sum"]) for row in stats[statistic_id]]
+
+
+@pytest.mark.parametrize(("statistic_id", "source", "import_statistics"), [
+    ("sensor.ariston_hp_ch_consumed_energy_lifetime", "recorder", async_import_statistics),
+    ("ariston:hp_ch_consumed_energy", "ariston", async_add_external_statistics),
+])
+async def test_repair_statistics_rewrites_slot_and_later_sums(
+        recorder_mock, hass, statistic_id, source, import_statistics):
+    metadata = StatisticMetaData(
+        has_mean=False,
+        has_sum=True,
+        name=None,
+        source=source,
+        statistic_id=statistic_id,
+        unit_of_measurement="kWh",
+    )
+    import_statistics(hass, metadata, [
+        StatisticData(start=DAY + timedelta(hours=hour), state=1.0, sum=10.0 + hour + 1) for hour in range(6)
+    ])
+    await async_wait_recording_done(hass)
+
+    changed = await async_repair_statistics(hass, statistic_id, slot_hour_states({DAY + timedelta(hours=2): 0.5}))
+
+    assert changed == 2
+    assert await _async_sums(hass, statistic_id) == [
+        (DAY_TS, 1.0, 11.0),
+        (DAY_TS + HOUR, 1.0, 12.0),
+        (DAY_TS + 2 * HOUR, 0.25, 12.25),
+        (DAY_TS + 3 * HOUR, 0.25, 12.5),
+        (DAY_TS + 4 * HOUR, 1.0, 13.5),
+        (DAY_TS + 5 * HOUR, 1.0, 14.5),
+    ]
+
+
+async def test_repair_statistics_rejects_unknown_statistic(recorder_mock, hass):
+    with pytest.raises(HomeAssistantError):
+        await async_repair_statistics(hass, "sensor.unknown", {DAY_TS: 0.0})
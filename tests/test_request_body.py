@@ -0,0 +1,24 @@
+"""Tests of encoded bodies of read requests."""
+import json
+
+from custom_components.ariston.ariston import AristonHandler
+
+MAIN = AristonHandler._REQUEST_MAIN
+
+
+def _features(*zones):
+    return {"zones": [{"num": zone} for zone in zones]}
+
+
+def test_body_is_built_again_after_login():
+    handler = AristonHandler("user", "password", sensors=list(AristonHandler._SENSOR_LIST))
+    handler._store_login_data("gw1", _features(1))
+    body = handler._request_body(MAIN)
+    assert handler._request_body(MAIN) is body
+    assert json.loads(body)["features"] == _features(1)
+
+    # Features of the new login are sent
+    handler._store_login_data("gw1", _features(1, 2))
+    body = handler._request_body(MAIN)
+    assert json.loads(body)["features"] == _features(1, 2)
+    assert {item["zn"] for item in json.loads(body)["items"]} == {0, 1, 2}
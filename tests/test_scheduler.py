@@ -0,0 +1,43 @@
+"""Tests of deadline based request scheduling of the Ariston handler."""
+from custom_components.ariston.ariston import AristonHandler
+
+
+def _handler():
+    handler = AristonHandler("user", "password", sensors=list(AristonHandler._SENSOR_LIST))
+    handler._requests_due = {}
+    handler._requests_heap = []
+    return handler
+
+
+def test_requests_are_sent_by_due_time_and_priority():
+    handler = _handler()
+    handler._schedule_request(handler._REQUEST_CH_SCHEDULE, 5)
+    handler._schedule_request(handler._REQUEST_ERRORS, 10)
+    handler._schedule_request(handler._REQUEST_ADDITIONAL, 10)
+    handler._schedule_request(handler._REQUEST_MAIN, 20)
+    assert handler._pop_due_request(4) is None
+    # Due requests go by priority, not by due time
+    assert handler._pop_due_request(10) == handler._REQUEST_ADDITIONAL
+    assert handler._pop_due_request(10) == handler._REQUEST_ERRORS
+    assert handler._pop_due_request(10) == handler._REQUEST_CH_SCHEDULE
+    assert handler._pop_due_request(10) is None
+    assert handler._pop_due_request(20) == handler._REQUEST_MAIN
+
+
+def test_rescheduled_request_skips_outdated_entry():
+    handler = _handler()
+    handler._schedule_request(handler._REQUEST_ADDITIONAL, 10)
+    handler._schedule_request(handler._REQUEST_ERRORS, 12)
+    handler._schedule_request(handler._REQUEST_ADDITIONAL, 30)
+    assert handler._next_due_in(0) == 12
+    assert handler._pop_due_request(15) == handler._REQUEST_ERRORS
+    assert handler._pop_due_request(15) is None
+    assert handler._pop_due_request(30) == handler._REQUEST_ADDITIONAL
+
+
+def test_next_request_is_spaced():
+    handler = _handler()
+    handler._schedule_request(handler._REQUEST_MAIN, 1)
+    assert handler._next_due_in(0) == handler._REQUESTS_SPACING_SECONDS
+    handler._pop_due_request(1)
+    assert handler._next_due_in(1) == handler._get_period_time
@@ -0,0 +1,34 @@
+"""Tests of Ariston sensor entities."""
+from datetime import date
+from types import SimpleNamespace
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.ariston.const import (
+    PARAM_HP_TOTAL_CONSUMED_LAST_MONTH,
+    PARAM_HP_TOTAL_PRODUCED_THIS_WEEK,
+    PARAM_HP_TOTAL_PRODUCED_THIS_YEAR,
+    PARAM_HP_TOTAL_PRODUCED_TODAY,
+)
+from custom_components.ariston.sensor import AristonSensor
+
+
+def _sensor(sensor_type, hp_energy_date):
+    api = SimpleNamespace(ariston_api=SimpleNamespace(hp_energy_date=hp_energy_date), coordinator=None)
+    return AristonSensor("Ariston", SimpleNamespace(api=api), sensor_type)
+
+
+def test_last_reset_follows_date_of_read_data():
+    # Data read on Sunday is of the week started on Monday, whatever the date is now
+    read_date = date(2026, 3, 1)
+    assert _sensor(PARAM_HP_TOTAL_PRODUCED_THIS_WEEK, read_date).last_reset == \
+        dt_util.start_of_local_day(date(2026, 2, 23))
+    assert _sensor(PARAM_HP_TOTAL_CONSUMED_LAST_MONTH, read_date).last_reset == \
+        dt_util.start_of_local_day(date(2026, 2, 1))
+    assert _sensor(PARAM_HP_TOTAL_PRODUCED_THIS_YEAR, read_date).last_reset == \
+        dt_util.start_of_local_day(date(2026, 1, 1))
+
+
+def test_last_reset_without_read_data_or_period():
+    assert _sensor(PARAM_HP_TOTAL_PRODUCED_THIS_WEEK, None).last_reset is None
+    assert _sensor(PARAM_HP_TOTAL_PRODUCED_TODAY, date(2026, 3, 1)).last_reset is None
@@ -0,0 +1,61 @@
+"""Tests of planning API calls to set parameters."""
+from custom_components.ariston.ariston import AristonHandler
+
+COMFORT = AristonHandler._PARAM_CH_COMFORT_TEMPERATURE
+ECONOMY = AristonHandler._PARAM_CH_ECONOMY_TEMPERATURE
+INTERNET_TIME = AristonHandler._PARAM_INTERNET_TIME
+INTERNET_WEATHER = AristonHandler._PARAM_INTERNET_WEATHER
+
+
+def _handler(values):
+    """Handler with confirmed values of sensors"""
+    handler = AristonHandler("user", "password", sensors=list(AristonHandler._SENSOR_LIST))
+    handler._plant_id = "gw1"
+    for sensor, value in values.items():
+        handler._reset_sensor(sensor)
+        handler._ariston_sensors[sensor][handler._VALUE] = value
+        handler._written_values[sensor] = value
+    return handler
+
+
+def _set(handler, **values):
+    for sensor, value in values.items():
+        handler._set_param[sensor] = {handler._VALUE: value, handler._SET_VALUE: value, handler._ATTEMPT: 0}
+        handler._ariston_sensors[sensor][handler._VALUE] = value
+
+
+def test_zone_temperatures_are_set_by_one_call_per_zone():
+    comfort_1, economy_1 = f"{COMFORT}_zone1", f"{ECONOMY}_zone1"
+    comfort_2, economy_2 = f"{COMFORT}_zone2", f"{ECONOMY}_zone2"
+    handler = _handler({comfort_1: 20, economy_1: 18, comfort_2: 19, economy_2: 15})
+    _set(handler, **{comfort_1: 21, economy_1: 17, economy_2: 16})
+
+    calls = handler._plan_set_calls()
+    assert [(call[1], call[2], call[3]) for call in calls] == [
+        (handler._api_client.set_zone_temperatures, ("gw1", 1),
+         {"new_payload": {"comf": 21, "econ": 17}, "old_payload": {"comf": 20, "econ": 18}}),
+        (handler._api_client.set_zone_temperatures, ("gw1", 2),
+         {"new_payload": {"comf": 19, "econ": 16}, "old_payload": {"comf": 19, "econ": 15}}),
+    ]
+    # Temperature sent along is written as well
+    assert {sensor: planned[handler._VALUE] for sensor, planned in calls[1][0].items()} == \
+        {economy_2: 16, comfort_2: 19}
+
+
+def test_web_parameters_are_submitted_together():
+    handler = _handler({INTERNET_TIME: "Off", INTERNET_WEATHER: "Off"})
+    for sensor in (INTERNET_TIME, INTERNET_WEATHER):
+        handler._ariston_sensors[sensor][handler._OPTIONS] = [0, 1]
+        handler._ariston_sensors[sensor][handler._OPTIONS_TXT] = ["Off", "On"]
+        handler._set_param[sensor] = {handler._VALUE: "On", handler._SET_VALUE: 1, handler._ATTEMPT: 0}
+
+    calls = handler._plan_set_calls()
+    assert len(calls) == 1
+    parameters, api_call, args, _ = calls[0]
+    assert list(parameters) == [INTERNET_TIME, INTERNET_WEATHER]
+    assert api_call == handler._api_client.submit_additional_params
+    assert args == ("gw1", [
+        {"id": handler._MAP_ARISTON_WEB_MENU_PARAMS[INTERNET_TIME], "value": 1, "prevValue": 0},
+        {"id": handler._MAP_ARISTON_WEB_MENU_PARAMS[INTERNET_WEATHER], "value": 1, "prevValue": 0},
+    ])
+    assert all(handler._set_param[sensor][handler._ATTEMPT] == 1 for sensor in parameters)
@@ -0,0 +1,58 @@
+"""Tests of the read-only sensor snapshot of the Ariston handler."""
+import pytest
+
+from custom_components.ariston.ariston import AristonHandler
+
+DHW_TEMP = AristonHandler._PARAM_DHW_SET_TEMPERATURE
+
+
+def _handler():
+    return AristonHandler("user", "password", sensors=list(AristonHandler._SENSOR_LIST))
+
+
+def test_generation_increases_only_on_changed_value():
+    handler = _handler()
+    generation, snapshot = handler.sensor_snapshot
+    assert handler._publish_sensor_values() == {}
+    assert handler.sensor_snapshot == (generation, snapshot)
+
+    handler._ariston_sensors[DHW_TEMP][handler._VALUE] = 50
+    changed = handler._publish_sensor_values()
+    assert changed == {DHW_TEMP: {handler._VALUE: 50}}
+    assert handler.sensor_values_generation == generation + 1
+    assert handler.sensor_values[DHW_TEMP][handler._VALUE] == 50
+
+    # Same value written again is not a change
+    handler._ariston_sensors[DHW_TEMP][handler._VALUE] = 50
+    assert handler._publish_sensor_values([DHW_TEMP]) == {}
+    assert handler.sensor_values_generation == generation + 1
+
+
+def test_only_changed_records_are_copied():
+    handler = _handler()
+    old_snapshot = handler.sensor_values
+    handler._ariston_sensors[DHW_TEMP][handler._VALUE] = 50
+    handler._publish_sensor_values()
+    snapshot = handler.sensor_values
+    assert snapshot is not old_snapshot
+    assert snapshot[DHW_TEMP] is not old_snapshot[DHW_TEMP]
+    assert old_snapshot[DHW_TEMP][handler._VALUE] is None
+    unchanged = [sensor for sensor in snapshot if sensor != DHW_TEMP]
+    assert unchanged
+    assert all(snapshot[sensor] is old_snapshot[sensor] for sensor in unchanged)
+
+
+def test_snapshot_cannot_be_modified():
+    handler = _handler()
+    handler._ariston_sensors[DHW_TEMP][handler._ATTRIBUTES] = {"zone": 1}
+    handler._publish_sensor_values()
+    snapshot = handler.sensor_values
+    with pytest.raises(TypeError):
+        snapshot[DHW_TEMP] = {}
+    with pytest.raises(TypeError):
+        snapshot[DHW_TEMP][handler._VALUE] = 50
+    with pytest.raises(TypeError):
+        snapshot[DHW_TEMP][handler._ATTRIBUTES]["zone"] = 2
+    # Handler's own data is not shared with the snapshot
+    handler._ariston_sensors[DHW_TEMP][handler._ATTRIBUTES]["zone"] = 2
+    assert snapshot[DHW_TEMP][handler._ATTRIBUTES] == {"zone": 1}
@@ -0,0 +1,91 @@
+"""Tests of latency based timeouts of the API client."""
+import asyncio
+import logging
+
+import aiohttp
+import pytest
+import requests
+
+from custom_components.ariston.api_client import (
+    AristonApiClient,
+    AristonTransportError,
+    AsyncAristonApiClient,
+    LatencyHistogram,
+)
+
+
+class TimeoutSession:
+    """Session of the API clients raising given timeout"""
+
+    closed = False
+
+    def __init__(self, ex):
+        self.ex = ex
+
+    def get(self, url, **kwargs):
+        raise self.ex
+
+    def request(self, method, url, **kwargs):
+        raise self.ex
+
+
+def test_histogram_percentile_uses_bucket_upper_bound():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    for _ in range(9):
+        histogram.add(0.2)
+    histogram.add(4)
+    assert histogram.percentile(50) == 0.25
+    assert histogram.percentile(99) == 5
+
+
+def test_histogram_drops_oldest_samples():
+    histogram = LatencyHistogram()
+    for _ in range(LatencyHistogram.WINDOW):
+        histogram.add(10)
+    for _ in range(LatencyHistogram.WINDOW):
+        histogram.add(0.05)
+    assert len(histogram) == LatencyHistogram.WINDOW
+    assert histogram.percentile(99) == 0.1
+
+
+def test_timeouts_fall_back_to_call_site_timeout():
+    client = AristonApiClient(logging.getLogger(__name__))
+    assert client._timeouts("main", 15) == (client._TIMEOUT_CONNECT, 15)
+    for _ in range(client._TIMEOUT_MIN_SAMPLES - 1):
+        client._record_latency("main", 2)
+    assert client._timeouts("main", 15) == (client._TIMEOUT_CONNECT, 15)
+
+
+def test_timeouts_follow_latency_within_bounds():
+    client = AristonApiClient(logging.getLogger(__name__))
+    for endpoint, seconds in (("fast", 0.05), ("medium", 1.5), ("slow", 45)):
+        for _ in range(client._TIMEOUT_MIN_SAMPLES):
+            client._record_latency(endpoint, seconds)
+    assert client._timeouts("fast", 15) == (client._TIMEOUT_CONNECT, client._TIMEOUT_LOWER)
+    assert client._timeouts("medium", 15) == (client._TIMEOUT_CONNECT, 2 * client._TIMEOUT_FACTOR)
+    assert client._timeouts("slow", 15) == (client._TIMEOUT_CONNECT, client._TIMEOUT_UPPER)
+
+
+@pytest.mark.parametrize("ex, recorded", [
+    (requests.exceptions.ConnectTimeout("connect"), False),
+    (requests.exceptions.ReadTimeout("read"), True),
+])
+def test_only_read_timeouts_are_recorded(ex, recorded):
+    client = AristonApiClient(logging.getLogger(__name__))
+    client._session = TimeoutSession(ex)
+    with pytest.raises(AristonTransportError):
+        client.request_get("url", error_msg="main")
+    assert ("main" in client._latencies) == recorded
+
+
+@pytest.mark.parametrize("ex, recorded", [
+    (aiohttp.ServerTimeoutError("Connection timeout to host url"), False),
+    (aiohttp.ServerTimeoutError("Timeout on reading data from socket"), True),
+    (asyncio.TimeoutError(), True),
+])
+async def test_only_read_timeouts_are_recorded_on_event_loop(ex, recorded):
+    client = AsyncAristonApiClient(logging.getLogger(__name__), session=TimeoutSession(ex))
+    with pytest.raises(AristonTransportError):
+        await client.request_get("url", error_msg="main")
+    assert ("main" in client._latencies) == recorded